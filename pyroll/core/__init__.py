@@ -29,7 +29,20 @@ from .grooves import (
 from .transport import Transport, CoolingPipe
 from .roll_pass import BaseRollPass, DeformationUnit, ThreeRollPass, SymmetricRollPass, TwoRollPass
 from .roll_pass import TwoRollPass as RollPass
-from .unit import Unit
+from .unit import (
+    Unit,
+    UnitSnapshot,
+    UnitRecord,
+    ConvergenceHistory,
+    SolutionStatus,
+    SolutionDivergedError,
+    SolveProfiler,
+    SolveProfileNode,
+    IterationAccelerator,
+    UnderRelaxation,
+    AitkenAcceleration,
+    AndersonAcceleration,
+)
 from .roll import Roll
 from .engine import Engine
 from .profile import (
@@ -40,8 +53,18 @@ from .profile import (
     SquareProfile,
 )
 from .rotator import Rotator
-from .sequence import PassSequence
-from .hooks import Hook, HookHost, HookFunction, root_hooks
+from .sequence import (
+    PassSequence,
+    BatchResult,
+    Sweep,
+    SweepAxis,
+    SweepResult,
+    MillSolver,
+    MillUnknown,
+    ParallelSequence,
+    SolvePlan,
+)
+from .hooks import Hook, HookHost, HookFunction, HookScope, HookProfiler, HookTracer, root_hooks
 from .disk_elements import DiskElementUnit
 from .config import Config, config, PlottingBackend, ConfigValue, ConfigMeta
 
@@ -81,6 +104,17 @@ __all__ = [
     "SquareProfile",
     # unit
     "Unit",
+    "UnitSnapshot",
+    "UnitRecord",
+    "ConvergenceHistory",
+    "SolutionStatus",
+    "SolutionDivergedError",
+    "SolveProfiler",
+    "SolveProfileNode",
+    "IterationAccelerator",
+    "UnderRelaxation",
+    "AitkenAcceleration",
+    "AndersonAcceleration",
     # transport
     "Transport",
     "CoolingPipe",
@@ -96,6 +130,14 @@ __all__ = [
     "Engine",
     # sequence
     "PassSequence",
+    "BatchResult",
+    "Sweep",
+    "SweepAxis",
+    "SweepResult",
+    "MillSolver",
+    "MillUnknown",
+    "ParallelSequence",
+    "SolvePlan",
     # rotator
     "Rotator",
     # disk_elements
@@ -104,6 +146,9 @@ __all__ = [
     "HookFunction",
     "HookHost",
     "Hook",
+    "HookScope",
+    "HookProfiler",
+    "HookTracer",
     "root_hooks",
     # config
     "Config",
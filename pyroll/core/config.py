@@ -174,6 +174,30 @@ class Config:
     DEFAULT_ITERATION_PRECISION = 1e-3
     """Default precision of iteration loops required to break successfully."""
 
+    DEFAULT_ITERATION_ACCELERATION = "none"
+    """Default strategy to accelerate solution loops, one of ``"none"``, ``"relaxation"``, ``"aitken"``
+    and ``"anderson"``."""
+
+    DEFAULT_DIVERGENCE_POLICY = "ignore"
+    """Default policy for diverging or stagnating solution loops, one of ``"ignore"``, ``"abort"``, ``"damp"``
+    and ``"mark"``."""
+
+    CONVERGENCE_HISTORY_SIZE = 0
+    """Count of iterations kept in the convergence history of each unit, 0 disables recording the residua."""
+
+    WARM_START = False
+    """Whether units seed their solution loops with their last converged solution by default."""
+
+    PARTIAL_SEQUENCE_SOLVE = False
+    """Whether pass sequences reuse the last solutions of unmodified leading units by default."""
+
+    HOOK_DEPENDENCY_TRACKING = False
+    """Whether to record dependencies between hooks during unit solution and reevaluate only outdated cached values
+    in iterations. Hook functions relying on state not accessed through hooks may not be reevaluated properly."""
+
+    DEFAULT_BRANCH_EXECUTOR = "serial"
+    """Default executor for the branches of parallel sequences, one of ``"serial"``, ``"thread"`` and ``"process"``."""
+
     ROLL_SURFACE_DISCRETIZATION_COUNT = 100
     """Count of discrete points used to describe the roll surface."""
 
@@ -1,9 +1,28 @@
 import copy
 import inspect
+import json
+import threading
 import weakref
 from abc import ABCMeta
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import partial
-from typing import overload, TypeVar, Generic, List, Generator, Union, Optional, Any, get_args
+from time import perf_counter
+from typing import (
+    overload,
+    TypeVar,
+    Generic,
+    List,
+    Generator,
+    Union,
+    Optional,
+    Any,
+    Tuple,
+    Dict,
+    Iterable,
+    Callable,
+    get_args,
+)
 
 import numpy as np
 
@@ -12,7 +31,188 @@ from .repr import ReprMixin
 
 T = TypeVar("T")
 
-__all__ = ["HookFunction", "HookHost", "Hook", "root_hooks"]
+__all__ = [
+    "HookFunction",
+    "HookHost",
+    "Hook",
+    "HookScope",
+    "HookProfiler",
+    "HookTracer",
+    "root_hooks",
+    "track_dependencies",
+]
+
+_registry_version = 0
+"""Counter incremented on every change of the hook function registry, used to detect outdated compilations."""
+
+_hook_versions: Dict[str, int] = {}
+"""Counters per hook name incremented on every change of the functions of equally named hooks,
+used to invalidate the dispatch tables of the affected hooks only."""
+
+
+_FUNCTION_STORES = (
+    "_first_wrappers",
+    "_wrappers",
+    "_last_wrappers",
+    "_first_functions",
+    "_functions",
+    "_last_functions",
+)
+"""Names of the function store attributes of hooks in the order of calling."""
+
+
+_availability_version = 0
+"""Counter incremented whenever any hook value may have become available, used to invalidate all negative results."""
+
+_cycle_events = 0
+"""Counter incremented whenever a hook function is called in a cycle, negative results depending on cycles are not
+cached."""
+
+
+def _invalidate_dispatch_tables(name: str):
+    """Mark the compiled dispatch tables of all hooks with the given name as outdated."""
+    global _registry_version
+    _registry_version += 1
+    _hook_versions[name] = _hook_versions.get(name, 0) + 1
+    _invalidate_negative_results()
+
+
+def _registry_state() -> Tuple[int, int]:
+    """Versions of the hook function registry and the root hooks list, both affect the results of solutions."""
+    return _registry_version, root_hooks._version
+
+
+def _invalidate_negative_results():
+    """Mark all cached negative results (known unavailable hooks) as outdated."""
+    global _availability_version
+    _availability_version += 1
+
+
+_missing_values: ContextVar[Optional[list]] = ContextVar("pyroll_core_hook_missing_values", default=None)
+"""List of (host, hook name) pairs found unavailable while evaluating hooks in the current context,
+``None`` if no hook is evaluated."""
+
+
+def _record_missing(host: "HookHost", name: str):
+    """Record that hook ``name`` of ``host`` was found unavailable by the hook function currently called."""
+    missing = _missing_values.get()
+    if missing is not None:
+        missing.append((host, name))
+
+
+def _remember_unavailable(host: "HookHost", name: str, missing: Iterable[Tuple["HookHost", str]]):
+    """
+    Remember hook ``name`` of ``host`` as unavailable until one of the ``missing`` hooks,
+    which were found unavailable during its evaluation, becomes available.
+    """
+    host.__unavailable__[name] = _availability_version
+    ref = weakref.ref(host)
+    for h, n in missing:
+        h.__dict__.setdefault("__unavailable_dependents__", {}).setdefault(n, set()).add((ref, name))
+
+
+def _became_available(host: "HookHost", name: str):
+    """Transitively forget the hooks known unavailable because hook ``name`` of ``host`` was unavailable."""
+    pending = [(host, name)]
+    while pending:
+        h, n = pending.pop()
+        dependents = h.__dict__.get("__unavailable_dependents__", None)
+        if not dependents:
+            continue
+
+        for ref, dep_name in dependents.pop(n, ()):
+            dep = ref()
+            if dep is not None and dep.__unavailable__.pop(dep_name, None) is not None:
+                pending.append((dep, dep_name))
+
+
+_takes_instance_cache: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+
+def _takes_instance(func) -> bool:
+    """
+    Whether an explicitly set callable hook value expects the host instance as argument.
+    The signature analysis is done once per callable and cached.
+    """
+    try:
+        return _takes_instance_cache[func]
+    except KeyError:
+        result = len(inspect.signature(func).parameters) != 0
+        _takes_instance_cache[func] = result
+        return result
+    except TypeError:  # not weak referenceable
+        return len(inspect.signature(func).parameters) != 0
+
+
+_evaluation_stack: ContextVar[Optional[list]] = ContextVar("pyroll_core_hook_evaluation_stack", default=None)
+"""Stack of (host reference, hook name) frames currently evaluated, ``None`` if dependency tracking is disabled."""
+
+
+@contextmanager
+def track_dependencies():
+    """
+    Context manager enabling the recording of dependencies between hooks in the current context.
+
+    While active, each hook value computed from hook functions records which hooks (on which hosts) were read during
+    its computation. Changes of explicitly set values or reevaluated cached values then mark only their dependents
+    as outdated, so that :py:meth:`HookHost.reevaluate_cache` reevaluates only those.
+    Nested usage has no additional effect.
+    """
+    if _evaluation_stack.get() is not None:
+        yield
+        return
+
+    token = _evaluation_stack.set([])
+    try:
+        yield
+    finally:
+        _evaluation_stack.reset(token)
+
+
+def _values_equal(a, b) -> bool:
+    """Check two hook values for equality, treating incomparable values as different."""
+    if a is b:
+        return True
+    try:
+        return bool(np.all(a == b))
+    except (TypeError, ValueError):
+        return False
+
+
+def _outdate_dependents(host: "HookHost", name: str):
+    """Transitively mark all hooks depending on hook ``name`` of ``host`` as outdated."""
+    dependents = host.__dict__.get("__dependents__", None)
+    if not dependents:
+        return
+
+    pending = list(dependents.pop(name, ()))
+    while pending:
+        ref, dep_name = pending.pop()
+        dep = ref()
+        if dep is None:
+            continue
+
+        outdated = dep.__dict__.get("__outdated__", None)
+        if outdated is not None:
+            outdated.add(dep_name)
+
+        pending.extend(dep.__dependents__.pop(dep_name, ()))
+
+
+_active_calls: ContextVar[Optional[set]] = ContextVar("pyroll_core_hook_active_calls", default=None)
+"""Set of (hook function, host id) pairs currently called in the current context, used for cycle detection."""
+
+
+def _fork_evaluation_state():
+    """
+    Start fresh cycle detection and dependency tracking state in a context copied for another thread.
+    Otherwise, the mutable state objects would be shared with the context copied from.
+    To be called first within ``Context.run``.
+    """
+    _active_calls.set(None)
+    _missing_values.set(None)
+    if _evaluation_stack.get() is not None:
+        _evaluation_stack.set([])
 
 
 class HookFunction:
@@ -22,12 +222,14 @@ class HookFunction:
     You should not instantiate it yourself.
     """
 
-    def __init__(self, func, hook, tryfirst=False, trylast=False, wrapper=False):
+    def __init__(self, func, hook, tryfirst=False, trylast=False, wrapper=False, classifiers=None):
         """
         :param func: the function
         :param hook: the associated hook
         :param tryfirst: whether to use this function with the highest priority
         :param trylast: whether to use this function with the lowest priority
+        :param wrapper: whether the function is a wrapper
+        :param classifiers: classifiers that all must be present on the host instance to call this function
         """
         self.function = func
         """The underlying function."""
@@ -44,12 +246,18 @@ class HookFunction:
         self.hook = hook
         """The hook the function is defined for."""
 
-        self.cycle = False
-        """Cycle detection."""
-
         self.wrapper = wrapper
         """Whether the hook function is a wrapper."""
 
+        self.accepts_cycle = "cycle" in inspect.signature(func).parameters
+        """Whether the function accepts the ``cycle`` keyword argument (determined once at registration)."""
+
+        self.classifiers: Optional[frozenset] = frozenset(classifiers) if classifiers else None
+        """
+        Classifiers that all must be present in the ``classifiers`` of the host instance to call this function.
+        ``None`` if the function shall be called regardless of classifiers.
+        """
+
         self._tryfirst = tryfirst
         self._trylast = trylast
 
@@ -66,20 +274,38 @@ class HookFunction:
     def __call__(self, instance):
         """Call the function as it were a method the provided instance."""
 
-        extra_args = self._determine_extra_args()
-        self.cycle = True
+        profiler = _active_profiler.get()
+        if profiler is not None:
+            return profiler._profile_call(self, instance)
+        return self._call(instance)
+
+    def _call(self, instance):
+        active_calls = _active_calls.get()
+        if active_calls is None:
+            active_calls = set()
+            _active_calls.set(active_calls)
+
+        key = (self, id(instance))
+        cycle = key in active_calls
+        if cycle:
+            global _cycle_events
+            _cycle_events += 1
+        active_calls.add(key)
         try:
             if self.wrapper:
-                gen = self.function(instance, **extra_args)
+                gen = self.function(instance, cycle=cycle) if self.accepts_cycle else self.function(instance)
                 next(gen)
                 gen.send(self.hook.get_result(instance))
                 raise SyntaxError("Wrapper function must only contain one yield expression.")
+            elif self.accepts_cycle:
+                result = self.function(instance, cycle=cycle)
             else:
-                result = self.function(instance, **extra_args)
+                result = self.function(instance)
         except StopIteration as e:
             result = e.value
         finally:
-            self.cycle = False
+            if not cycle:
+                active_calls.discard(key)
 
         return result
 
@@ -89,14 +315,6 @@ class HookFunction:
     def __str__(self):
         return f"HookFunction {self.module}.{self.qualname}"
 
-    def _determine_extra_args(self):
-        extra_args = {}
-        pars = inspect.signature(self.function).parameters
-        if "cycle" in pars:
-            extra_args["cycle"] = self.cycle
-
-        return extra_args
-
     def __enter__(self):
         pass
 
@@ -104,6 +322,34 @@ class HookFunction:
         self.hook.remove_function(self)
 
 
+class _DispatchTable:
+    """Compiled ordered functions of a hook with an index of the functions applicable per set of classifiers."""
+
+    def __init__(self, functions: Tuple[HookFunction, ...]):
+        self.functions = functions
+        self.conditional = any(f.classifiers is not None for f in functions)
+        self._by_classifiers: Dict[Optional[frozenset], Tuple[HookFunction, ...]] = {}
+
+    def for_instance(self, instance) -> Tuple[HookFunction, ...]:
+        """Get the functions to call for the given instance, omitting those with unmet classifier preconditions."""
+        if not self.conditional:
+            return self.functions
+
+        try:
+            classifiers = frozenset(instance.classifiers)
+        except (AttributeError, TypeError):
+            classifiers = None
+
+        functions = self._by_classifiers.get(classifiers, None)
+        if functions is None:
+            functions = self._by_classifiers[classifiers] = tuple(
+                f
+                for f in self.functions
+                if f.classifiers is None or (classifiers is not None and f.classifiers <= classifiers)
+            )
+        return functions
+
+
 class Hook(Generic[T]):
     """
     Descriptor yielding the value of a hook attribute if called on instance,
@@ -117,6 +363,8 @@ class Hook(Generic[T]):
         self.owner = owner
         """The owner class of the hook instance."""
 
+        self._convergence_settings: Dict[str, Any] = {}
+
         self._first_functions: List[HookFunction] = []
 
         self._last_functions: List[HookFunction] = []
@@ -127,8 +375,70 @@ class Hook(Generic[T]):
         self._first_wrappers: List[HookFunction] = []
         self._last_wrappers: List[HookFunction] = []
 
+        self._dispatch_table = _DispatchTable(())
+        self._dispatch_table_version = -1
+
         self.__orig_class__ = None
 
+    def _convergence_setting(self, name: str, default):
+        """
+        Get a convergence setting from this hook or the nearest equally named hook in the owner's superclasses,
+        so that settings made on base class hooks apply to the hooks of subclasses as well.
+        """
+        if name in self._convergence_settings:
+            return self._convergence_settings[name]
+
+        for s in self.owner.__mro__ if self.owner is not None else ():
+            h = s.__dict__.get(self.name, None)
+            if isinstance(h, Hook) and name in h._convergence_settings:
+                return h._convergence_settings[name]
+
+        return default
+
+    @property
+    def relative_tolerance(self) -> Optional[float]:
+        """Relative tolerance of the convergence check if used as root hook,
+        ``None`` to use the ``iteration_precision`` of the solved unit.
+        Inherited from the hooks of superclasses unless set, delete to inherit again."""
+        return self._convergence_setting("relative_tolerance", None)
+
+    @relative_tolerance.setter
+    def relative_tolerance(self, value: Optional[float]):
+        self._convergence_settings["relative_tolerance"] = value
+
+    @relative_tolerance.deleter
+    def relative_tolerance(self):
+        self._convergence_settings.pop("relative_tolerance", None)
+
+    @property
+    def absolute_tolerance(self) -> float:
+        """Absolute tolerance of the convergence check if used as root hook, added to the relative one.
+        Inherited from the hooks of superclasses unless set, delete to inherit again."""
+        return self._convergence_setting("absolute_tolerance", 0.0)
+
+    @absolute_tolerance.setter
+    def absolute_tolerance(self, value: float):
+        self._convergence_settings["absolute_tolerance"] = value
+
+    @absolute_tolerance.deleter
+    def absolute_tolerance(self):
+        self._convergence_settings.pop("absolute_tolerance", None)
+
+    @property
+    def check_convergence(self) -> bool:
+        """Whether the values of this hook are considered in the convergence check if used as root hook.
+        Values of excluded hooks are still evaluated and set on each iteration.
+        Inherited from the hooks of superclasses unless set, delete to inherit again."""
+        return self._convergence_setting("check_convergence", True)
+
+    @check_convergence.setter
+    def check_convergence(self, value: bool):
+        self._convergence_settings["check_convergence"] = value
+
+    @check_convergence.deleter
+    def check_convergence(self):
+        self._convergence_settings.pop("check_convergence", None)
+
     def __set_name__(self, owner, name):
         self.name = name
         self.owner = owner
@@ -164,54 +474,82 @@ class Hook(Generic[T]):
         if instance is None:
             return self
 
-        self.owner.logger.debug("Hook %s.%s on %s: called.", self.owner.__qualname__, self.name, instance)
+        stack = _evaluation_stack.get()
+        if stack:
+            instance.__dependents__.setdefault(self.name, set()).add(stack[-1])
+
+        profiler = _active_profiler.get()
+
+        tracer = _tracer
+        if tracer is not None:
+            tracer._trace(self, instance, "called.")
 
         # try to get value explicitly set by user
         result = instance.__dict__.get(self.name, None)
         if result is not None:
+            if profiler is not None:
+                profiler._record_lookup(self, "explicit")
+
             if callable(result):
-                if len(inspect.signature(result).parameters) == 0:
-                    result = result()
-                else:
+                if _takes_instance(result):
                     result = result(instance)
+                else:
+                    result = result()
 
-                self.owner.logger.debug(
-                    "Hook %s.%s on %s: resolved with explicit function result value %s.",
-                    self.owner.__qualname__,
-                    self.name,
-                    instance,
-                    result,
-                )
+                if tracer is not None:
+                    tracer._trace(self, instance, "resolved with explicit function result value %s.", result)
                 return result
 
-            self.owner.logger.debug(
-                "Hook %s.%s on %s: resolved with explicit value %s.",
-                self.owner.__qualname__,
-                self.name,
-                instance,
-                result,
-            )
+            if tracer is not None:
+                tracer._trace(self, instance, "resolved with explicit value %s.", result)
             return result
 
         # try to get cached value
         result = instance.__cache__.get(self.name, None)
         if result is not None:
-            self.owner.logger.debug(
-                "Hook %s.%s on %s: resolved with cached value %s.", self.owner.__qualname__, self.name, instance, result
-            )
+            if profiler is not None:
+                profiler._record_lookup(self, "hits")
+
+            if tracer is not None:
+                tracer._trace(self, instance, "resolved with cached value %s.", result)
             return result
 
+        # fail fast if known to be unavailable
+        if instance.__unavailable__.get(self.name, None) == _availability_version:
+            _record_missing(instance, self.name)
+            raise AttributeError(f"Hook call for '{self.name}' on '{instance}' could not provide a value.")
+
+        cycle_events = _cycle_events
+
+        if profiler is not None:
+            profiler._record_lookup(self, "misses")
+
+        missing = _missing_values.get()
+        token = None
+        if missing is None:
+            missing = []
+            token = _missing_values.set(missing)
+        start = len(missing)
+
         # try to get value from hook caller
         try:
-            result = self.get_result(instance)
+            result = self._evaluate(instance)
         except RecursionError as e:
             raise AttributeError(
                 f"Hook call for '{self.name}' on '{instance}' resulted in a RecursionError. "
                 f"This may have one of the following reasons: missing data, interference of plugins. "
                 f"Double check if you have provided all necessary input data."
             ) from e
+        finally:
+            found_missing = missing[start:]
+            del missing[start:]
+            if token is not None:
+                _missing_values.reset(token)
 
         if result is None:
+            if cycle_events == _cycle_events:  # do not remember results influenced by cycles
+                _remember_unavailable(instance, self.name, found_missing)
+            _record_missing(instance, self.name)
             raise AttributeError(f"Hook call for '{self.name}' on '{instance}' could not provide a value.")
 
         try:
@@ -221,11 +559,25 @@ class Hook(Generic[T]):
             pass  # only numeric types can be tested for finiteness, for others it is meaningless
 
         instance.__cache__[self.name] = result
+        _became_available(instance, self.name)
+
+        if stack is not None:
+            # hooks probing for a cached value of this hook may have to reconsider
+            _outdate_dependents(instance, self.name)
 
         return result
 
     def __set__(self, instance: object, value: T) -> None:
         """Saves a value to the ``__dict__`` of the instance."""
+        old = instance.__dict__.get(self.name, None)
+        changed = not _values_equal(old, value)
+        if old is None:
+            _became_available(instance, self.name)
+        elif changed:
+            # hooks may have been unavailable because of the old value, not only because of missing ones
+            _invalidate_negative_results()
+        if _evaluation_stack.get() is not None and changed:
+            _outdate_dependents(instance, self.name)
         instance.__dict__[self.name] = value
 
     def __delete__(self, instance: object) -> None:
@@ -233,7 +585,22 @@ class Hook(Generic[T]):
         Deletes the value from the ``__dict__`` of the instance.
         Does not raise, if the value is not in the ``__dict__``.
         """
+        if _evaluation_stack.get() is not None and self.name in instance.__dict__:
+            _outdate_dependents(instance, self.name)
         instance.__dict__.pop(self.name, None)
+        _invalidate_negative_results()
+
+    def _evaluate(self, instance):
+        """Call :py:meth:`get_result` while recording the hooks read, if dependency tracking is enabled."""
+        stack = _evaluation_stack.get()
+        if stack is None:
+            return self.get_result(instance)
+
+        stack.append((weakref.ref(instance), self.name))
+        try:
+            return self.get_result(instance)
+        finally:
+            stack.pop()
 
     @property
     def type(self):
@@ -253,18 +620,30 @@ class Hook(Generic[T]):
             if funcs:
                 yield from reversed(funcs)
 
+    def _compile_dispatch_table(self) -> Tuple[HookFunction, ...]:
+        return tuple(f for attr in _FUNCTION_STORES for f in self._yield_functions_from(attr))
+
+    def _compiled_dispatch_table(self) -> _DispatchTable:
+        version = _hook_versions.get(self.name, 0)
+        if self._dispatch_table_version != version:
+            self._dispatch_table = _DispatchTable(self._compile_dispatch_table())
+            self._dispatch_table_version = version
+        return self._dispatch_table
+
+    @property
+    def dispatch_table(self) -> Tuple[HookFunction, ...]:
+        """
+        Ordered tuple of all functions to call for resolving this hook on instances of its owner.
+        Compiled once from the owner's MRO and recompiled only if the functions of equally named hooks changed.
+        """
+        return self._compiled_dispatch_table().functions
+
     @property
     def functions_gen(self) -> Generator[HookFunction, None, None]:
         """
         Generator listing functions stored in this instance and equally named instances in superclasses of its owner.
         """
-        yield from self._yield_functions_from("_first_wrappers")
-        yield from self._yield_functions_from("_wrappers")
-        yield from self._yield_functions_from("_last_wrappers")
-
-        yield from self._yield_functions_from("_first_functions")
-        yield from self._yield_functions_from("_functions")
-        yield from self._yield_functions_from("_last_functions")
+        yield from self.dispatch_table
 
     @property
     def functions(self) -> List[HookFunction]:
@@ -277,37 +656,35 @@ class Hook(Generic[T]):
         """
         Get the first not ``None`` result of the functions in ``self.functions`` or the cached value.
         """
-        for f in self.functions_gen:
+        scope = _active_scope.get()
+        table = self._compiled_dispatch_table() if scope is None else scope._compiled_dispatch_table(self)
+
+        for f in table.for_instance(instance):
             result = f(instance)
             if result is not None:
-                self.owner.logger.debug(
-                    "Hook %s.%s on %s: resolved from function %s with value %s.",
-                    self.owner.__qualname__,
-                    self.name,
-                    instance,
-                    f.qualname,
-                    result,
-                )
+                if _tracer is not None:
+                    _tracer._trace(self, instance, "resolved from function %s with value %s.", f.qualname, result)
                 return result
 
-            self.owner.logger.debug(
-                "Hook %s.%s on %s: function %s resulted in None.",
-                self.owner.__qualname__,
-                self.name,
-                instance,
-                f.qualname,
-            )
+            if _tracer is not None:
+                _tracer._trace(self, instance, "function %s resulted in None.", f.qualname)
 
-    def add_function(self, func, tryfirst=False, trylast=False, wrapper=False):
+    def add_function(self, func, tryfirst=False, trylast=False, wrapper=False, classifiers=None):
         """
         Add the given function to the internal function store.
 
+        :param classifiers: classifiers that all must be present on the host instance to call the function,
+            functions with unmet preconditions are skipped without calling them
         :return: the created HookFunction object
+        :raises ValueError: if classifier preconditions are given for the ``classifiers`` hook itself
         """
         if isinstance(func, HookFunction):
             func = func.function
 
-        hf = HookFunction(func, self, trylast=trylast, tryfirst=tryfirst, wrapper=wrapper)
+        if classifiers and self.name == "classifiers":
+            raise ValueError("Functions of the 'classifiers' hook can not have classifier preconditions.")
+
+        hf = HookFunction(func, self, trylast=trylast, tryfirst=tryfirst, wrapper=wrapper, classifiers=classifiers)
 
         if wrapper:
             if tryfirst:
@@ -324,12 +701,15 @@ class Hook(Generic[T]):
             else:
                 self._functions.append(hf)
 
+        _invalidate_dispatch_tables(self.name)
         return hf
 
-    def __call__(self, func=None, tryfirst=False, trylast=False, wrapper=False):
+    def __call__(self, func=None, tryfirst=False, trylast=False, wrapper=False, classifiers=None):
         if func is None:
-            return partial(self.add_function, tryfirst=tryfirst, trylast=trylast, wrapper=wrapper)
-        return self.add_function(func, tryfirst=tryfirst, trylast=trylast, wrapper=wrapper)
+            return partial(
+                self.add_function, tryfirst=tryfirst, trylast=trylast, wrapper=wrapper, classifiers=classifiers
+            )
+        return self.add_function(func, tryfirst=tryfirst, trylast=trylast, wrapper=wrapper, classifiers=classifiers)
 
     def remove_function(self, func: HookFunction):
         """
@@ -349,6 +729,7 @@ class Hook(Generic[T]):
                 store.remove(func)
             except ValueError:
                 continue
+        _invalidate_dispatch_tables(self.name)
         return func.function
 
     def __repr__(self):
@@ -358,6 +739,339 @@ class Hook(Generic[T]):
         return f"Hook {self.owner.__qualname__}.{self.name}"
 
 
+_active_scope: ContextVar[Optional["HookScope"]] = ContextVar("pyroll_core_hook_scope", default=None)
+
+
+class HookScope:
+    """
+    Overlay of hook functions, that is consulted additionally to the globally registered functions
+    only while the scope is active in the current context.
+    Allows to run simulations with different models or plugin sets concurrently in one process.
+    Within each category (wrappers, tryfirst, normal, trylast), functions of the scope take precedence.
+
+    Use it as follows::
+
+        scope = HookScope()
+
+        @scope(RollPass.Profile.flow_stress)
+        def flow_stress(self: RollPass.Profile):
+            ...
+
+        with scope:
+            sequence.solve(in_profile)
+
+    Hook hosts cache the values computed within a scope, so do not share host instances between scopes.
+    Only one scope is active at a time, entering another scope replaces the current one until exit.
+    """
+
+    def __init__(self):
+        self._stores: Dict[Hook, Hook] = {}
+        self._tables: Dict[Hook, Tuple[int, _DispatchTable]] = {}
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_active_scope.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active_scope.reset(self._tokens.pop())
+
+    def _store(self, hook: Hook) -> Hook:
+        store = self._stores.get(hook, None)
+        if store is None:
+            store = self._stores[hook] = Hook(hook.name, hook.owner)
+            store.__orig_class__ = hook.__orig_class__
+        return store
+
+    def add_function(
+        self, hook: Hook, func, tryfirst=False, trylast=False, wrapper=False, classifiers=None
+    ) -> HookFunction:
+        """
+        Add the given function to the function store of this scope for the given hook.
+
+        :return: the created HookFunction object
+        """
+        return self._store(hook).add_function(
+            func, tryfirst=tryfirst, trylast=trylast, wrapper=wrapper, classifiers=classifiers
+        )
+
+    def __call__(self, hook: Hook, func=None, tryfirst=False, trylast=False, wrapper=False, classifiers=None):
+        if func is None:
+            return partial(
+                self.add_function, hook, tryfirst=tryfirst, trylast=trylast, wrapper=wrapper, classifiers=classifiers
+            )
+        return self.add_function(
+            hook, func, tryfirst=tryfirst, trylast=trylast, wrapper=wrapper, classifiers=classifiers
+        )
+
+    def remove_function(self, hook: Hook, func: HookFunction):
+        """
+        Remove a function from the function store of this scope for the given hook.
+
+        :return: the underlying function object
+        """
+        return self._store(hook).remove_function(func)
+
+    def functions(self, hook: Hook) -> List[HookFunction]:
+        """List of functions called for the given hook while this scope is active."""
+        return list(self.dispatch_table(hook))
+
+    def _yield_functions_from(self, hook: Hook, attr: str):
+        for s in hook.owner.__mro__:
+            h = getattr(s, hook.name, None)
+            if isinstance(h, Hook):
+                store = self._stores.get(h, None)
+                if store is not None:
+                    yield from reversed(getattr(store, attr))
+
+        yield from hook._yield_functions_from(attr)
+
+    def _compiled_dispatch_table(self, hook: Hook) -> _DispatchTable:
+        version = _hook_versions.get(hook.name, 0)
+        entry = self._tables.get(hook, None)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        table = _DispatchTable(tuple(f for attr in _FUNCTION_STORES for f in self._yield_functions_from(hook, attr)))
+        self._tables[hook] = (version, table)
+        return table
+
+    def dispatch_table(self, hook: Hook) -> Tuple[HookFunction, ...]:
+        """
+        Ordered tuple of all functions to call for resolving the given hook while this scope is active.
+        Compiled once and recompiled only if the functions of equally named hooks globally or in the scope changed.
+        """
+        return self._compiled_dispatch_table(hook).functions
+
+
+_tracer: Optional["HookTracer"] = None
+"""The active hook tracer, ``None`` if tracing is off (no tracing code is run in hook resolution then)."""
+
+
+class HookTracer:
+    """
+    Opt-in tracing of hook resolution steps, e.g. for debugging the origin of hook values.
+    While no tracer is active, hook resolution does not emit any log messages.
+
+    Use it as context manager around the code to trace::
+
+        with HookTracer(hooks=["roll_force"], units=["Oval I"]):
+            sequence.solve(in_profile)
+
+    By default, the trace messages are emitted as debug messages to the logger of the hook's owner class.
+    Only one tracer is active at a time in the whole process, entering another replaces the current one until exit.
+    """
+
+    def __init__(
+        self,
+        hooks: Optional[Iterable[str]] = None,
+        units: Optional[Iterable[Any]] = None,
+        host_filter: Optional[Callable[["HookHost"], bool]] = None,
+        sample_every: int = 1,
+        sink: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        :param hooks: names of the hooks to trace, either plain (``"width"``)
+            or qualified with the owner class (``"RollPass.OutProfile.width"``), ``None`` for all
+        :param units: units or unit labels to trace, hosts are traced if they are one of these units
+            or belong to one of them (profiles, rolls, engines and disk elements), ``None`` for all
+        :param host_filter: additional predicate on the host instance deciding whether to trace it
+        :param sample_every: emit only every n-th trace message matching the filters
+        :param sink: callable receiving the formatted trace messages instead of the logger
+        """
+        self.hooks = set(hooks) if hooks is not None else None
+        self.units = list(units) if units is not None else None
+        self.host_filter = host_filter
+        self.sample_every = sample_every
+        self.sink = sink
+
+        self._count = 0
+        self._previous = []
+
+    def __enter__(self):
+        global _tracer
+        self._previous.append(_tracer)
+        _tracer = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _tracer
+        _tracer = self._previous.pop()
+
+    def _matches_unit(self, instance) -> bool:
+        host = instance
+        while host is not None:
+            if any(host is u or getattr(host, "label", None) == u for u in self.units):
+                return True
+            host = next(
+                (o for o in (getattr(host, a, None) for a in ("unit", "roll_pass", "parent")) if o is not None),
+                None,
+            )
+        return False
+
+    def matches(self, hook: "Hook", instance) -> bool:
+        """Whether resolution steps of the given hook on the given host are traced."""
+        if self.hooks is not None and not (
+            hook.name in self.hooks or f"{hook.owner.__qualname__}.{hook.name}" in self.hooks
+        ):
+            return False
+        if self.units is not None and not self._matches_unit(instance):
+            return False
+        if self.host_filter is not None and not self.host_filter(instance):
+            return False
+        return True
+
+    def _trace(self, hook: "Hook", instance, message: str, *args):
+        if not self.matches(hook, instance):
+            return
+
+        self._count += 1
+        if (self._count - 1) % self.sample_every:
+            return
+
+        if self.sink is not None:
+            self.sink(f"Hook {hook.owner.__qualname__}.{hook.name} on {instance}: " + message % args)
+        else:
+            hook.owner.logger.debug("Hook %s.%s on %s: " + message, hook.owner.__qualname__, hook.name, instance, *args)
+
+
+_active_profiler: ContextVar[Optional["HookProfiler"]] = ContextVar("pyroll_core_hook_profiler", default=None)
+
+
+class HookProfiler:
+    """
+    Opt-in profiler recording statistics of hook resolution in the current context.
+
+    Use it as context manager around the code to profile::
+
+        with HookProfiler() as profiler:
+            sequence.solve(in_profile)
+
+        print(profiler.to_table())
+    """
+
+    def __init__(self):
+        self.function_stats: Dict[HookFunction, Dict[str, float]] = {}
+        """
+        Statistics per hook function: count of calls, cumulative and self wall time in seconds
+        and count of ``None`` results.
+        """
+
+        self.hook_stats: Dict[Hook, Dict[str, int]] = {}
+        """Statistics per hook: count of explicit values, cache hits and cache misses in ``Hook.__get__``."""
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._tokens = []
+
+    @property
+    def _child_times(self) -> List[float]:
+        """Stack of the times of nested calls, per thread."""
+        try:
+            return self._local.child_times
+        except AttributeError:
+            self._local.child_times = []
+            return self._local.child_times
+
+    def __enter__(self):
+        self._tokens.append(_active_profiler.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active_profiler.reset(self._tokens.pop())
+
+    def clear(self):
+        """Discard all recorded statistics."""
+        self.function_stats.clear()
+        self.hook_stats.clear()
+
+    def _profile_call(self, func: HookFunction, instance):
+        child_times = self._child_times
+        child_times.append(0.0)
+        start = perf_counter()
+        try:
+            result = func._call(instance)
+        finally:
+            elapsed = perf_counter() - start
+            child_time = child_times.pop()
+            if child_times:
+                child_times[-1] += elapsed
+
+            with self._lock:
+                stats = self.function_stats.get(func, None)
+                if stats is None:
+                    stats = self.function_stats[func] = dict(
+                        calls=0, cumulative_time=0.0, self_time=0.0, none_results=0
+                    )
+
+                stats["calls"] += 1
+                stats["cumulative_time"] += elapsed
+                stats["self_time"] += elapsed - child_time
+
+        if result is None:
+            with self._lock:
+                stats["none_results"] += 1
+
+        return result
+
+    def _record_lookup(self, hook: Hook, kind: str):
+        with self._lock:
+            stats = self.hook_stats.get(hook, None)
+            if stats is None:
+                stats = self.hook_stats[hook] = dict(explicit=0, hits=0, misses=0)
+            stats[kind] += 1
+
+    def function_rows(self, sort_by: str = "self_time") -> List[Dict[str, Any]]:
+        """
+        Statistics per hook function as list of dicts, sorted descending by the given key.
+        """
+        rows = [
+            {
+                "hook": f"{f.hook.owner.__qualname__}.{f.hook.name}",
+                "function": f"{f.module}.{f.qualname}",
+                **stats,
+            }
+            for f, stats in self.function_stats.items()
+        ]
+        return sorted(rows, key=lambda r: r[sort_by], reverse=True)
+
+    def hook_rows(self, sort_by: str = "misses") -> List[Dict[str, Any]]:
+        """
+        Statistics per hook as list of dicts, sorted descending by the given key.
+        """
+        rows = [{"hook": f"{h.owner.__qualname__}.{h.name}", **stats} for h, stats in self.hook_stats.items()]
+        return sorted(rows, key=lambda r: r[sort_by], reverse=True)
+
+    def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the recorded statistics as dict of lists of rows."""
+        return {"functions": self.function_rows(), "hooks": self.hook_rows()}
+
+    def to_json(self, **kwargs) -> str:
+        """Return the recorded statistics as JSON string. Keyword arguments are passed to ``json.dumps``."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_table(self, limit: Optional[int] = None) -> str:
+        """
+        Return the recorded statistics as human-readable plain text table.
+
+        :param limit: maximum count of rows to show per table
+        """
+        lines = [
+            f"{'calls':>8} {'cumulative [s]':>14} {'self [s]':>10} {'None':>8}  function (hook)",
+        ]
+        for r in self.function_rows()[:limit]:
+            lines.append(
+                f"{r['calls']:>8d} {r['cumulative_time']:>14.6f} {r['self_time']:>10.6f} {r['none_results']:>8d}"
+                f"  {r['function']} ({r['hook']})"
+            )
+
+        lines += ["", f"{'explicit':>8} {'hits':>8} {'misses':>8}  hook"]
+        for r in self.hook_rows()[:limit]:
+            lines.append(f"{r['explicit']:>8d} {r['hits']:>8d} {r['misses']:>8d}  {r['hook']}")
+
+        return "\n".join(lines)
+
+
 class _HookHostMeta(ABCMeta):
     """
     Metaclass that provides plugin functionality to a class.
@@ -371,8 +1085,16 @@ class _HookHostMeta(ABCMeta):
     def __setattr__(self, key, value):
         if isinstance(value, Hook):
             value.__set_name__(self, key)
+            # hooks created lazily on subclasses are empty and replace nothing, so dispatch tables stay valid
+            if isinstance(self.__dict__.get(key, None), Hook) or any(getattr(value, a) for a in _FUNCTION_STORES):
+                _invalidate_dispatch_tables(key)
         super().__setattr__(key, value)
 
+    def __delattr__(self, key):
+        if isinstance(self.__dict__.get(key, None), Hook):
+            _invalidate_dispatch_tables(key)
+        super().__delattr__(key)
+
 
 class HookHost(ReprMixin, LogMixin, metaclass=_HookHostMeta):
     """
@@ -381,22 +1103,84 @@ class HookHost(ReprMixin, LogMixin, metaclass=_HookHostMeta):
 
     def __init__(self):
         self.__cache__ = dict()
+        self.__dependents__ = dict()
+        self.__outdated__ = None
+        self.__unavailable__ = dict()
+        self.__unavailable_dependents__ = dict()
 
     def reevaluate_cache(self):
         """
-        Clears the cache of hook function results.
+        Reevaluates the cached hook function results and forgets hooks known to be unavailable.
+
+        If dependency tracking is enabled (see :py:func:`track_dependencies`),
+        only the values marked as outdated since the last call are reevaluated.
+        """
+        for n in list(self.__unavailable__):
+            _became_available(self, n)
+        self.__unavailable__.clear()
+
+        if _evaluation_stack.get() is None:
+            for n in list(self.__cache__.keys()):
+                hook = getattr(type(self), n)
+                old = self.__cache__[n]
+                self.__cache__[n] = new = hook.get_result(self)
+                if old is None and new is not None:
+                    _became_available(self, n)
+                elif not _values_equal(old, new):
+                    _invalidate_negative_results()
+            return
+
+        outdated = self.__outdated__
+        self.__outdated__ = set()
+        pending = [n for n in self.__cache__ if outdated is None or n in outdated]
+        done = set()
+
+        while pending:
+            for n in pending:
+                done.add(n)
+                self.__outdated__.discard(n)
+                hook = getattr(type(self), n)
+                old = self.__cache__.get(n, None)
+                self.__cache__[n] = new = hook._evaluate(self)
+
+                changed = not _values_equal(old, new)
+                if old is None and new is not None:
+                    _became_available(self, n)
+                elif changed:
+                    _invalidate_negative_results()
+                if changed:
+                    _outdate_dependents(self, n)
+
+            pending = [n for n in self.__outdated__ if n in self.__cache__ and n not in done]
+
+    def mark_cache_outdated(self):
         """
-        for n in list(self.__cache__.keys()):
-            hook = getattr(type(self), n)
-            self.__cache__[n] = hook.get_result(self)
+        Marks all cached values as outdated and discards the recorded dependencies,
+        so that the next call of :py:meth:`reevaluate_cache` reevaluates everything.
+        """
+        self.__outdated__ = None
+        self.__dependents__.clear()
+
+    def _record_probe(self, name: str):
+        stack = _evaluation_stack.get()
+        if stack:
+            self.__dependents__.setdefault(name, set()).add(stack[-1])
 
     def has_set(self, name: str):
         """Checks whether a value is explicitly set for the hook `name`."""
-        return name in self.__dict__
+        self._record_probe(name)
+        if name in self.__dict__:
+            return True
+        _record_missing(self, name)
+        return False
 
     def has_cached(self, name: str):
         """Checks whether a value is cached for the hook `name`."""
-        return name in self.__cache__
+        self._record_probe(name)
+        if name in self.__cache__:
+            return True
+        _record_missing(self, name)
+        return False
 
     def has_set_or_cached(self, name: str):
         """Checks whether a value is explicitly set or cached for the hook `name`."""
@@ -404,8 +1188,33 @@ class HookHost(ReprMixin, LogMixin, metaclass=_HookHostMeta):
 
     def has_value(self, name: str):
         """Checks whether a value is available for the hook `name`."""
+        if self._is_known_unavailable(name):
+            self._record_probe(name)
+            _record_missing(self, name)
+            return False
         return hasattr(self, name)
 
+    def try_get(self, name: str, default: Any = None) -> Any:
+        """
+        Get the value of the hook `name` or `default` if no value is available.
+        Unlike ``getattr``, hooks known to be unavailable are answered without raising and catching an exception.
+        """
+        if self._is_known_unavailable(name):
+            self._record_probe(name)
+            _record_missing(self, name)
+            return default
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            return default
+
+    def _is_known_unavailable(self, name: str) -> bool:
+        return (
+            self.__unavailable__.get(name, None) == _availability_version
+            and self.__dict__.get(name, None) is None
+            and self.__cache__.get(name, None) is None
+        )
+
     @classmethod
     @property
     def __hooks__(cls):
@@ -447,35 +1256,101 @@ class HookHost(ReprMixin, LogMixin, metaclass=_HookHostMeta):
         """
         return None
 
-    def evaluate_and_set_hooks(self):
-        """Evaluate functions of root hooks and set the results explicitly as attributes."""
+    def evaluate_and_set_hooks(self) -> np.ndarray:
+        """
+        Evaluate functions of root hooks and set the results explicitly as attributes.
 
-        def _gen():
-            for h in root_hooks:
-                if issubclass(type(self), h.owner):
-                    h = getattr(type(self), h.name)
-                    result = h.get_result(self)
+        :return: the numeric values of the results flattened into a float array (complex if any value is complex)
+        """
+        hooks = root_hooks.for_class(type(self))
+        buffer = self.__dict__.get("__root_hook_buffer__", None)
+        if buffer is None:
+            buffer = np.empty(len(hooks))
+        count = 0
+        layout = []
 
-                    if result is None:
-                        result = self.root_hook_fallback(h)
+        for h in hooks:
+            result = h.get_result(self)
 
-                    if result is None:
-                        raise AttributeError(f"Call for root hook '{h.name}' on '{self}' resulted in None.")
+            if result is None:
+                result = self.root_hook_fallback(h)
 
-                    setattr(self, h.name, result)
+            if result is None:
+                raise AttributeError(f"Call for root hook '{h.name}' on '{self}' resulted in None.")
 
-                    try:
-                        arr = np.array(result)
-                        yield from arr[np.isfinite(arr) | np.isinf(arr) | np.isnan(arr)].flat
-                    except TypeError:  # yield only numeric values
-                        continue
+            setattr(self, h.name, result)
+
+            if isinstance(result, (float, int, complex, np.number, np.bool_)):
+                if isinstance(result, (complex, np.complexfloating)):
+                    kind = "c"
+                    if buffer.dtype.kind != "c":
+                        buffer = buffer.astype(complex)
+                else:
+                    kind = "f" if isinstance(result, (float, np.floating)) else "i"
 
-        return list(_gen())
+                if count == len(buffer):
+                    buffer = np.resize(buffer, 2 * count + 1)
+                buffer[count] = result
+                layout.append((h, count, 1, None, kind))
+                count += 1
+                continue
+
+            try:
+                arr = np.asarray(result)
+            except TypeError:
+                continue
+
+            if arr.dtype.kind not in "biufc":  # take only numeric values
+                continue
+
+            if arr.dtype.kind == "c" and buffer.dtype.kind != "c":
+                buffer = buffer.astype(complex)
+            if count + arr.size > len(buffer):
+                buffer = np.resize(buffer, 2 * (count + arr.size))
+            buffer[count : count + arr.size] = arr.flat
+            layout.append((h, count, arr.size, arr.shape, arr.dtype.kind))
+            count += arr.size
+
+        self.__root_hook_buffer__ = buffer
+        self.__root_hook_layout__ = layout
+        return buffer[:count].copy()
+
+    @property
+    def root_hook_result_count(self) -> int:
+        """Count of numeric values returned by the last call of :py:meth:`evaluate_and_set_hooks`."""
+        layout = self.__dict__.get("__root_hook_layout__", None)
+        if not layout:
+            return 0
+        _, start, size, _, _ = layout[-1]
+        return start + size
+
+    @property
+    def root_hook_result_layout(self) -> List[Tuple[Hook, int]]:
+        """Root hooks and the count of their numeric values in the order returned by the last call of
+        :py:meth:`evaluate_and_set_hooks`."""
+        return [(h, size) for h, _, size, _, _ in self.__dict__.get("__root_hook_layout__", ())]
+
+    def set_root_hook_values(self, values: np.ndarray):
+        """
+        Explicitly set the values of root hooks from a flat array laid out like the last return value of
+        :py:meth:`evaluate_and_set_hooks`. Only floating point and complex values are set, others are left untouched.
+        """
+        for hook, start, size, shape, kind in self.__dict__.get("__root_hook_layout__", ()):
+            if kind not in "fc":
+                continue
+            value = values[start] if shape is None else np.reshape(values[start : start + size], shape).copy()
+            setattr(self, hook.name, np.real(value) if kind == "f" and np.iscomplexobj(value) else value)
 
     def __copy__(self):
         cls = self.__class__
         result = cls.__new__(cls)
         result.__dict__.update(self.__dict__)
+        result.__dependents__ = dict()
+        result.__outdated__ = None
+        result.__unavailable__ = dict()
+        result.__unavailable_dependents__ = dict()
+        result.__dict__.pop("__root_hook_buffer__", None)
+        result.__dict__.pop("__root_hook_layout__", None)
         return result
 
     def __deepcopy__(self, memo):
@@ -484,7 +1359,11 @@ class HookHost(ReprMixin, LogMixin, metaclass=_HookHostMeta):
         memo[id(self)] = result
 
         for k, v in self.__dict__.items():
-            if isinstance(v, weakref.ref):
+            if k in ("__root_hook_buffer__", "__root_hook_layout__"):
+                continue  # rebuilt on next evaluation, the layout refers to hook descriptors
+            if k in ("__dependents__", "__unavailable__", "__unavailable_dependents__"):
+                new_v = dict()  # recorded dependencies refer to the original hosts
+            elif isinstance(v, weakref.ref):
                 t = v()
 
                 if id(t) in memo:
@@ -497,8 +1376,115 @@ class HookHost(ReprMixin, LogMixin, metaclass=_HookHostMeta):
             setattr(result, k, new_v)
         return result
 
+    def __getstate__(self):
+        state = _weakrefs_to_pickle(self.__dict__)
+        state["__dependents__"] = dict()  # recorded dependencies are only valid within a solution
+        state["__outdated__"] = None
+        state["__unavailable__"] = dict()
+        state["__unavailable_dependents__"] = dict()
+        state.pop("__root_hook_buffer__", None)
+        state.pop("__root_hook_layout__", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(_weakrefs_from_pickle(state))
+
+
+class _PickledWeakRef:
+    """Picklable stand-in for a weak reference, holding its referent strongly while pickling."""
+
+    __slots__ = ("referent",)
+
+    def __init__(self, referent):
+        self.referent = referent
+
+    def __reduce__(self):
+        return _PickledWeakRef, (self.referent,)
+
+
+def _weakrefs_to_pickle(state: dict) -> dict:
+    """Replace weak references in an instance dict by picklable stand-ins."""
+    return {k: _PickledWeakRef(v()) if isinstance(v, weakref.ref) else v for k, v in state.items()}
+
+
+def _weakrefs_from_pickle(state: dict) -> dict:
+    """Restore weak references replaced by :py:func:`_weakrefs_to_pickle`, dead references become ``None``."""
+    return {
+        k: (weakref.ref(v.referent) if v.referent is not None else None) if isinstance(v, _PickledWeakRef) else v
+        for k, v in state.items()
+    }
+
 
 class _RootHooksList(list):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._version = 0
+        self._by_class: Dict[type, Tuple[Tuple[int, int], Tuple[Hook, ...]]] = {}
+
+    def for_class(self, cls: type) -> Tuple[Hook, ...]:
+        """
+        Get the root hooks applicable to instances of the given class, as they are defined on it.
+        The result is computed once per class and recomputed only if this list or the hook registry changed.
+        """
+        entry = self._by_class.get(cls, None)
+        if entry is not None and entry[0] == (self._version, _registry_version):
+            return entry[1]
+
+        hooks = tuple(getattr(cls, h.name) for h in self if issubclass(cls, h.owner))
+        self._by_class[cls] = ((self._version, _registry_version), hooks)
+        return hooks
+
+    def _changed(self):
+        self._version += 1
+
+    def append(self, item):
+        self._changed()
+        super().append(item)
+
+    def extend(self, items):
+        self._changed()
+        super().extend(items)
+
+    def insert(self, i, item):
+        self._changed()
+        super().insert(i, item)
+
+    def remove(self, item):
+        self._changed()
+        super().remove(item)
+
+    def pop(self, i=-1):
+        self._changed()
+        return super().pop(i)
+
+    def clear(self):
+        self._changed()
+        super().clear()
+
+    def sort(self, **kwargs):
+        self._changed()
+        super().sort(**kwargs)
+
+    def reverse(self):
+        self._changed()
+        super().reverse()
+
+    def __setitem__(self, i, value):
+        self._changed()
+        super().__setitem__(i, value)
+
+    def __delitem__(self, i):
+        self._changed()
+        super().__delitem__(i)
+
+    def __iadd__(self, other):
+        self._changed()
+        return super().__iadd__(other)
+
+    def __imul__(self, n):
+        self._changed()
+        return super().__imul__(n)
+
     def add(self, item):
         self.append(item)
 
@@ -6,26 +6,24 @@ from ..shapes import rectangle
 
 @Profile.height
 def height(self: Profile):
-    if hasattr(self, "cross_section"):
+    if self.has_value("cross_section"):
         return np.abs(self.cross_section.bounds[3] - self.cross_section.bounds[1])
 
 
 @Profile.width
 def width(self: Profile):
-    if hasattr(self, "cross_section"):
+    if self.has_value("cross_section"):
         return np.abs(self.cross_section.bounds[2] - self.cross_section.bounds[0])
 
 
-@Profile.height
+@Profile.height(classifiers={"3fold"})
 def height_3fold(self: Profile):
-    if "3fold" in self.classifiers:
-        return (self.cross_section.centroid.y - self.cross_section.bounds[1]) * 2
+    return (self.cross_section.centroid.y - self.cross_section.bounds[1]) * 2
 
 
-@Profile.width
+@Profile.width(classifiers={"3fold"})
 def width_3fold(self: Profile):
-    if "3fold" in self.classifiers:
-        return (self.cross_section.bounds[3] - self.cross_section.centroid.y) * 2
+    return (self.cross_section.bounds[3] - self.cross_section.centroid.y) * 2
 
 
 @Profile.equivalent_height
@@ -60,22 +58,30 @@ def core_temperature(self: Profile):
 
 @Profile.heat_penetration_number
 def heat_penetration_number(self: Profile):
-    if hasattr(self, "thermal_conductivity") and hasattr(self, "density") and hasattr(self, "specific_heat_capacity"):
+    if (
+        self.has_value("thermal_conductivity")
+        and self.has_value("density")
+        and self.has_value("specific_heat_capacity")
+    ):
         return np.sqrt(self.thermal_conductivity * self.density * self.specific_heat_capacity)
 
 
 @Profile.thermal_diffusivity
 def thermal_diffusivity(self: Profile):
-    if hasattr(self, "thermal_conductivity") and hasattr(self, "density") and hasattr(self, "specific_heat_capacity"):
+    if (
+        self.has_value("thermal_conductivity")
+        and self.has_value("density")
+        and self.has_value("specific_heat_capacity")
+    ):
         return self.thermal_conductivity / (self.density * self.specific_heat_capacity)
 
 
 @Profile.hydrostatic_stress
 def hydrostatic_stress(self: Profile):
     if (
-        hasattr(self, "longitudinal_stress")
-        and hasattr(self, "altitudinal_stress")
-        and hasattr(self, "latitudinal_stress")
+        self.has_value("longitudinal_stress")
+        and self.has_value("altitudinal_stress")
+        and self.has_value("latitudinal_stress")
     ):
         return (self.longitudinal_stress + self.altitudinal_stress + self.latitudinal_stress) / 3
 
@@ -83,9 +89,9 @@ def hydrostatic_stress(self: Profile):
 @Profile.equivalent_stress
 def equivalent_stress(self: Profile):
     if (
-        hasattr(self, "longitudinal_stress")
-        and hasattr(self, "altitudinal_stress")
-        and hasattr(self, "latitudinal_stress")
+        self.has_value("longitudinal_stress")
+        and self.has_value("altitudinal_stress")
+        and self.has_value("latitudinal_stress")
     ):
         return np.sqrt(
             1 / 2 * (self.longitudinal_stress - self.altitudinal_stress) ** 2
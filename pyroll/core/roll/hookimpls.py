@@ -88,13 +88,21 @@ def surface_y(self: Roll):
 
 @Roll.heat_penetration_number
 def heat_penetration_number(self: Roll):
-    if hasattr(self, "thermal_conductivity") and hasattr(self, "density") and hasattr(self, "specific_heat_capacity"):
+    if (
+        self.has_value("thermal_conductivity")
+        and self.has_value("density")
+        and self.has_value("specific_heat_capacity")
+    ):
         return np.sqrt(self.thermal_conductivity * self.density * self.specific_heat_capacity)
 
 
 @Roll.thermal_diffusivity
 def thermal_diffusivity(self: Roll):
-    if hasattr(self, "thermal_conductivity") and hasattr(self, "density") and hasattr(self, "specific_heat_capacity"):
+    if (
+        self.has_value("thermal_conductivity")
+        and self.has_value("density")
+        and self.has_value("specific_heat_capacity")
+    ):
         return self.thermal_conductivity / (self.density * self.specific_heat_capacity)
 
 
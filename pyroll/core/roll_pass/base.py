@@ -100,6 +100,8 @@ class BaseRollPass(DiskElementUnit, DeformationUnit, ABC):
     technologically_orientated_contour_lines = Hook[MultiLineString]()
     """Contour line of the roll pass with technologically correct orientation."""
 
+    _solution_components = ("roll", "engine")
+
     def __init__(self, label: str = "", **kwargs):
         """
         :param roll: the roll object representing the equal working rolls of the pass
@@ -139,6 +141,11 @@ class BaseRollPass(DiskElementUnit, DeformationUnit, ABC):
         self._contour_lines = None
         self.engine.reevaluate_cache()
 
+    def mark_cache_outdated(self):
+        super().mark_cache_outdated()
+        self.roll.mark_cache_outdated()
+        self.engine.mark_cache_outdated()
+
     class Profile(DiskElementUnit.Profile, DeformationUnit.Profile):
         """Represents a profile in context of a roll pass."""
 
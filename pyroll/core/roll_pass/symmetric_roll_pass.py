@@ -39,6 +39,9 @@ class SymmetricRollPass(BaseRollPass, ABC):
 
         return np.concatenate([super_results, roll_results, engine_results], axis=0)
 
+    def _root_hook_hosts(self):
+        return super()._root_hook_hosts() + [("roll", self.roll), ("engine", self.engine)]
+
     def reevaluate_cache(self):
         super().reevaluate_cache()
         self.roll.reevaluate_cache()
@@ -40,6 +40,9 @@ class TwoRollPass(SymmetricRollPass):
 
         return np.concatenate([super_results, roll_results, engine_results], axis=0)
 
+    def _root_hook_hosts(self):
+        return super()._root_hook_hosts() + [("roll", self.roll), ("engine", self.engine)]
+
     class Profile(SymmetricRollPass.Profile):
         """Represents a profile in context of a roll pass."""
 
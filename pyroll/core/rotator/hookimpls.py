@@ -29,6 +29,10 @@ def classifiers(self: Rotator.OutProfile):
     return t
 
 
+# The following functions use plain guards instead of classifier preconditions (``classifiers=...``),
+# since they depend on the classifiers of the incoming profile and the next roll pass, not of the rotator itself.
+
+
 @Rotator.rotation
 def default_90(self: Rotator):
     return 90
@@ -1,5 +1,20 @@
 from .sequence import PassSequence
+from .batch import BatchResult
+from .sweep import Sweep, SweepAxis, SweepResult
+from .mill import MillSolver, MillUnknown
+from .parallel import ParallelSequence
+from .plan import SolvePlan
 
 from . import hookimpls  # noqa: F401
 
-__all__ = ["PassSequence"]
+__all__ = [
+    "PassSequence",
+    "BatchResult",
+    "Sweep",
+    "SweepAxis",
+    "SweepResult",
+    "MillSolver",
+    "MillUnknown",
+    "ParallelSequence",
+    "SolvePlan",
+]
@@ -0,0 +1,193 @@
+import copy
+import math
+import os
+import pickle
+import threading
+import traceback
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, List, Sequence, Tuple, Any, Callable, Dict, TYPE_CHECKING
+
+from ..profile import Profile
+from .parallel import submit_in_context
+
+if TYPE_CHECKING:
+    from .sequence import PassSequence
+
+__all__ = ["BatchResult"]
+
+
+class BatchResult:
+    """Result of solving a single incoming profile within :py:meth:`PassSequence.solve_batch`."""
+
+    def __init__(
+        self,
+        index: int,
+        out_profile: Optional[Profile] = None,
+        sequence: Optional["PassSequence"] = None,
+        error: Optional[BaseException] = None,
+        error_traceback: Optional[str] = None,
+    ):
+        self.index = index
+        """Index of the incoming profile in the batch."""
+
+        self.out_profile = out_profile
+        """The outgoing profile of the sequence, ``None`` if the solution failed."""
+
+        self.sequence = sequence
+        """The solved copy of the sequence, if requested."""
+
+        self.error = error
+        """The exception raised during solution, ``None`` if successful."""
+
+        self.error_traceback = error_traceback
+        """Formatted traceback of the exception raised during solution."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the solution was successful."""
+        return self.error is None
+
+    def __repr__(self):
+        if self.ok:
+            return f"BatchResult(index={self.index}, ok)"
+        return f"BatchResult(index={self.index}, error={self.error!r})"
+
+
+_worker_state = threading.local()
+"""Unpickled templates (like sequences) per batch within a worker thread,
+so that batches running concurrently in thread pools do not discard each other's templates."""
+
+
+def _worker_templates() -> Dict[str, Any]:
+    templates = getattr(_worker_state, "templates", None)
+    if templates is None:
+        templates = _worker_state.templates = dict()
+    return templates
+
+
+def _init_worker(token: str, pickled_template: bytes):
+    templates = _worker_templates()
+    templates.clear()
+    templates[token] = pickle.loads(pickled_template)
+
+
+def _worker_template(token: str, pickled_template: Optional[bytes]):
+    templates = _worker_templates()
+    template = templates.get(token, None)
+    if template is None:
+        templates.clear()
+        template = templates[token] = pickle.loads(pickled_template)
+    return template
+
+
+def _picklable_error(error: BaseException) -> BaseException:
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(repr(error))
+
+
+def _format_error(error: BaseException) -> str:
+    return "".join(traceback.format_exception(type(error), error, error.__traceback__))
+
+
+def run_chunked(
+    template: Any,
+    task: Callable,
+    chunks: List[list],
+    executor: Optional[Executor],
+    max_workers: Optional[int],
+    *args,
+) -> List[Tuple[list, Any]]:
+    """
+    Submit ``task(token, pickled_template, chunk, *args)`` for each chunk to the executor.
+    The template is shipped once per worker using the initializer of a created process pool, or once per chunk
+    to a given executor. Tasks shall obtain it by :py:func:`_worker_template`.
+    Tasks submitted to a thread pool run in a copy of the current context, so that active hook scopes
+    and profilers apply to them.
+
+    :return: list of tuples of chunk and task result or raised exception, in the order of the chunks
+    """
+    pickled_template = pickle.dumps(template)
+    token = uuid.uuid4().hex
+
+    if executor is None:
+        own_executor = ProcessPoolExecutor(
+            max_workers or os.cpu_count() or 1, initializer=_init_worker, initargs=(token, pickled_template)
+        )
+        shipped_template = None
+    else:
+        own_executor = None
+        shipped_template = pickled_template
+
+    pool = own_executor or executor
+    try:
+        if isinstance(pool, ThreadPoolExecutor):
+            futures = [submit_in_context(pool, task, token, shipped_template, c, *args) for c in chunks]
+        else:
+            futures = [pool.submit(task, token, shipped_template, c, *args) for c in chunks]
+
+        results = []
+        for chunk, future in zip(chunks, futures):
+            try:
+                results.append((chunk, future.result()))
+            except Exception as e:
+                results.append((chunk, e))
+        return results
+    finally:
+        if own_executor is not None:
+            own_executor.shutdown()
+
+
+def default_chunk_size(count: int, max_workers: Optional[int], chunks_per_worker: int) -> int:
+    return max(1, math.ceil(count / (chunks_per_worker * (max_workers or os.cpu_count() or 1))))
+
+
+def _solve_chunk(
+    token: str,
+    pickled_sequence: Optional[bytes],
+    items: List[Tuple[int, Profile]],
+    return_sequences: bool,
+) -> List[BatchResult]:
+    template = _worker_template(token, pickled_sequence)
+
+    results = []
+    for index, in_profile in items:
+        sequence = copy.deepcopy(template)
+        try:
+            out_profile = sequence.solve(in_profile)
+        except Exception as e:
+            results.append(BatchResult(index, error=_picklable_error(e), error_traceback=traceback.format_exc()))
+        else:
+            results.append(BatchResult(index, out_profile=out_profile, sequence=sequence if return_sequences else None))
+    return results
+
+
+def run_batch(
+    sequence: "PassSequence",
+    in_profiles: Sequence[Profile],
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    return_sequences: bool = False,
+) -> List[BatchResult]:
+    """Implementation of :py:meth:`PassSequence.solve_batch`."""
+    items = list(enumerate(in_profiles))
+    if not items:
+        return []
+
+    chunk_size = chunk_size or default_chunk_size(len(items), max_workers, 4)
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    results: List[Any] = [None] * len(items)
+    for chunk, chunk_results in run_chunked(sequence, _solve_chunk, chunks, executor, max_workers, return_sequences):
+        if isinstance(chunk_results, Exception):
+            for index, _ in chunk:
+                results[index] = BatchResult(index, error=chunk_results, error_traceback=_format_error(chunk_results))
+        else:
+            for r in chunk_results:
+                results[r.index] = r
+
+    return results
@@ -1,6 +1,13 @@
 import numpy as np
 
 from .sequence import PassSequence
+from .parallel import ParallelSequence
+from ..config import Config
+
+
+@PassSequence.partial_solve
+def default_partial_solve(self: PassSequence):
+    return Config.PARTIAL_SEQUENCE_SOLVE
 
 
 @PassSequence.elongation
@@ -36,3 +43,35 @@ def length(self: PassSequence):
 @PassSequence.power
 def total_power(self: PassSequence):
     return sum([u.power for u in self.units])
+
+
+@ParallelSequence.main_branch
+def default_main_branch(self: ParallelSequence):
+    return 0
+
+
+@ParallelSequence.branch_executor
+def default_branch_executor(self: ParallelSequence):
+    return Config.DEFAULT_BRANCH_EXECUTOR
+
+
+@ParallelSequence.duration
+def main_branch_duration(self: ParallelSequence):
+    return self.subunits[self.main_branch].duration
+
+
+@ParallelSequence.length
+def main_branch_length(self: ParallelSequence):
+    return self.subunits[self.main_branch].length
+
+
+@ParallelSequence.power
+def total_branch_power(self: ParallelSequence):
+    return sum([b.power for b in self.branches])
+
+
+@ParallelSequence.OutProfile.velocity
+def main_branch_out_velocity(self: ParallelSequence.OutProfile):
+    out_profile = self.parallel_sequence.subunits[self.parallel_sequence.main_branch].out_profile
+    if out_profile.has_value("velocity"):
+        return out_profile.velocity
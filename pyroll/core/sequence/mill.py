@@ -0,0 +1,231 @@
+from typing import Optional, List, Sequence, Callable, TYPE_CHECKING
+
+import numpy as np
+
+from ..profile import Profile
+from ..unit import Unit, SolutionStatus
+
+if TYPE_CHECKING:
+    from .sequence import PassSequence
+
+__all__ = ["MillUnknown", "MillSolver"]
+
+
+class MillUnknown:
+    """An unknown of a mill-level solution, given by the explicit value of a hook of a unit within the sequence."""
+
+    def __init__(self, unit: Unit, hook: str, scale: float = 1.0):
+        """
+        :param unit: the unit (usually a roll pass) holding the value
+        :param hook: the name of the hook, like ``"velocity"`` or ``"front_tension"``
+        :param scale: typical magnitude of the value, used to scale the iteration and the finite differences
+        """
+        self.unit = unit
+        """The unit holding the value."""
+
+        self.hook = hook
+        """The name of the hook."""
+
+        self.scale = scale
+        """Typical magnitude of the value."""
+
+    @property
+    def value(self) -> float:
+        """The current value of the hook."""
+        return getattr(self.unit, self.hook)
+
+    @value.setter
+    def value(self, value: float):
+        setattr(self.unit, self.hook, float(value))
+
+    def __repr__(self):
+        return f"MillUnknown({self.unit.label!r}, {self.hook!r})"
+
+
+class MillSolver:
+    """
+    Newton-type solver for mill-level unknowns like stand velocities and interstand tensions, which are coupled
+    through the solution of the whole sequence.
+
+    Each evaluation sets the unknowns, solves the sequence in place and computes the residuals.
+    The Jacobian is initialized with the explicit dependence of the residuals on the unknowns, obtained by finite
+    differences without solving the sequence, and reused across iterations with Broyden updates.
+    Only if a step fails to reduce the residuals even after backtracking, it is recomputed by finite differences
+    including the solution of the sequence for each perturbation.
+    Evaluations use :py:attr:`PassSequence.partial_solve`, so perturbing an unknown re-solves only the units
+    from its unit onward.
+    """
+
+    def __init__(
+        self,
+        sequence: "PassSequence",
+        in_profile: Profile,
+        unknowns: Sequence[MillUnknown],
+        residuals: Callable[[], np.ndarray],
+        tolerance: float = 1e-3,
+        max_iterations: int = 20,
+        step: float = 1e-3,
+        max_backtracks: int = 4,
+    ):
+        """
+        :param sequence: the sequence to solve
+        :param in_profile: the incoming profile of the sequence
+        :param unknowns: the unknowns to iterate
+        :param residuals: function returning the dimensionless residuals of the solved sequence,
+            it is called after each solution of the sequence
+        :param tolerance: maximum absolute residual to consider as converged, should not be below the
+            precision of the unit solutions
+        :param max_iterations: maximum count of Newton iterations
+        :param step: relative step width of the finite differences, with respect to the unknowns' scales
+        :param max_backtracks: maximum count of step halvings if a step does not reduce the residuals
+        """
+        self.sequence = sequence
+        """The sequence to solve."""
+
+        self.in_profile = in_profile
+        """The incoming profile of the sequence."""
+
+        self.unknowns: List[MillUnknown] = list(unknowns)
+        """The unknowns to iterate."""
+
+        self.residuals = residuals
+        """Function returning the residuals of the solved sequence."""
+
+        self.tolerance = tolerance
+        """Maximum absolute residual to consider as converged."""
+
+        self.max_iterations = max_iterations
+        """Maximum count of Newton iterations."""
+
+        self.step = step
+        """Relative step width of the finite differences."""
+
+        self.max_backtracks = max_backtracks
+        """Maximum count of step halvings."""
+
+        self.solve_count = 0
+        """Count of solutions of the sequence performed by the last call of :py:meth:`solve`."""
+
+        self.jacobian_count = 0
+        """Count of full finite difference Jacobians computed by the last call of :py:meth:`solve`."""
+
+        self.status: Optional[SolutionStatus] = None
+        """Outcome of the last call of :py:meth:`solve`."""
+
+        self._scales = np.array([u.scale for u in self.unknowns], dtype=float)
+
+    def _evaluate(self, x: np.ndarray) -> np.ndarray:
+        for u, v in zip(self.unknowns, x * self._scales):
+            if u.unit.__dict__.get(u.hook, None) != v:  # setting marks the unit as modified
+                u.value = v
+        self.sequence.solve(self.in_profile)
+        self.solve_count += 1
+        return np.asarray(self.residuals(), dtype=float)
+
+    def _position(self, unknown: MillUnknown) -> int:
+        unit = unknown.unit
+        while unit.parent is not None and unit.parent is not self.sequence:
+            unit = unit.parent
+        return self.sequence.subunits.position_of(unit) if unit.parent is self.sequence else 0
+
+    def _jacobian(self, x: np.ndarray, r: np.ndarray, full: bool) -> np.ndarray:
+        """
+        Finite difference Jacobian. If not ``full``, the sequence is not solved for the perturbations,
+        which gives only the explicit dependence of the residuals on the unknowns at no cost.
+        """
+        jacobian = np.empty((len(r), len(x)))
+
+        # perturb downstream unknowns first, so that each partial solution starts at the perturbed unit
+        for j in sorted(range(len(x)), key=lambda j: self._position(self.unknowns[j]), reverse=True):
+            h = self.step * max(abs(x[j]), 1)
+            perturbed = x.copy()
+            perturbed[j] += h
+
+            if full:
+                r_perturbed = self._evaluate(perturbed)
+            else:
+                self.unknowns[j].value = perturbed[j] * self._scales[j]
+                r_perturbed = np.asarray(self.residuals(), dtype=float)
+
+            jacobian[:, j] = (r_perturbed - r) / h
+            self.unknowns[j].value = x[j] * self._scales[j]
+
+        if full:
+            self.jacobian_count += 1
+        return jacobian
+
+    def solve(self) -> SolutionStatus:
+        """
+        Iterate the unknowns until the residuals are within the tolerance.
+        The current values of the unknowns are used as initial guess.
+        The sequence is left solved with the final values of the unknowns.
+        """
+        self.solve_count = 0
+        self.jacobian_count = 0
+        logger = self.sequence.logger
+
+        explicit_partial_solve = self.sequence.__dict__.get("partial_solve", None)
+        self.sequence.partial_solve = True
+
+        try:
+            x = np.array([u.value for u in self.unknowns], dtype=float) / self._scales
+            r = self._evaluate(x)
+            jacobian = None
+            full = False  # whether the Jacobian is a fresh full finite difference one
+
+            for i in range(1, self.max_iterations + 1):
+                if np.max(np.abs(r), initial=0) <= self.tolerance:
+                    self.status = SolutionStatus(SolutionStatus.CONVERGED, i - 1, np.max(np.abs(r), initial=0))
+                    break
+
+                if jacobian is None:
+                    jacobian = self._jacobian(x, r, full=False)
+
+                dx = -np.linalg.lstsq(jacobian, r, rcond=None)[0]
+                norm = np.linalg.norm(r)
+
+                factor = 1.0
+                for _ in range(self.max_backtracks + 1):
+                    x_new = x + factor * dx
+                    r_new = self._evaluate(x_new)
+                    if np.linalg.norm(r_new) < norm:
+                        break
+                    factor /= 2
+                else:
+                    if full:
+                        logger.warning(f"Mill-level solution of {self.sequence} stagnated after {i} iterations.")
+                        self.status = SolutionStatus(SolutionStatus.STAGNATED, i, np.max(np.abs(r)))
+                        self._evaluate(x)  # leave the sequence solved at the best point
+                        break
+
+                    jacobian = self._jacobian(x, r, full=True)  # approximation too poor, use the full one
+                    full = True
+                    continue
+
+                s = x_new - x
+                jacobian += np.outer((r_new - r) - jacobian @ s, s) / (s @ s)
+                full = False
+                x, r = x_new, r_new
+
+            else:
+                residuum = np.max(np.abs(r), initial=0)
+                if residuum <= self.tolerance:
+                    self.status = SolutionStatus(SolutionStatus.CONVERGED, self.max_iterations, residuum)
+                else:
+                    logger.warning(
+                        f"Mill-level solution of {self.sequence} exceeded the maximum iteration count of "
+                        f"{self.max_iterations}."
+                    )
+                    self.status = SolutionStatus(SolutionStatus.MAX_ITERATIONS, self.max_iterations, residuum)
+
+        finally:
+            if explicit_partial_solve is None:
+                del self.sequence.partial_solve
+            else:
+                self.sequence.partial_solve = explicit_partial_solve
+
+        logger.info(
+            f"Mill-level solution of {self.sequence} finished with status '{self.status.reason}' "
+            f"after {self.solve_count} solutions."
+        )
+        return self.status
@@ -0,0 +1,225 @@
+import contextvars
+import os
+import pickle
+from collections.abc import Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import overload, Union, cast, List, Callable, Optional
+
+from .. import hooks
+from ..hooks import Hook
+from ..profile import Profile
+from ..unit import Unit
+from ..unit.profiling import (
+    SolveProfileNode,
+    current_solve_profile_node,
+    nested_in_profile_node,
+    _active_solve_profiler,
+)
+
+__all__ = ["ParallelSequence"]
+
+
+def _solve_branch(pickled_branch: bytes, in_profile: Profile) -> Unit:
+    branch = pickle.loads(pickled_branch)
+    branch.solve(in_profile)
+    return branch
+
+
+def _call_in_forked_context(node: Optional[SolveProfileNode], func: Callable, *args):
+    hooks._fork_evaluation_state()
+    with nested_in_profile_node(node):
+        return func(*args)
+
+
+def submit_in_context(executor: Executor, func: Callable, *args) -> Future:
+    """
+    Submit a call to a thread pool executor within a copy of the current context,
+    so that active hook scopes, profilers and dependency tracking apply to it like to a call in the current thread.
+    """
+    context = contextvars.copy_context()
+    return executor.submit(context.run, _call_in_forked_context, current_solve_profile_node(), func, *args)
+
+
+def check_context_transferable(unit: Unit):
+    """
+    Check that no context dependent tools are active, which can not be carried to other processes.
+
+    :raises RuntimeError: if a hook scope is active, as results would differ silently otherwise
+    """
+    if hooks._active_scope.get() is not None:
+        raise RuntimeError(
+            "An active HookScope can not be carried to other processes. Solve in the same process instead."
+        )
+
+    if hooks._active_profiler.get() is not None or _active_solve_profiler.get() is not None:
+        unit.logger.warning(f"Active profilers do not record solutions within other processes in {unit}.")
+
+
+class ParallelSequence(Unit, Sequence[Unit]):
+    """
+    Unit splitting the material flow into independent branches, like the finishing lines fed by a slitting stand
+    or the strands of a caster. Place it after the unit the flow fans out from within a :py:class:`PassSequence`.
+
+    All branches (usually pass sequences themselves) receive the incoming profile of this unit and are solved
+    one after another or concurrently as configured by :py:attr:`branch_executor`.
+    The outgoing profile of this unit is the one of the :py:attr:`main_branch`, the branches are not merged again.
+    """
+
+    main_branch = Hook[int]()
+    """Index of the branch whose outgoing profile is the outgoing profile of this unit."""
+
+    branch_executor = Hook[Union[str, Executor]]()
+    """
+    Executor to solve the branches with, either a name (``"serial"``, ``"thread"``, ``"process"``) or an
+    :py:class:`~concurrent.futures.Executor` instance. With processes, the branches are pickled, solved in the
+    workers and the solved copies replace the branches in this unit, so hook functions must be importable there
+    (see :py:meth:`PassSequence.solve_batch`).
+
+    Branches solved in threads run in a copy of the current context, so active :py:class:`HookScope`,
+    :py:class:`HookProfiler` and :py:class:`SolveProfiler` instances apply to them as well. Those can not be carried
+    to other processes: an active scope raises an error then, active profilers do not record the branches.
+    The :py:class:`HookTracer` is process-wide, so it traces serial and thread branches, but not process branches.
+    """
+
+    def __init__(self, branches: Sequence[Unit], label: str = "", **kwargs):
+        """
+        :param branches: sequence of unit objects representing the branches
+        :param label: label for human identification
+        :param kwargs: additional hook values as keyword arguments to set explicitly
+        """
+
+        super().__init__(label=label)
+        self.__dict__.update(kwargs)
+        self._subunits = self._SubUnitsList(self, branches)
+
+    @property
+    def branches(self) -> List[Unit]:
+        """Returns a list of all branches."""
+        return list(self._subunits)
+
+    class Profile(Unit.Profile):
+        """Represents a profile in context of a parallel sequence unit."""
+
+        @property
+        def parallel_sequence(self) -> "ParallelSequence":
+            """Reference to the parallel sequence. Alias for ``self.unit``."""
+            return cast(ParallelSequence, self.unit)
+
+    class InProfile(Profile, Unit.InProfile):
+        """Represents an incoming profile of a parallel sequence unit."""
+
+    class OutProfile(Profile, Unit.OutProfile):
+        """Represents an outgoing profile of a parallel sequence unit."""
+
+        def root_hook_fallback(self, hook):
+            """Copy the value from the out profile of the main branch as fallback for root hooks."""
+            unit = self.parallel_sequence
+            if unit.subunits:
+                return getattr(unit.subunits[unit.main_branch].out_profile, hook.name, None)
+            return getattr(unit.in_profile, hook.name, None)
+
+    def __len__(self) -> int:
+        return self._subunits.__len__()
+
+    def __iter__(self):
+        return self._subunits.__iter__()
+
+    @overload
+    def __getitem__(self, key: int) -> Unit:
+        """Gets branch by index."""
+        ...
+
+    @overload
+    def __getitem__(self, key: str) -> Unit:
+        """Gets branch by label."""
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> list[Unit]:
+        """Gets a slice of branches."""
+        ...
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return self._subunits.by_label(key)
+            except KeyError:
+                raise KeyError(f"No branch with label '{key}' found.")
+
+        if isinstance(key, int) or isinstance(key, slice):
+            return self._subunits.__getitem__(key)
+
+        raise TypeError("Key must be int, slice or str")
+
+    def _solve_steps(self, in_profile: Profile):
+        self._pool = None
+        try:
+            return (yield from super()._solve_steps(in_profile))
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+            del self._pool
+
+    def _branch_pool(self) -> Union[str, Executor]:
+        executor = self.branch_executor
+
+        if isinstance(executor, Executor) or executor == "serial":
+            return executor
+
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown branch executor '{executor}'.")
+
+        if self._pool is None:
+            workers = min(len(self._subunits), os.cpu_count() or 1)
+            self._pool = ThreadPoolExecutor(workers) if executor == "thread" else ProcessPoolExecutor(workers)
+        return self._pool
+
+    def _iter_solve_subunits(self):
+        """
+        Solve all branches, yielding each branch as soon as its solution finished.
+        Nested subunits are yielded as well only if solved serially.
+        """
+        executor = self._branch_pool() if len(self._subunits) > 1 else "serial"
+
+        if executor == "serial":
+            for b in self._subunits:
+                try:
+                    yield from b._iter_solve(self.in_profile)
+                except Exception as e:
+                    raise RuntimeError(f"Solution of branch {b} failed.") from e
+            return
+
+        in_profile = Profile(**{k: v for k, v in self.in_profile.__dict__.items() if not k.startswith("_")})
+
+        if isinstance(executor, ThreadPoolExecutor):
+            futures = {submit_in_context(executor, b.solve, in_profile): (i, b) for i, b in enumerate(self._subunits)}
+        else:
+            check_context_transferable(self)
+            futures = {
+                executor.submit(_solve_branch, self._pickle_branch(b), in_profile): (i, b)
+                for i, b in enumerate(self._subunits)
+            }
+
+        for future in as_completed(futures):
+            i, b = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                raise RuntimeError(f"Solution of branch {b} failed.") from e
+
+            if isinstance(result, Unit):  # solved copy from another process
+                self._subunits[i] = result
+                result.parent = self
+                b = result
+
+            yield b
+
+    @staticmethod
+    def _pickle_branch(branch: Unit) -> bytes:
+        """Pickle the branch detached from its parent, so that the rest of the tree is not included."""
+        parent = branch._parent
+        branch._parent = None
+        try:
+            return pickle.dumps(branch)
+        finally:
+            branch._parent = parent
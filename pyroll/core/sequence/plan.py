@@ -0,0 +1,108 @@
+import copy
+from typing import List, Tuple, Set, TYPE_CHECKING
+
+from .. import hooks
+from ..disk_elements import DiskElementUnit
+from ..hooks import HookHost, root_hooks
+from ..profile import Profile
+from ..unit import Unit
+
+if TYPE_CHECKING:
+    from .sequence import PassSequence
+
+__all__ = ["SolvePlan"]
+
+
+class SolvePlan:
+    """
+    Reusable plan for solving a pass sequence of fixed layout many times with different incoming profiles,
+    created by :py:meth:`PassSequence.compile`.
+
+    The plan holds a private copy of the sequence, so later modifications of the original do not affect it.
+    On compilation, the disk elements of all units are created, the pre- and post-processor chains of all units
+    are resolved from their class hierarchies and frozen, and the hook dispatch tables and root hook lists of
+    all involved classes are built, which the solutions then use without rebuilding them.
+    Changes of the hook function registry or the root hooks after compilation are detected and trigger
+    a recompilation of the dispatch on the next solution,
+    while processor chains stay frozen until :py:meth:`recompile` is called.
+    """
+
+    def __init__(self, sequence: "PassSequence"):
+        """
+        :param sequence: the sequence to compile, it is copied and not modified
+        """
+        self.sequence: "PassSequence" = copy.deepcopy(sequence)
+        """The private copy of the sequence solved by this plan."""
+
+        self.units: Tuple[Unit, ...] = ()
+        """All units of the plan in order of solution, including nested subunits and disk elements."""
+
+        self.solve_count = 0
+        """Count of solutions performed with this plan."""
+
+        self._host_classes: Set[type] = set()
+        self._versions = (-1, -1)
+        self.recompile()
+
+    def recompile(self):
+        """Compile the plan again, for example after modifying :py:attr:`sequence` or the processors of classes."""
+        units = []
+        self._collect_units(self.sequence, units)
+        self.units = tuple(units)
+
+        for u in self.units:
+            u._frozen_processors = None
+            u._frozen_processors = (tuple(u._yield_pre_processors()), tuple(u._yield_post_processors()))
+
+        self._host_classes = set()
+        for u in self.units:
+            self._host_classes.update((type(u), u.InProfile, u.OutProfile))
+            self._host_classes.update(type(v) for v in u.__dict__.values() if isinstance(v, HookHost))
+
+        self._compile_dispatch()
+
+    @classmethod
+    def _collect_units(cls, unit: Unit, units: List[Unit]):
+        units.append(unit)
+
+        if isinstance(unit, DiskElementUnit) and not unit.subunits and unit.has_value("disk_element_count"):
+            unit._subunits = unit._SubUnitsList(
+                unit, [unit.DiskElement(unit, i) for i in range(unit.disk_element_count)]
+            )
+
+        for u in unit.subunits:
+            cls._collect_units(u, units)
+
+    def _compile_dispatch(self):
+        # materialize the hooks of all classes before compiling, as accessing them may create subclass hooks
+        host_hooks = {c: [getattr(c, name) for name in c.__hooks__] for c in self._host_classes}
+
+        for c, class_hooks in host_hooks.items():
+            root_hooks.for_class(c)
+            for h in class_hooks:
+                h._compiled_dispatch_table()
+
+        self._versions = (root_hooks._version, hooks._registry_version)
+
+    @property
+    def outdated(self) -> bool:
+        """Whether the hook function registry or the root hooks changed since the last compilation."""
+        return self._versions != (root_hooks._version, hooks._registry_version)
+
+    def solve(self, in_profile: Profile) -> Profile:
+        """
+        Solve the sequence of this plan for the given incoming profile.
+        The solved units are available in :py:attr:`sequence` until the next solution.
+
+        :param in_profile: the incoming state profile
+        :return: the outgoing state profile
+        """
+        if self.outdated:
+            self.sequence.logger.debug(f"Hook registry changed, recompiling the dispatch of {self}.")
+            self._compile_dispatch()
+
+        self.solve_count += 1
+        return self.sequence.solve(in_profile)
+
+    def __repr__(self):
+        return f"SolvePlan({self.sequence}, units={len(self.units)})"
@@ -3,12 +3,17 @@ import copy
 import numpy as np
 
 from collections.abc import Sequence
-from typing import overload, List, cast
+from concurrent.futures import Executor
+from typing import overload, List, cast, Iterable, Optional, Tuple
 
-from ..unit import Unit
+from ..unit import Unit, SolutionStatus
 from ..roll_pass import BaseRollPass
 from ..transport import Transport
 from ..hooks import Hook
+from .batch import BatchResult, run_batch
+from .sweep import Sweep, SweepAxis
+from .mill import MillSolver, MillUnknown
+from .plan import SolvePlan
 
 __all__ = ["PassSequence"]
 
@@ -32,6 +37,10 @@ class PassSequence(Unit, Sequence[Unit]):
     rel_elongation = Hook[float]()
     """Relative elongation (change in length)."""
 
+    partial_solve = Hook[bool]()
+    """Whether to reuse the last solutions of unmodified leading units instead of solving them again,
+    see :py:attr:`Unit.dirty`."""
+
     def __init__(self, units: Sequence[Unit], label: str = "", **kwargs):
         """
         :param units: sequence of unit objects
@@ -41,6 +50,7 @@ class PassSequence(Unit, Sequence[Unit]):
 
         super().__init__(label=label)
         self.__dict__.update(kwargs)
+        self._reused_count = 0
         self._subunits = self._SubUnitsList(self, units)
 
     class Profile(Unit.Profile):
@@ -81,8 +91,8 @@ class PassSequence(Unit, Sequence[Unit]):
     def __getitem__(self, key):
         if isinstance(key, str):
             try:
-                return next(u for u in self._subunits if u.label == key)
-            except StopIteration:
+                return self._subunits.by_label(key)
+            except KeyError:
                 raise KeyError(f"No unit with label '{key}' found.")
 
         if isinstance(key, int) or isinstance(key, slice):
@@ -90,6 +100,80 @@ class PassSequence(Unit, Sequence[Unit]):
 
         raise TypeError("Key must be int, slice or str")
 
+    def init_solve(self, in_profile: Profile):
+        super().init_solve(in_profile)
+        self._reused_count = self._count_reusable_units() if self.partial_solve else 0
+
+    def _count_reusable_units(self) -> int:
+        last_profile = self.in_profile
+        count = 0
+
+        for u in self._subunits:
+            if not u.is_reusable_for(last_profile):
+                break
+            last_profile = u.solved_out_profile
+            u._solution_reused = True
+            count += 1
+
+        if count:
+            self.logger.debug(f"Reusing solutions of the first {count} units of {self}.")
+        return count
+
+    def _iter_solve_subunits(self):
+        if not self._reused_count:
+            return (yield from super()._iter_solve_subunits())
+
+        yield from self._subunits[: self._reused_count]  # reused units are yielded as if solved again
+        yield from self._iter_solve_units(
+            self._subunits[self._reused_count :], self._subunits[self._reused_count - 1].solved_out_profile
+        )
+
+    def solve_batch(
+        self,
+        in_profiles: Iterable[Profile],
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        return_sequences: bool = False,
+    ) -> List[BatchResult]:
+        """
+        Solve this sequence for many incoming profiles in parallel.
+        The sequence is pickled once and every profile is solved on a fresh copy of it,
+        so this sequence itself is not modified.
+
+        Hook functions must be defined in importable modules to be available in worker processes,
+        especially if those are spawned instead of forked.
+
+        :param in_profiles: the incoming profiles to solve
+        :param executor: executor to submit the solutions to, a process pool is created (and shut down afterward)
+            if omitted, which receives the sequence once per worker on startup; with a given executor the sequence
+            is sent once per chunk
+        :param max_workers: count of worker processes of the created pool, also used to determine the chunk size
+        :param chunk_size: count of profiles solved per submitted task, chosen to give about 4 chunks per worker
+            if omitted
+        :param return_sequences: whether to return the solved copies of the sequence in the results
+        :return: list of results in the order of the incoming profiles, failed solutions are captured in the
+            ``error`` attribute of the respective result instead of raising
+        """
+        return run_batch(self, in_profiles, executor, max_workers, chunk_size, return_sequences)
+
+    def compile(self) -> SolvePlan:
+        """
+        Compile this sequence into a reusable plan for solving it many times with different incoming profiles,
+        see :py:class:`SolvePlan`. The plan works on a copy, so this sequence itself is not modified.
+        """
+        return SolvePlan(self)
+
+    def sweep(self, in_profile: Profile, axes: Iterable[SweepAxis] = (), collect: Iterable[str] = ()) -> Sweep:
+        """
+        Create a parameter study of this sequence, see :py:class:`Sweep`.
+
+        :param in_profile: the base incoming profile
+        :param axes: the parameter axes, more can be added using :py:meth:`Sweep.add_axis`
+        :param collect: dotted paths of values to collect after solution
+        """
+        return Sweep(self, in_profile, axes, collect)
+
     def prepend(self, unit: Unit) -> None:
         """Prepend a unit to the beginning of the sequence."""
         self._subunits.insert(0, unit)
@@ -137,99 +221,126 @@ class PassSequence(Unit, Sequence[Unit]):
     def _ipython_key_completions_(self):
         return [u.label for u in self._subunits]
 
+    def _velocity_snapshot(self) -> List[Tuple[BaseRollPass, Optional[float]]]:
+        """Explicitly set velocities of the roll passes, ``None`` for unset ones."""
+        return [(roll_pass, roll_pass.__dict__.get("velocity", None)) for roll_pass in self.roll_passes]
+
+    @staticmethod
+    def _rollback_velocities(snapshot: List[Tuple[BaseRollPass, Optional[float]]]):
+        for roll_pass, velocity in snapshot:
+            if velocity is None:
+                del roll_pass.velocity
+            else:
+                roll_pass.velocity = velocity
+
     def solve_velocities_backward(self, in_profile: Profile, final_speed: float, final_cross_section_area: float):
         """
         Solve method, that calculates all velocities of the roll pass starting from the very last roll_pass of the sequence.
+        The sequence is solved in place repeatedly until the velocities converge, so it is in solved state afterward.
+        If the solution raises, the velocities of the roll passes are restored to their previous state.
 
         :param in_profile: incoming profile
         :param final_speed: speed of the last stand
         :param final_cross_section_area: area of the final cross-section
         """
 
-        copied_sequence = copy.deepcopy(self)
+        roll_passes = self.roll_passes
+        snapshot = self._velocity_snapshot()
 
         def calculate_velocities_array(velocities: np.ndarray[float], cross_sections_areas: np.ndarray[float]):
             for i in range(len(cross_sections_areas) - 2, -1, -1):
                 velocities[i] = velocities[i + 1] * cross_sections_areas[i + 1] / cross_sections_areas[i]
 
-        def set_velocities_to_roll_passes(roll_passes: List[BaseRollPass], velocities: np.ndarray[float]):
+        def set_velocities_to_roll_passes(velocities: np.ndarray[float]):
             for roll_pass, velocity in zip(roll_passes, velocities):
                 roll_pass.velocity = velocity
 
-        usable_cross_section_areas = np.asarray([roll_pass.usable_cross_section.area for roll_pass in copied_sequence.roll_passes])
+        usable_cross_section_areas = np.asarray([roll_pass.usable_cross_section.area for roll_pass in roll_passes])
         initial_roll_pass_velocities = np.zeros_like(usable_cross_section_areas, dtype=float)
 
         initial_roll_pass_velocities[-1] = final_speed
         usable_cross_section_areas[-1] = final_cross_section_area
 
         calculate_velocities_array(velocities=initial_roll_pass_velocities, cross_sections_areas=usable_cross_section_areas)
-        set_velocities_to_roll_passes(roll_passes=copied_sequence.roll_passes, velocities=initial_roll_pass_velocities)
 
-        copied_sequence.solve(in_profile)
+        try:
+            set_velocities_to_roll_passes(velocities=initial_roll_pass_velocities)
+            self.solve(in_profile)
 
-        for i in range(self.max_iteration_count):
-            prior_roll_pass_velocities = np.asarray([roll_pass.velocity for roll_pass in copied_sequence.roll_passes])
-            current_roll_pass_velocities = prior_roll_pass_velocities.copy()
-            profile_areas = [roll_pass.out_profile.cross_section.area for roll_pass in copied_sequence.roll_passes]
+            for i in range(self.max_iteration_count):
+                prior_roll_pass_velocities = np.asarray([roll_pass.velocity for roll_pass in roll_passes])
+                current_roll_pass_velocities = prior_roll_pass_velocities.copy()
+                profile_areas = [roll_pass.out_profile.cross_section.area for roll_pass in roll_passes]
 
-            calculate_velocities_array(velocities=current_roll_pass_velocities, cross_sections_areas=profile_areas)
-            set_velocities_to_roll_passes(roll_passes=copied_sequence.roll_passes, velocities=current_roll_pass_velocities)
+                calculate_velocities_array(velocities=current_roll_pass_velocities, cross_sections_areas=profile_areas)
+                set_velocities_to_roll_passes(velocities=current_roll_pass_velocities)
 
-            copied_sequence.solve(in_profile)
+                self.solve(in_profile)
 
-            difference = np.abs(prior_roll_pass_velocities - current_roll_pass_velocities)
+                difference = np.abs(prior_roll_pass_velocities - current_roll_pass_velocities)
 
-            if np.all(difference < 0.01):
-                set_velocities_to_roll_passes(roll_passes=self.roll_passes, velocities=current_roll_pass_velocities)
-                self.solve(in_profile)
-                break
+                if np.all(difference < 0.01):
+                    break
+            else:
+                self.logger.warning(f"Backward velocity calculation of {self} did not converge.")
+        except Exception:
+            self._rollback_velocities(snapshot)
+            raise
 
     def solve_velocities_forward(self, in_profile: Profile, initial_speed: float):
         """
         Solve method, that calculates all velocities of the roll pass starting from the very first roll_pass of the sequence.
+        The sequence is solved in place repeatedly until the velocities converge, so it is in solved state afterward.
+        If the solution raises, the velocities of the roll passes are restored to their previous state.
 
         :param in_profile: incoming profile
         :param initial_speed: speed of the first stand or output speed of a furnace
-        :param final_cross_section_area: area of the final cross-section
         """
 
-        copied_sequence = copy.deepcopy(self)
+        roll_passes = self.roll_passes
+        snapshot = self._velocity_snapshot()
 
         def calculate_velocities_array(velocities: np.ndarray[float], cross_sections_areas: np.ndarray[float]):
             for i in range(1, len(usable_cross_section_areas)):
                 velocities[i] = velocities[i - 1] * cross_sections_areas[i - 1] / cross_sections_areas[i]
 
-        def set_velocities_to_roll_passes(roll_passes: List[BaseRollPass], velocities: np.ndarray[float]):
+        def set_velocities_to_roll_passes(velocities: np.ndarray[float]):
             for roll_pass, velocity in zip(roll_passes, velocities):
                 roll_pass.velocity = velocity
 
-        usable_cross_section_areas = np.asarray([roll_pass.usable_cross_section.area for roll_pass in copied_sequence.roll_passes])
+        usable_cross_section_areas = np.asarray([roll_pass.usable_cross_section.area for roll_pass in roll_passes])
         initial_roll_pass_velocities = np.zeros_like(usable_cross_section_areas, dtype=float)
 
-        initial_roll_pass_velocities[0] = initial_speed * in_profile.cross_section.area / copied_sequence.roll_passes[0].usable_cross_section.area
+        initial_roll_pass_velocities[0] = (
+            initial_speed * in_profile.cross_section.area / roll_passes[0].usable_cross_section.area
+        )
 
         calculate_velocities_array(velocities=initial_roll_pass_velocities, cross_sections_areas=usable_cross_section_areas)
-        set_velocities_to_roll_passes(roll_passes=copied_sequence.roll_passes, velocities=initial_roll_pass_velocities)
 
-        copied_sequence.solve(in_profile)
+        try:
+            set_velocities_to_roll_passes(velocities=initial_roll_pass_velocities)
+            self.solve(in_profile)
 
-        for i in range(self.max_iteration_count):
-            prior_velocities = np.asarray([roll_pass.velocity for roll_pass in copied_sequence.roll_passes])
-            profile_areas = [roll_pass.out_profile.cross_section.area for roll_pass in copied_sequence.roll_passes]
-            roll_pass_velocities = np.zeros_like(usable_cross_section_areas, dtype=float)
-            roll_pass_velocities[0] = initial_speed * in_profile.cross_section.area / profile_areas[0]
+            for i in range(self.max_iteration_count):
+                prior_velocities = np.asarray([roll_pass.velocity for roll_pass in roll_passes])
+                profile_areas = [roll_pass.out_profile.cross_section.area for roll_pass in roll_passes]
+                roll_pass_velocities = np.zeros_like(usable_cross_section_areas, dtype=float)
+                roll_pass_velocities[0] = initial_speed * in_profile.cross_section.area / profile_areas[0]
 
-            calculate_velocities_array(velocities=roll_pass_velocities, cross_sections_areas=profile_areas)
-            set_velocities_to_roll_passes(roll_passes=copied_sequence.roll_passes, velocities=roll_pass_velocities)
+                calculate_velocities_array(velocities=roll_pass_velocities, cross_sections_areas=profile_areas)
+                set_velocities_to_roll_passes(velocities=roll_pass_velocities)
 
-            copied_sequence.solve(in_profile)
+                self.solve(in_profile)
 
-            difference = np.abs(prior_velocities - roll_pass_velocities)
+                difference = np.abs(prior_velocities - roll_pass_velocities)
 
-            if np.all(difference < 0.01):
-                set_velocities_to_roll_passes(roll_passes=self.roll_passes, velocities=roll_pass_velocities)
-                self.solve(in_profile)
-                break
+                if np.all(difference < 0.01):
+                    break
+            else:
+                self.logger.warning(f"Forward velocity calculation of {self} did not converge.")
+        except Exception:
+            self._rollback_velocities(snapshot)
+            raise
 
     def solve_interstand_tensions_with_given_velocity_ratios(self, in_profile: Profile,
                                                              velocity_ratios: np.ndarray[float], final_speed: float):
@@ -273,3 +384,98 @@ class PassSequence(Unit, Sequence[Unit]):
             roll_pass.front_tension = tensions[2 * index + 1]
 
         self.solve(in_profile=in_profile)
+
+    def solve_mill(
+        self,
+        in_profile: Profile,
+        final_speed: Optional[float] = None,
+        initial_speed: Optional[float] = None,
+        velocity_ratios: Optional[Sequence[float]] = None,
+        tolerance: Optional[float] = None,
+        max_iterations: Optional[int] = None,
+    ) -> SolutionStatus:
+        """
+        Solve the stand velocities (and interstand tensions) of the whole sequence with a Newton-type iteration,
+        see :py:class:`MillSolver`. The sequence is solved in place and left in solved state.
+
+        Without ``velocity_ratios``, the velocities follow from constant mass flow through the roll passes' outgoing
+        cross-sections, like in :py:meth:`solve_velocities_backward` and :py:meth:`solve_velocities_forward`.
+        With ``velocity_ratios``, the velocities follow from the ratios and the front and back tensions are solved
+        as well, like in :py:meth:`solve_interstand_tensions_with_given_velocity_ratios`, which requires the
+        ``elastic_modulus`` of the incoming profile.
+
+        :param in_profile: incoming profile
+        :param final_speed: speed of the last stand, exclusive with ``initial_speed``
+        :param initial_speed: speed of the incoming profile, exclusive with ``final_speed``
+        :param velocity_ratios: velocity ratio per pair of consecutive stands
+        :param tolerance: maximum absolute (dimensionless) residual, defaults to the ``iteration_precision``
+        :param max_iterations: maximum count of Newton iterations, defaults to the ``max_iteration_count``
+        :return: the outcome of the iteration
+        """
+        if (final_speed is None) == (initial_speed is None):
+            raise ValueError("Exactly one of final_speed and initial_speed must be given.")
+
+        roll_passes = self.roll_passes
+        areas = np.asarray([roll_pass.usable_cross_section.area for roll_pass in roll_passes])
+
+        if velocity_ratios is not None:
+            velocity_ratios = np.asarray(velocity_ratios, dtype=float)
+            if len(velocity_ratios) != len(roll_passes) - 1:
+                raise ValueError(f"Expected {len(roll_passes) - 1} velocity ratios, got {len(velocity_ratios)}.")
+            relative_velocities = np.concatenate([[1], np.cumprod(velocity_ratios)])
+        else:
+            relative_velocities = areas[0] / areas
+
+        if final_speed is not None:
+            velocities = final_speed * relative_velocities / relative_velocities[-1]
+        else:
+            velocities = initial_speed * in_profile.cross_section.area / areas[0] * relative_velocities
+
+        unknowns = [MillUnknown(roll_pass, "velocity", v) for roll_pass, v in zip(roll_passes, velocities)]
+
+        if velocity_ratios is not None:
+            modulus = in_profile.elastic_modulus
+            roll_passes[0].back_tension = 0
+            roll_passes[-1].front_tension = 0
+            unknowns += [MillUnknown(roll_pass, "front_tension", modulus) for roll_pass in roll_passes[:-1]]
+            unknowns += [MillUnknown(roll_pass, "back_tension", modulus) for roll_pass in roll_passes[1:]]
+
+        for roll_pass, velocity in zip(roll_passes, velocities):
+            roll_pass.velocity = velocity
+
+        def residuals():
+            v = np.asarray([roll_pass.velocity for roll_pass in roll_passes])
+            out_areas = np.asarray([roll_pass.out_profile.cross_section.area for roll_pass in roll_passes])
+
+            if final_speed is not None:
+                anchor = v[-1] / final_speed - 1
+            else:
+                anchor = v[0] * out_areas[0] / (initial_speed * in_profile.cross_section.area) - 1
+
+            if velocity_ratios is None:
+                return np.concatenate([[anchor], v[:-1] * out_areas[:-1] / (v[1:] * out_areas[1:]) - 1])
+
+            strains = (v[1:] - v[:-1]) / v[:-1]
+            front = np.asarray([roll_pass.front_tension for roll_pass in roll_passes[:-1]])
+            back = np.asarray([roll_pass.back_tension for roll_pass in roll_passes[1:]])
+            in_moduli = np.asarray([roll_pass.in_profile.elastic_modulus for roll_pass in roll_passes[:-1]])
+            out_moduli = np.asarray([roll_pass.out_profile.elastic_modulus for roll_pass in roll_passes[:-1]])
+
+            return np.concatenate(
+                [
+                    [anchor],
+                    v[1:] / (v[:-1] * velocity_ratios) - 1,
+                    (front - in_moduli * strains) / modulus,
+                    (back + out_moduli * strains) / modulus,
+                ]
+            )
+
+        solver = MillSolver(
+            self,
+            in_profile,
+            unknowns,
+            residuals,
+            tolerance=tolerance if tolerance is not None else self.iteration_precision,
+            max_iterations=max_iterations if max_iterations is not None else self.max_iteration_count,
+        )
+        return solver.solve()
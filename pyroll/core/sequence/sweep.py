@@ -0,0 +1,308 @@
+import copy
+import itertools
+import traceback
+from concurrent.futures import Executor
+from typing import Optional, List, Sequence, Tuple, Any, Dict, Iterable, TYPE_CHECKING
+
+import numpy as np
+
+from ..profile import Profile
+from ..unit import Unit
+from .batch import run_chunked, default_chunk_size, _worker_template, _picklable_error, _format_error
+
+if TYPE_CHECKING:
+    from .sequence import PassSequence
+
+__all__ = ["SweepAxis", "Sweep", "SweepResult"]
+
+IN_PROFILE_PREFIX = "in_profile."
+
+
+def _find_unit(unit: Unit, label: str) -> Optional[Unit]:
+    for u in unit.subunits or ():
+        if u.label == label:
+            return u
+        found = _find_unit(u, label)
+        if found is not None:
+            return found
+    return None
+
+
+def _resolve(sequence: "PassSequence", path: str) -> Tuple[Any, str]:
+    """
+    Resolve a dotted path to the owning object and the attribute name.
+    The first segment is either the label of a unit within the sequence or an attribute of the sequence itself.
+    """
+    head, _, rest = path.partition(".")
+    obj = _find_unit(sequence, head) if rest else None
+
+    if obj is None:
+        obj, rest = sequence, path
+
+    *owners, name = rest.split(".")
+    for o in owners:
+        obj = getattr(obj, o)
+    return obj, name
+
+
+class SweepAxis:
+    """A parameter varied within a :py:class:`Sweep`."""
+
+    def __init__(self, path: str, values: Optional[Iterable] = None, bounds: Optional[Tuple[float, float]] = None):
+        """
+        :param path: dotted path of the parameter, like ``"Oval I.gap"``, ``"Oval I.roll.nominal_radius"`` or
+            ``"in_profile.temperature"``, where the first segment is the label of a unit in the sequence,
+            ``in_profile`` for the incoming profile or an attribute of the sequence itself
+        :param values: discrete values used for full-factorial designs
+        :param bounds: lower and upper bound used for sampled designs, defaults to the range of ``values``
+        """
+        if values is None and bounds is None:
+            raise ValueError("Either values or bounds must be given.")
+
+        self.path = path
+        """Dotted path of the parameter."""
+
+        self.values = np.asarray(list(values)) if values is not None else None
+        """Discrete values used for full-factorial designs."""
+
+        self.bounds = tuple(bounds) if bounds is not None else (np.min(self.values), np.max(self.values))
+        """Lower and upper bound used for sampled designs."""
+
+    def __repr__(self):
+        return f"SweepAxis({self.path!r})"
+
+
+class SweepResult:
+    """Columnar results of a :py:class:`Sweep`, all arrays are ordered like the cases."""
+
+    def __init__(
+        self,
+        parameters: Dict[str, np.ndarray],
+        values: Dict[str, np.ndarray],
+        errors: List[Optional[BaseException]],
+        error_tracebacks: List[Optional[str]],
+    ):
+        self.parameters = parameters
+        """Parameter values of the cases by axis path."""
+
+        self.values = values
+        """Collected values of the cases by path, ``nan`` (or ``None`` for non-numeric values) for failed cases."""
+
+        self.errors = errors
+        """Exceptions raised for the cases, ``None`` for successful ones."""
+
+        self.error_tracebacks = error_tracebacks
+        """Formatted tracebacks of the exceptions raised for the cases."""
+
+    @property
+    def ok(self) -> np.ndarray:
+        """Boolean mask of successfully solved cases."""
+        return np.array([e is None for e in self.errors], dtype=bool)
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Parameters and collected values in one dictionary, suitable for creating data frames."""
+        return self.parameters | self.values
+
+    def __len__(self):
+        return len(self.errors)
+
+    def __repr__(self):
+        return f"SweepResult({len(self)} cases, {int(np.sum(self.ok))} ok)"
+
+
+def _neighbour_order(cases: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """Order cases greedily by nearest neighbours in normalized parameter space."""
+    points = (cases - lower) / np.where(upper > lower, upper - lower, 1)
+    remaining = np.ones(len(points), dtype=bool)
+    order = np.empty(len(points), dtype=int)
+
+    current = 0
+    for i in range(len(points)):
+        order[i] = current
+        remaining[current] = False
+        if i == len(points) - 1:
+            break
+        distances = np.sum((points - points[current]) ** 2, axis=1)
+        distances[~remaining] = np.inf
+        current = int(np.argmin(distances))
+
+    return order
+
+
+def _solve_sweep_chunk(
+    token: str,
+    pickled_template: Optional[bytes],
+    items: List[Tuple[int, Sequence]],
+    paths: List[str],
+    collect: List[str],
+    warm_start: bool,
+) -> List[Tuple[int, Optional[list], Optional[BaseException], Optional[str]]]:
+    template_sequence, template_profile = _worker_template(token, pickled_template)
+    sequence = copy.deepcopy(template_sequence)
+    sequence.partial_solve = warm_start
+    snapshot = None
+
+    results = []
+    for index, case in items:
+        in_profile = copy.copy(template_profile)
+
+        try:
+            for path, value in zip(paths, case):
+                if path.startswith(IN_PROFILE_PREFIX):
+                    setattr(in_profile, path[len(IN_PROFILE_PREFIX) :], value)
+                else:
+                    setattr(*_resolve(sequence, path), value)
+
+            if snapshot is not None:
+                sequence.warm_start_from(snapshot)
+
+            sequence.solve(in_profile)
+            values = [getattr(*_resolve(sequence, path)) for path in collect]
+        except Exception as e:
+            results.append((index, None, _picklable_error(e), traceback.format_exc()))
+            sequence = copy.deepcopy(template_sequence)
+            sequence.partial_solve = warm_start
+            snapshot = None
+        else:
+            results.append((index, values, None, None))
+            if warm_start:
+                snapshot = sequence.snapshot()
+
+    return results
+
+
+def _column(values: list, ok: np.ndarray) -> np.ndarray:
+    successful = [v for v, o in zip(values, ok) if o]
+    if all(isinstance(v, (float, int, np.number, np.bool_)) for v in successful):
+        return np.array([v if o else np.nan for v, o in zip(values, ok)], dtype=float)
+
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+class Sweep:
+    """
+    Parameter study of a pass sequence over several axes, like gaps, roll radii, rotational frequencies and
+    incoming profile properties. Cases are generated as full-factorial or Latin hypercube designs and solved in
+    parallel, with neighbouring cases solved consecutively on the same copy of the sequence to benefit from warm
+    starts and partial re-solving (see :py:meth:`Unit.warm_start_from` and :py:attr:`PassSequence.partial_solve`).
+    """
+
+    def __init__(
+        self,
+        sequence: "PassSequence",
+        in_profile: Profile,
+        axes: Iterable[SweepAxis] = (),
+        collect: Iterable[str] = (),
+    ):
+        """
+        :param sequence: the base sequence, it is not modified
+        :param in_profile: the base incoming profile, it is not modified
+        :param axes: the parameter axes
+        :param collect: dotted paths of values to collect after solution, like ``"Oval I.roll_force"``,
+            ``"Oval I.out_profile.filling_ratio"`` or ``"power"``, resolved like the axis paths
+        """
+        self.sequence = sequence
+        """The base sequence."""
+
+        self.in_profile = in_profile
+        """The base incoming profile."""
+
+        self.axes: List[SweepAxis] = list(axes)
+        """The parameter axes."""
+
+        self.collect: List[str] = list(collect)
+        """Dotted paths of values to collect."""
+
+    def add_axis(self, path: str, values: Optional[Iterable] = None, bounds: Optional[Tuple[float, float]] = None):
+        """Add a parameter axis, see :py:class:`SweepAxis` for the arguments."""
+        self.axes.append(SweepAxis(path, values, bounds))
+        return self
+
+    def full_factorial(self) -> np.ndarray:
+        """Generate all combinations of the axis values, one case per row."""
+        missing = [a.path for a in self.axes if a.values is None]
+        if missing:
+            raise ValueError(f"Axes without discrete values can not be used in full-factorial designs: {missing}")
+        return np.array(list(itertools.product(*(a.values for a in self.axes))), dtype=float)
+
+    def latin_hypercube(self, count: int, seed: Optional[int] = None) -> np.ndarray:
+        """Sample cases by Latin hypercube sampling within the axis bounds, one case per row."""
+        from scipy.stats import qmc
+
+        sampler = qmc.LatinHypercube(d=len(self.axes), seed=seed)
+        lower, upper = np.array([a.bounds for a in self.axes], dtype=float).T
+        return qmc.scale(sampler.random(count), lower, upper)
+
+    def run(
+        self,
+        cases: Optional[np.ndarray] = None,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        warm_start: bool = True,
+    ) -> SweepResult:
+        """
+        Solve all cases and collect the results.
+
+        :param cases: parameter values with one row per case and one column per axis, defaults to
+            :py:meth:`full_factorial`
+        :param executor: executor to submit chunks of cases to, a process pool is created if omitted
+            (see :py:meth:`PassSequence.solve_batch`)
+        :param max_workers: count of worker processes of the created pool, also used to determine the chunk size
+        :param chunk_size: count of neighbouring cases solved consecutively per submitted task,
+            chosen to give 2 chunks per worker if omitted
+        :param warm_start: whether to seed each case with the solution of the previous case in the same chunk
+        """
+        if cases is None:
+            cases = self.full_factorial()
+        cases = np.atleast_2d(cases)
+
+        if cases.shape[1] != len(self.axes):
+            raise ValueError(f"Cases must have one column per axis ({len(self.axes)}).")
+
+        lower, upper = np.array([a.bounds for a in self.axes], dtype=float).T
+        order = _neighbour_order(cases.astype(float), lower, upper) if len(cases) else np.arange(0)
+        items = [(int(i), tuple(cases[i])) for i in order]
+
+        chunk_size = chunk_size or default_chunk_size(len(items), max_workers, 2)
+        chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+        paths = [a.path for a in self.axes]
+        values: List[Any] = [[None] * len(cases) for _ in self.collect]
+        errors: List[Optional[BaseException]] = [None] * len(cases)
+        tracebacks: List[Optional[str]] = [None] * len(cases)
+
+        for chunk, chunk_results in run_chunked(
+            (self.sequence, self.in_profile),
+            _solve_sweep_chunk,
+            chunks,
+            executor,
+            max_workers,
+            paths,
+            self.collect,
+            warm_start,
+        ):
+            if isinstance(chunk_results, Exception):
+                for index, _ in chunk:
+                    errors[index] = chunk_results
+                    tracebacks[index] = _format_error(chunk_results)
+                continue
+
+            for index, case_values, error, error_traceback in chunk_results:
+                errors[index] = error
+                tracebacks[index] = error_traceback
+                if case_values is not None:
+                    for column, value in zip(values, case_values):
+                        column[index] = value
+
+        ok = np.array([e is None for e in errors], dtype=bool)
+
+        return SweepResult(
+            parameters={p: cases[:, i] for i, p in enumerate(paths)},
+            values={p: _column(v, ok) for p, v in zip(self.collect, values)},
+            errors=errors,
+            error_tracebacks=tracebacks,
+        )
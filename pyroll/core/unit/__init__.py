@@ -1,5 +1,24 @@
 from .unit import Unit
+from .snapshot import UnitSnapshot
+from .record import UnitRecord
+from .convergence import ConvergenceHistory, SolutionStatus, SolutionDivergedError, DivergenceMonitor
+from .profiling import SolveProfiler, SolveProfileNode
+from .acceleration import IterationAccelerator, UnderRelaxation, AitkenAcceleration, AndersonAcceleration
 
 from . import hookimpls  # noqa: F401
 
-__all__ = ["Unit"]
+__all__ = [
+    "Unit",
+    "UnitSnapshot",
+    "UnitRecord",
+    "ConvergenceHistory",
+    "SolutionStatus",
+    "SolutionDivergedError",
+    "DivergenceMonitor",
+    "SolveProfiler",
+    "SolveProfileNode",
+    "IterationAccelerator",
+    "UnderRelaxation",
+    "AitkenAcceleration",
+    "AndersonAcceleration",
+]
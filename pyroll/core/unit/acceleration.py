@@ -0,0 +1,225 @@
+import copy
+from typing import Optional, Union, Dict, Type
+
+import numpy as np
+
+__all__ = [
+    "IterationAccelerator",
+    "UnderRelaxation",
+    "AitkenAcceleration",
+    "AndersonAcceleration",
+    "create_accelerator",
+]
+
+
+class IterationAccelerator:
+    """
+    Base class for strategies accelerating the fixed point iteration of :py:meth:`Unit.solve`.
+
+    In each iteration the accelerator gets the vector of root hook values the iteration was started with and the
+    vector of values obtained by evaluating the root hooks and returns the vector to start the next iteration with.
+    The base class performs plain fixed point iteration.
+
+    Extrapolated values are bounded by :py:meth:`_bounded`, so that values do not change their sign and stay within
+    :py:attr:`max_extrapolation` times the range spanned by the input and output value.
+    """
+
+    max_extrapolation = 2.0
+    """Factor bounding extrapolated values relative to the input and output values."""
+
+    def reset(self):
+        """Forget all state of a previous solution loop."""
+
+    def __call__(self, inputs: np.ndarray, outputs: np.ndarray) -> np.ndarray:
+        """
+        Compute the values to start the next iteration with.
+
+        :param inputs: the root hook values the current iteration was started with
+        :param outputs: the root hook values obtained in the current iteration
+        :return: the root hook values to start the next iteration with
+        """
+        return outputs
+
+    def _applicable(self, inputs, outputs) -> bool:
+        return (
+            np.shape(inputs) == np.shape(outputs)
+            and not np.iscomplexobj(outputs)
+            and np.all(np.isfinite(inputs))
+            and np.all(np.isfinite(outputs))
+        )
+
+    def _bounded(self, inputs, outputs, result):
+        """
+        Clip extrapolated values of elements, whose input and output have the same sign, to the interval
+        ``[min / max_extrapolation, max * max_extrapolation]`` of their magnitudes, keeping the sign.
+        Geometric values like lengths or areas stay positive so.
+        """
+        same_sign = np.sign(inputs) == np.sign(outputs)
+        sign = np.sign(outputs)
+        low = np.minimum(np.abs(inputs), np.abs(outputs)) / self.max_extrapolation
+        high = np.maximum(np.abs(inputs), np.abs(outputs)) * self.max_extrapolation
+        bounded = sign * np.clip(np.abs(result) * (np.sign(result) == sign), low, high)
+        return np.where(same_sign & (sign != 0), bounded, result)
+
+
+class UnderRelaxation(IterationAccelerator):
+    """Constant under-relaxation of the fixed point iteration: ``x + factor * (g(x) - x)``."""
+
+    def __init__(self, factor: float = 0.5):
+        if not 0 < factor <= 1:
+            raise ValueError("The relaxation factor must be in the interval (0, 1].")
+        self.factor = factor
+        """Relaxation factor, 1 equals plain fixed point iteration."""
+
+    def __call__(self, inputs, outputs):
+        if not self._applicable(inputs, outputs):
+            return outputs
+        return inputs + self.factor * (outputs - inputs)
+
+
+class AitkenAcceleration(IterationAccelerator):
+    """
+    Dynamic relaxation using the vector form of Aitken's delta-squared process (Irons-Tuck).
+    The relaxation factor is updated in each iteration from the change of the last two residual vectors,
+    which are scaled by the magnitudes of the first iterate.
+    If the residual grows, the factor is reset and a plain fixed point step is done.
+    """
+
+    def __init__(self, initial_factor: float = 0.5, max_factor: float = 10.0):
+        self.initial_factor = initial_factor
+        """Relaxation factor used in the first accelerated iteration."""
+
+        self.max_factor = max_factor
+        """Upper bound of the relaxation factor to keep the iteration stable, the lower bound is its reciprocal."""
+
+        self.reset()
+
+    def reset(self):
+        self._factor = self.initial_factor
+        self._scale: Optional[np.ndarray] = None
+        self._previous_residual: Optional[np.ndarray] = None
+
+    def __call__(self, inputs, outputs):
+        if not self._applicable(inputs, outputs) or (self._scale is not None and self._scale.shape != np.shape(inputs)):
+            self.reset()
+            return outputs
+
+        if self._scale is None:
+            self._scale = 1 / (np.abs(inputs) + 1e-12)
+
+        residual = (outputs - inputs) * self._scale
+
+        if self._previous_residual is not None:
+            if np.dot(residual, residual) > np.dot(self._previous_residual, self._previous_residual):
+                # the iteration does not contract with the current factor, restart with a plain step
+                self.reset()
+                return outputs
+
+            delta = residual - self._previous_residual
+            denominator = np.dot(delta, delta)
+
+            if denominator > 0:
+                self._factor = float(
+                    np.clip(
+                        -self._factor * np.dot(self._previous_residual, delta) / denominator,
+                        1 / self.max_factor,
+                        self.max_factor,
+                    )
+                )
+
+        self._previous_residual = residual
+        return self._bounded(inputs, outputs, inputs + self._factor * residual / self._scale)
+
+
+class AndersonAcceleration(IterationAccelerator):
+    """
+    Anderson mixing of the last iterates.
+    The next iterate is the combination of the stored iterates minimizing the scaled residual in least squares sense.
+    If the residual grows, the stored iterates are dropped and a plain fixed point step is done.
+    """
+
+    def __init__(self, memory: int = 5, mixing: float = 1.0):
+        if memory < 1:
+            raise ValueError("The memory must be at least 1.")
+        self.memory = memory
+        """Count of previous iterations to consider."""
+
+        self.mixing = mixing
+        """Mixing (damping) factor applied to the residual, 1 means no damping."""
+
+        self.reset()
+
+    def reset(self):
+        self._inputs = []
+        self._residuals = []
+
+    def __call__(self, inputs, outputs):
+        if not self._applicable(inputs, outputs) or (self._inputs and self._inputs[-1].shape != inputs.shape):
+            self.reset()
+            return outputs
+
+        scale = 1 / (np.abs(inputs) + 1e-12)
+        residual = outputs - inputs
+
+        if self._residuals and np.linalg.norm(residual * scale) > np.linalg.norm(self._residuals[-1] * scale):
+            # the mixing did not reduce the residual, restart with a plain step
+            self.reset()
+            return outputs
+
+        self._inputs.append(inputs)
+        self._residuals.append(residual)
+        if len(self._inputs) > self.memory + 1:
+            del self._inputs[0]
+            del self._residuals[0]
+
+        if len(self._inputs) < 2:
+            return inputs + self.mixing * residual
+
+        delta_inputs = np.diff(np.stack(self._inputs, axis=1), axis=1)
+        delta_residuals = np.diff(np.stack(self._residuals, axis=1), axis=1)
+
+        gamma, *_ = np.linalg.lstsq(delta_residuals * scale[:, None], residual * scale, rcond=None)
+
+        result = inputs + self.mixing * residual - (delta_inputs + self.mixing * delta_residuals) @ gamma
+
+        if not np.all(np.isfinite(result)):
+            self.reset()
+            return outputs
+
+        return self._bounded(inputs, outputs, result)
+
+
+_ACCELERATORS: Dict[str, Type[IterationAccelerator]] = {
+    "none": IterationAccelerator,
+    "relaxation": UnderRelaxation,
+    "aitken": AitkenAcceleration,
+    "anderson": AndersonAcceleration,
+}
+
+
+def create_accelerator(spec: Union[str, IterationAccelerator, None]) -> Optional[IterationAccelerator]:
+    """
+    Create a fresh accelerator from a specification.
+
+    :param spec: either one of the names ``"none"``, ``"relaxation"``, ``"aitken"``, ``"anderson"``
+        or an accelerator instance to use as template (it is copied, so it can be shared between units)
+    :return: a reset accelerator or ``None`` if no acceleration shall be applied
+    """
+    if spec is None:
+        return None
+
+    if isinstance(spec, IterationAccelerator):
+        accelerator = copy.copy(spec)
+        accelerator.reset()
+        return accelerator
+
+    try:
+        cls = _ACCELERATORS[spec.lower()]
+    except (KeyError, AttributeError):
+        raise ValueError(
+            f"Unknown iteration acceleration {spec!r}, valid names are: {', '.join(_ACCELERATORS)}."
+        ) from None
+
+    if cls is IterationAccelerator:
+        return None
+    return cls()
@@ -0,0 +1,190 @@
+from typing import Dict, Any, Iterator, Union, List, Optional
+
+import numpy as np
+
+__all__ = ["ConvergenceHistory", "SolutionStatus", "SolutionDivergedError", "DivergenceMonitor"]
+
+
+class ConvergenceHistory:
+    """
+    Bounded record of the residua of a unit's solution loop iterations, backed by a ring buffer.
+    Only the last :py:attr:`size` iterations are kept, a size of 0 disables recording,
+    while :py:attr:`total_count` and :py:attr:`last_residuum` are always maintained.
+
+    Iterating or indexing yields dictionaries with the keys ``"iteration"``, ``"residuum"`` and ``"label"``.
+    """
+
+    def __init__(self, label: str = "", size: int = 0):
+        self.label = label
+        """Label of the unit the history belongs to."""
+
+        self.total_count = 0
+        """Count of all iterations recorded since creation or the last call of :py:meth:`clear`."""
+
+        self.last_residuum = np.nan
+        """Residuum of the last iteration."""
+
+        self._iterations = np.empty(size, dtype=np.int64)
+        self._residua = np.empty(size, dtype=float)
+        self._next = 0
+        self._count = 0
+
+    @property
+    def size(self) -> int:
+        """Maximum count of iterations kept, setting it keeps the latest entries."""
+        return len(self._residua)
+
+    @size.setter
+    def size(self, value: int):
+        if value < 0:
+            raise ValueError("The size must not be negative.")
+        keep = min(self._count, value)
+        iterations = self.iterations[self._count - keep :]
+        residua = self.residua[self._count - keep :]
+
+        self._iterations = np.empty(value, dtype=np.int64)
+        self._residua = np.empty(value, dtype=float)
+        self._iterations[:keep] = iterations
+        self._residua[:keep] = residua
+        self._count = keep
+        self._next = keep % value if value else 0
+
+    def append(self, iteration: int, residuum: float):
+        """Record an iteration."""
+        self.total_count += 1
+        self.last_residuum = residuum
+
+        size = len(self._residua)
+        if not size:
+            return
+
+        self._iterations[self._next] = iteration
+        self._residua[self._next] = residuum
+        self._next = (self._next + 1) % size
+        self._count = min(self._count + 1, size)
+
+    def clear(self):
+        """Remove all records and reset the counters."""
+        self.total_count = 0
+        self.last_residuum = np.nan
+        self._next = 0
+        self._count = 0
+
+    def _ordered(self, array: np.ndarray) -> np.ndarray:
+        if self._count < len(array):
+            return array[: self._count].copy()
+        return np.roll(array, -self._next)
+
+    @property
+    def iterations(self) -> np.ndarray:
+        """Iteration numbers of the kept records, oldest first."""
+        return self._ordered(self._iterations)
+
+    @property
+    def residua(self) -> np.ndarray:
+        """Residua of the kept records, oldest first."""
+        return self._ordered(self._residua)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i, r in zip(self.iterations, self.residua):
+            yield {"iteration": int(i), "residuum": float(r), "label": self.label}
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        entries = list(self)
+        return entries[item]
+
+    def __repr__(self):
+        return f"ConvergenceHistory({self._count} of {self.total_count} iterations kept)"
+
+
+class SolutionStatus:
+    """Structured outcome of a unit's solution loop."""
+
+    CONVERGED = "converged"
+    MAX_ITERATIONS = "max_iterations"
+    DIVERGED = "diverged"
+    STAGNATED = "stagnated"
+
+    def __init__(self, reason: str, iterations: int, residuum: float):
+        self.reason = reason
+        """One of ``"converged"``, ``"max_iterations"``, ``"diverged"`` or ``"stagnated"``."""
+
+        self.iterations = iterations
+        """Count of iterations performed."""
+
+        self.residuum = residuum
+        """Residuum of the last iteration."""
+
+    @property
+    def converged(self) -> bool:
+        """Whether the solution loop converged."""
+        return self.reason == self.CONVERGED
+
+    def __bool__(self):
+        return self.converged
+
+    def __repr__(self):
+        return f"SolutionStatus({self.reason!r}, iterations={self.iterations}, residuum={self.residuum:.3g})"
+
+
+class SolutionDivergedError(RuntimeError):
+    """Raised if the solution loop of a unit diverges or stagnates and the divergence policy is ``"abort"``."""
+
+    def __init__(self, message: str, status: SolutionStatus):
+        super().__init__(message)
+        self.status = status
+        """The status of the aborted solution."""
+
+
+class DivergenceMonitor:
+    """
+    Monitors the trend of the residua of a solution loop.
+    Reports divergence if the residuum grew in a row for ``growth_count`` iterations and stagnation
+    (including oscillation) if the best residuum did not improve by ``improvement`` within ``patience`` iterations.
+    """
+
+    def __init__(self, growth_count: int = 3, patience: int = 10, improvement: float = 0.9):
+        self.growth_count = growth_count
+        """Count of consecutive growing residua considered as divergence."""
+
+        self.patience = patience
+        """Count of iterations without sufficient improvement considered as stagnation."""
+
+        self.improvement = improvement
+        """Factor the best residuum must be reduced by to count as improvement."""
+
+        self.reset()
+
+    def reset(self):
+        """Forget the residua observed so far."""
+        self._last = np.inf
+        self._growing = 0
+        self._best = np.inf
+        self._since_best = 0
+
+    def update(self, residuum: float) -> Optional[str]:
+        """
+        Observe the residuum of an iteration.
+
+        :return: ``SolutionStatus.DIVERGED`` or ``SolutionStatus.STAGNATED`` if detected, else ``None``
+        """
+        if not np.isfinite(residuum):
+            return None
+
+        self._growing = self._growing + 1 if residuum > self._last else 0
+        self._last = residuum
+
+        if residuum < self._best * self.improvement:
+            self._best = residuum
+            self._since_best = 0
+        else:
+            self._since_best += 1
+
+        if self._growing >= self.growth_count:
+            return SolutionStatus.DIVERGED
+        if self._since_best >= self.patience:
+            return SolutionStatus.STAGNATED
+        return None
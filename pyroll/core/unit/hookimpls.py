@@ -7,6 +7,21 @@ def default_iteration_precision(self: Unit):
     return Config.DEFAULT_ITERATION_PRECISION
 
 
+@Unit.iteration_acceleration
+def default_iteration_acceleration(self: Unit):
+    return Config.DEFAULT_ITERATION_ACCELERATION
+
+
+@Unit.divergence_policy
+def default_divergence_policy(self: Unit):
+    return Config.DEFAULT_DIVERGENCE_POLICY
+
+
+@Unit.warm_start
+def default_warm_start(self: Unit):
+    return Config.WARM_START
+
+
 @Unit.max_iteration_count
 def default_max_iteration_count(self: Unit):
     return Config.DEFAULT_MAX_ITERATION_COUNT
@@ -0,0 +1,240 @@
+import json
+import threading
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Optional, List, Dict, Any, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .unit import Unit
+
+__all__ = ["SolveProfiler", "SolveProfileNode"]
+
+PHASES = ("init", "pre_processors", "subunits", "reevaluate_cache", "root_hook_results", "post_processors")
+"""Names of the timed phases of a unit's solution."""
+
+_active_solve_profiler: ContextVar[Optional["SolveProfiler"]] = ContextVar("pyroll_core_solve_profiler", default=None)
+
+_NOT_PROFILED = nullcontext()
+
+
+class SolveProfileNode:
+    """Timings of a single solution of a unit, with the nodes of the units solved within as children."""
+
+    def __init__(self, unit: "Unit", index: Optional[int] = None):
+        self.label: str = unit.label or type(unit).__qualname__
+        """Label of the unit, its type name if unlabeled."""
+
+        self.type: str = type(unit).__qualname__
+        """Qualified name of the unit's type."""
+
+        self.index = index
+        """Index of the unit within its parent's subunits, ``None`` if not a subunit."""
+
+        self.iterations = 0
+        """Count of iterations of the unit's solution loop."""
+
+        self.total_time = 0.0
+        """Wall time of the whole solution in seconds."""
+
+        self.phase_times: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        """
+        Cumulative wall time per phase in seconds.
+        ``"init"`` includes ``"pre_processors"`` and ``"subunits"`` includes the times of the subunits' nodes.
+        """
+
+        self.children: List[SolveProfileNode] = []
+        """Nodes of the units solved within this solution (subunits, pre- and post-processors)."""
+
+    @property
+    def self_time(self) -> float:
+        """Wall time of the solution excluding the solutions of the children."""
+        return self.total_time - sum(c.total_time for c in self.children)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Context manager adding the elapsed time to the given phase."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] += perf_counter() - start
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, "SolveProfileNode"]]:
+        """Iterate over this node and all descendants depth-first, yielding tuples of depth and node."""
+        yield depth, self
+        for c in self.children:
+            yield from c.walk(depth + 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the node and its descendants as nested dict."""
+        return {
+            "label": self.label,
+            "type": self.type,
+            "index": self.index,
+            "iterations": self.iterations,
+            "total_time": self.total_time,
+            "self_time": self.self_time,
+            "phases": dict(self.phase_times),
+            "children": [c.to_dict() for c in self.children],
+        }
+
+    def _folded(self, stack: str, lines: Dict[str, float]):
+        frame = self.label.replace(";", ",")  # semicolons separate frames
+        stack = f"{stack};{frame}" if stack else frame
+        own = [
+            ("reevaluate_cache", self.phase_times["reevaluate_cache"]),
+            ("root_hook_results", self.phase_times["root_hook_results"]),
+        ]
+        rest = self.self_time - sum(t for _, t in own)
+
+        for name, t in own + [("self", rest)]:
+            key = f"{stack};{name}"
+            lines[key] = lines.get(key, 0.0) + t
+
+        for c in self.children:
+            c._folded(stack, lines)
+
+    def __repr__(self):
+        return f"SolveProfileNode({self.label!r}, total_time={self.total_time:.6f})"
+
+
+class SolveProfiler:
+    """
+    Opt-in profiler recording a tree of timings of unit solutions in the current context,
+    including the nested solutions of subunits like roll passes within sequences or disk elements within roll passes.
+
+    Use it as context manager around the code to profile::
+
+        with SolveProfiler() as profiler:
+            sequence.solve(in_profile)
+
+        print(profiler.to_table())
+    """
+
+    def __init__(self):
+        self.roots: List[SolveProfileNode] = []
+        """Nodes of the top-level solutions recorded."""
+
+        self._local = threading.local()
+        self._tokens = []
+
+    @property
+    def _stack(self) -> List[SolveProfileNode]:
+        """Stack of the nodes currently recorded, per thread."""
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    @contextmanager
+    def _nested_in(self, node: Optional[SolveProfileNode]):
+        """Record solutions in the current thread as children of the given node, for solutions in other threads."""
+        previous = self._stack
+        self._local.stack = [node] if node is not None else []
+        try:
+            yield
+        finally:
+            self._local.stack = previous
+
+    def __enter__(self):
+        self._tokens.append(_active_solve_profiler.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active_solve_profiler.reset(self._tokens.pop())
+
+    def clear(self):
+        """Discard all recorded timings."""
+        self.roots.clear()
+
+    @contextmanager
+    def _record(self, unit: "Unit"):
+        parent = self._stack[-1] if self._stack else None
+        index = None
+        if parent is not None and unit.parent is not None:
+            try:
+                index = unit.parent.subunits.position_of(unit)
+            except ValueError:  # not contained, like pre- and post-processors
+                pass
+
+        node = SolveProfileNode(unit, index)
+        (parent.children if parent is not None else self.roots).append(node)
+
+        self._stack.append(node)
+        start = perf_counter()
+        try:
+            yield node
+        finally:
+            node.total_time = perf_counter() - start
+            node.iterations = unit.iteration
+            self._stack.pop()
+
+    def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the recorded timings as dict of nested node dicts."""
+        return {"roots": [r.to_dict() for r in self.roots]}
+
+    def to_json(self, **kwargs) -> str:
+        """Return the recorded timings as JSON string. Keyword arguments are passed to ``json.dumps``."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_flamegraph(self) -> str:
+        """
+        Return the recorded timings in the folded stack format understood by flamegraph tools
+        (like ``flamegraph.pl`` or speedscope), one line per stack with the time in microseconds.
+        Stacks of units with equal labels are merged.
+        """
+        lines: Dict[str, float] = {}
+        for r in self.roots:
+            r._folded("", lines)
+        return "\n".join(f"{k} {round(v * 1e6)}" for k, v in lines.items())
+
+    def to_table(self) -> str:
+        """Return the recorded timings as human-readable plain text tree."""
+        lines = [
+            f"{'iter':>5} {'total [s]':>10} {'self [s]':>10} {'init [s]':>10} {'cache [s]':>10} {'roots [s]':>10}  unit"
+        ]
+        for r in self.roots:
+            for depth, n in r.walk():
+                lines.append(
+                    f"{n.iterations:>5d} {n.total_time:>10.6f} {n.self_time:>10.6f} {n.phase_times['init']:>10.6f}"
+                    f" {n.phase_times['reevaluate_cache']:>10.6f} {n.phase_times['root_hook_results']:>10.6f}"
+                    f"  {'  ' * depth}{n.label}"
+                )
+        return "\n".join(lines)
+
+
+def profile_solve(unit: "Unit"):
+    """Context manager recording a node for the solution of the unit if a profiler is active."""
+    profiler = _active_solve_profiler.get()
+    if profiler is None:
+        return _NOT_PROFILED
+    return profiler._record(unit)
+
+
+def current_solve_profile_node() -> Optional[SolveProfileNode]:
+    """The innermost node recorded in the current thread by the active profiler, if any."""
+    profiler = _active_solve_profiler.get()
+    if profiler is None or not profiler._stack:
+        return None
+    return profiler._stack[-1]
+
+
+def nested_in_profile_node(node: Optional[SolveProfileNode]):
+    """
+    Context manager recording solutions in the current thread as children of the given node,
+    if a profiler is active. Used for solutions continued in another thread.
+    """
+    profiler = _active_solve_profiler.get()
+    if profiler is None:
+        return _NOT_PROFILED
+    return profiler._nested_in(node)
+
+
+def profile_phase(name: str):
+    """Context manager adding the elapsed time to the given phase of the innermost recorded solution, if any."""
+    profiler = _active_solve_profiler.get()
+    if profiler is None or not profiler._stack:
+        return _NOT_PROFILED
+    return profiler._stack[-1].phase(name)
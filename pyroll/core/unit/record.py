@@ -0,0 +1,92 @@
+from typing import Dict, Any, Iterable, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .unit import Unit
+
+__all__ = ["UnitRecord"]
+
+
+class UnitRecord:
+    """
+    Compact record of a finished unit solution as yielded by :py:meth:`Unit.solve_iter`.
+    Holds no references to the unit tree, so it can be stored or sent elsewhere without keeping the tree alive.
+    """
+
+    def __init__(self, unit: "Unit", depth: int, hooks: Iterable[str], iteration: Optional[int] = None):
+        self.label: str = unit.label
+        """Label of the unit."""
+
+        self.type: str = type(unit).__qualname__
+        """Qualified name of the unit's type."""
+
+        self.path: Tuple[str, ...] = self._path(unit, depth)
+        """Labels (or indices if unlabeled) of the unit and its parents below the solved unit."""
+
+        self.depth = depth
+        """Nesting depth below the unit ``solve_iter`` was called on, 0 for that unit itself."""
+
+        parent = unit.parent if depth else None
+        self.parent_iteration: Optional[int] = parent.iteration if parent is not None else None
+        """Iteration of the parent's solution loop this record belongs to, ``None`` for the top unit."""
+
+        self.iteration: Optional[int] = iteration
+        """Iteration of the solution loop of the unit ``solve_iter`` was called on this record belongs to,
+        for that unit itself the last iteration."""
+
+        self.iterations: int = unit.iteration
+        """Count of iterations needed by the unit's solution loop."""
+
+        self.residuum: float = unit.convergence_history.last_residuum
+        """Residuum of the last iteration."""
+
+        self.duration: Optional[float] = unit.solve_duration
+        """Wall time of the unit's solution in seconds."""
+
+        self.status = unit.solution_status
+        """Outcome of the unit's solution loop."""
+
+        self.reused: bool = unit.solution_reused
+        """Whether the last solution of the unit was reused instead of solving it again
+        (see :py:attr:`Unit.solution_reused`), the other entries describe that last solution then."""
+
+        self.values: Dict[str, Any] = {}
+        """Collected hook values by name."""
+
+        for name in hooks:
+            try:
+                owner = unit
+                *owners, attr = name.split(".")
+                for o in owners:
+                    owner = getattr(owner, o)
+                self.values[name] = getattr(owner, attr)
+            except (AttributeError, ValueError, IndexError, TypeError):
+                continue
+
+    @staticmethod
+    def _path(unit: "Unit", depth: int) -> Tuple[str, ...]:
+        path = []
+        for _ in range(depth):
+            parent = unit.parent
+            path.append(unit.label or str(parent.subunits.position_of(unit)))
+            unit = parent
+        return tuple(reversed(path))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Flat dictionary of the record, with the hook values as additional entries."""
+        return dict(
+            label=self.label,
+            type=self.type,
+            path="/".join(self.path),
+            depth=self.depth,
+            parent_iteration=self.parent_iteration,
+            iteration=self.iteration,
+            iterations=self.iterations,
+            residuum=self.residuum,
+            duration=self.duration,
+            converged=self.status.converged if self.status is not None else None,
+            reused=self.reused,
+            **self.values,
+        )
+
+    def __repr__(self):
+        return f"UnitRecord({'/'.join(self.path) or self.label!r}, iterations={self.iterations})"
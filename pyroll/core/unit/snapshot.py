@@ -0,0 +1,65 @@
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from ..hooks import root_hooks
+
+if TYPE_CHECKING:
+    from .unit import Unit
+
+__all__ = ["UnitSnapshot"]
+
+
+class UnitSnapshot:
+    """
+    Stores the explicitly set root hook values of a unit, its out profile and further hosts like roll and engine,
+    to seed later solutions of the same unit (warm start).
+    Use :py:meth:`Unit.snapshot` to create instances and :py:meth:`Unit.warm_start_from` to use them.
+    """
+
+    def __init__(self, unit: "Unit", recursive: bool = True):
+        self.unit_type = type(unit)
+        """Type of the unit the snapshot was taken from."""
+
+        self.host_values: List[Dict[str, Any]] = [self._root_hook_values(h) for h in unit._warm_start_hosts()]
+        """Explicitly set root hook values for each host of the unit except the in profile."""
+
+        old_results = unit._old_results
+        self.results: Optional[np.ndarray] = np.copy(old_results) if np.ndim(old_results) == 1 else None
+        """Vector of root hook results of the last iteration."""
+
+        self.subunits: List[UnitSnapshot] = (
+            [UnitSnapshot(u, recursive=True) for u in unit.subunits] if recursive and unit.subunits else []
+        )
+        """Snapshots of the subunits, empty if not taken recursively."""
+
+    @staticmethod
+    def _root_hook_values(host) -> Dict[str, Any]:
+        if host is None:
+            return {}
+        explicit = host.__dict__
+        return {h.name: explicit[h.name] for h in root_hooks.for_class(type(host)) if h.name in explicit}
+
+    def apply(self, unit: "Unit"):
+        """
+        Seed the given unit with the stored values.
+        Subunit snapshots are queued to be applied on the next solution of the respective subunits.
+
+        :raises ValueError: if the unit is not of the same type as the snapshot origin
+        """
+        if type(unit) is not self.unit_type:
+            raise ValueError(f"Snapshot of a {self.unit_type.__qualname__} can not be applied to {unit}.")
+
+        for host, values in zip(unit._warm_start_hosts(), self.host_values):
+            if host is None:
+                continue
+            for name, value in values.items():
+                setattr(host, name, value)
+
+        if self.results is not None:
+            unit._old_results = np.copy(self.results)
+
+        if self.subunits and unit.subunits and len(self.subunits) == len(unit.subunits):
+            for subunit, snapshot in zip(unit.subunits, self.subunits):
+                if type(subunit) is snapshot.unit_type:
+                    subunit._pending_snapshot = snapshot
@@ -1,15 +1,36 @@
+import contextvars
 import copy
 import weakref
-from typing import Optional, Sequence, List, Iterable, SupportsIndex, Union, Callable, Self
+from contextlib import nullcontext
+from typing import Optional, Sequence, List, Iterable, Iterator, SupportsIndex, Union, Callable, Self, Tuple, Dict
 
 import numpy as np
 
-from ..hooks import HookHost, Hook
+from ..config import Config
+from ..hooks import HookHost, Hook, track_dependencies, _values_equal, _registry_state
 from ..profile import Profile as BaseProfile
+from .acceleration import IterationAccelerator, UnderRelaxation, create_accelerator
+from .snapshot import UnitSnapshot
+from .record import UnitRecord
+from .convergence import ConvergenceHistory, SolutionStatus, SolutionDivergedError, DivergenceMonitor
+from .profiling import profile_solve, profile_phase
 from timeit import default_timer as timer
 
 __all__ = ["Unit"]
 
+MIN_DAMPING_FACTOR = 0.05
+
+INPUT_HOSTS = ("in_profile",)
+"""Names of root hook hosts holding inputs of a unit rather than iterates, excluded from iteration acceleration."""
+
+
+def _public_values(host) -> dict:
+    return {k: v for k, v in host.__dict__.items() if not k.startswith("_")}
+
+
+def _public_values_changed(old: dict, new: dict) -> bool:
+    return old.keys() != new.keys() or not all(_values_equal(v, old[k]) for k, v in new.items())
+
 
 class Unit(HookHost):
     """Base class for units."""
@@ -20,6 +41,18 @@ class Unit(HookHost):
     iteration_precision = Hook[float]()
     """Precision of iteration break in solution loop."""
 
+    iteration_acceleration = Hook[Union[str, IterationAccelerator]]()
+    """Strategy to accelerate the solution loop, either a name (``"none"``, ``"relaxation"``, ``"aitken"``,
+    ``"anderson"``) or an :py:class:`IterationAccelerator` instance."""
+
+    divergence_policy = Hook[str]()
+    """Policy applied if the solution loop diverges or stagnates: ``"ignore"`` (run until the maximum iteration
+    count), ``"abort"`` (raise :py:class:`SolutionDivergedError`), ``"damp"`` (continue with increasing
+    under-relaxation) or ``"mark"`` (stop and report in :py:attr:`solution_status`)."""
+
+    warm_start = Hook[bool]()
+    """Whether to seed the solution loop with the last converged solution of this unit."""
+
     length = Hook[float]()
     """The length of the unit (spacial extent in rolling direction)."""
 
@@ -53,21 +86,32 @@ class Unit(HookHost):
     post_processors: list[Callable[[Self], "Unit"]] = []
     """List of unit factories to use as post-processors to modify the out-profile returned by ``solve``."""
 
+    _solution_components: Tuple[str, ...] = ()
+    """Names of attributes holding components (like rolls), whose modification makes this unit dirty as well."""
+
     def __init__(self, label: str = "", parent=None, **kwargs):
         super().__init__()
         self.label = label
-        """Label for human identification."""
 
         self._subunits: Optional[Unit._SubUnitsList] = self._SubUnitsList(self, [])
 
         self._parent = weakref.ref(parent) if parent is not None else None
 
-        self.convergence_history = []
-        """List to store the convergence history of the unit."""
+        self.convergence_history = ConvergenceHistory(label, Config.CONVERGENCE_HISTORY_SIZE)
+        """Bounded history of the residua of the solution loop iterations, see :py:class:`ConvergenceHistory`."""
 
         self.global_iterator = 1
         """Global iterator for the convergence history."""
 
+        self.iteration = 0
+        """Number of the current (or last) iteration of the solution loop."""
+
+        self.solve_duration = None
+        """Wall time of the last solution in seconds."""
+
+        self.solution_status: Optional[SolutionStatus] = None
+        """Outcome of the last solution loop, ``None`` if not solved yet."""
+
         self.in_profile: Optional[Unit.InProfile] = None
         """The state of the incoming profile."""
 
@@ -77,6 +121,88 @@ class Unit(HookHost):
         self.__dict__.update(kwargs)
 
         self._old_results = np.nan
+        self._residual_vector: Optional[np.ndarray] = None
+
+        self._last_solution: Optional[UnitSnapshot] = None
+        self._pending_snapshot: Optional[UnitSnapshot] = None
+
+        self._dirty = True
+        self._solved_state: Optional[Tuple[dict, ...]] = None
+        self._solved_registry_state: Optional[Tuple[int, int]] = None
+        self._solved_input: Optional[dict] = None
+        self._solved_output: Optional[BaseProfile] = None
+        self._solution_reused = False
+
+    @property
+    def label(self) -> str:
+        """Label for human identification."""
+        return self.__dict__.get("label", "")
+
+    @label.setter
+    def label(self, value: str):
+        self.__dict__["label"] = value
+        if self.__dict__.get("_parent", None) is not None:
+            self._invalidate_parent_label_index()
+
+    def _invalidate_parent_label_index(self):
+        parent = self.parent
+        if parent is not None and parent._subunits is not None:
+            parent._subunits._labels = None
+
+    def _solution_state(self) -> Tuple[dict, ...]:
+        """Public values of this unit and its components, compared to detect modifications."""
+        return (_public_values(self),) + tuple(
+            _public_values(c) if c is not None else {} for c in map(self.__dict__.get, self._solution_components)
+        )
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Whether this unit was modified since its last solution.
+        A unit is dirty if public attributes (including explicit hook values) of itself or its components
+        (like rolls) were set, replaced or deleted after its last solution, if hook functions or root hooks were
+        registered or removed since, or if one of its subunits is dirty.
+        Values are compared by identity or equality on request, so in-place modifications of mutable values
+        are not detected. Changes of configuration values are not tracked.
+        """
+        if self.__dict__.get("_dirty", True) or self._solved_state is None:
+            return True
+
+        if self.__dict__.get("_solved_registry_state", None) != _registry_state():
+            return True
+
+        if any(_public_values_changed(old, new) for old, new in zip(self._solved_state, self._solution_state())):
+            return True
+
+        return any(u.dirty for u in self.subunits)
+
+    def mark_dirty(self):
+        """Mark this unit as modified, so that it is solved again even if its input did not change."""
+        self.__dict__["_dirty"] = True
+
+    def is_reusable_for(self, in_profile: BaseProfile) -> bool:
+        """
+        Whether the last solution of this unit is still valid for the given incoming profile,
+        meaning the unit is not dirty and was last solved with an equal incoming profile.
+        """
+        if self.dirty or self._solved_input is None:
+            return False
+
+        values = _public_values(in_profile)
+        return values.keys() == self._solved_input.keys() and all(
+            _values_equal(v, self._solved_input[k]) for k, v in values.items()
+        )
+
+    @property
+    def solved_out_profile(self) -> Optional[BaseProfile]:
+        """The outgoing profile returned by the last solution of this unit, ``None`` if not solved yet."""
+        return self._solved_output
+
+    @property
+    def solution_reused(self) -> bool:
+        """Whether the last solution of this unit was reused by its parent instead of solving the unit again,
+        see :py:attr:`PassSequence.partial_solve`."""
+        return self.__dict__.get("_solution_reused", False)
 
     def __str__(self):
         if self.label:
@@ -92,10 +218,10 @@ class Unit(HookHost):
         """
         if self.parent is None:
             raise ValueError("This unit has no parent.")
-        i = self.parent.subunits.index(self)
+        i = self.parent._subunits.position_of(self)
         if i == 0:
             raise IndexError("This unit has no previous, as it is the first one.")
-        return self.parent.subunits[i - 1]
+        return self.parent._subunits[i - 1]
 
     def prev_of(self, unit_type: type):
         """
@@ -104,12 +230,12 @@ class Unit(HookHost):
 
         :raises ValueError: if this unit has no parent unit
         """
-        prev = self.prev
-
-        while True:
-            if isinstance(prev, unit_type):
-                return prev
-            prev = prev.prev
+        if self.parent is None:
+            raise ValueError("This unit has no parent.")
+        prev = self.parent._subunits.neighbour_of(self, unit_type, -1)
+        if prev is None:
+            raise IndexError(f"This unit has no previous of type {unit_type.__qualname__}.")
+        return prev
 
     @property
     def next(self):
@@ -120,24 +246,24 @@ class Unit(HookHost):
         """
         if self.parent is None:
             raise ValueError("This unit has no parent.")
-        i = self.parent.subunits.index(self)
-        if i == len(self.parent.subunits) - 1:
+        i = self.parent._subunits.position_of(self)
+        if i == len(self.parent._subunits) - 1:
             raise IndexError("This unit has no next, as it is the last one.")
-        return self.parent.subunits[i + 1]
+        return self.parent._subunits[i + 1]
 
     def next_of(self, unit_type: type):
         """
-        Returns the instance of the first predecessor of the given type in the sequence.
-        Like the :py:attr:`Unit.prev` property, but returns the first unit with given type.
+        Returns the instance of the first successor of the given type in the sequence.
+        Like the :py:attr:`Unit.next` property, but returns the first unit with given type.
 
         :raises ValueError: if this unit has no parent unit
         """
-        next_ = self.next
-
-        while True:
-            if isinstance(next_, unit_type):
-                return next_
-            next_ = next_.next
+        if self.parent is None:
+            raise ValueError("This unit has no parent.")
+        next_ = self.parent._subunits.neighbour_of(self, unit_type, 1)
+        if next_ is None:
+            raise IndexError(f"This unit has no next of type {unit_type.__qualname__}.")
+        return next_
 
     def init_solve(self, in_profile: BaseProfile):
         """
@@ -147,24 +273,33 @@ class Unit(HookHost):
         :param in_profile: the incoming state passed to :py:meth:`solve`
         """
 
-        for pre_processor_factory in self._yield_pre_processors():
-            pre_processor = pre_processor_factory(self)
+        with profile_phase("pre_processors"):
+            for pre_processor_factory in self._yield_pre_processors():
+                pre_processor = pre_processor_factory(self)
 
-            if pre_processor is None:
-                continue
+                if pre_processor is None:
+                    continue
 
-            self.logger.debug(f"Running pre-processor '{pre_processor.label}'.")
-            in_profile = pre_processor.solve(in_profile)
+                self.logger.debug(f"Running pre-processor '{pre_processor.label}'.")
+                in_profile = pre_processor.solve(in_profile)
 
         self.in_profile = self.InProfile(self, in_profile)
         if not self.out_profile:
             self.out_profile = self.OutProfile(self, in_profile)
 
+        self.mark_cache_outdated()
+        self.out_profile.mark_cache_outdated()
+
     def __init_subclass__(cls, **kwargs):
         cls.pre_processors = []
         cls.post_processors = []
 
     def _yield_pre_processors(self):
+        frozen = self.__dict__.get("_frozen_processors", None)
+        if frozen is not None:  # set by SolvePlan
+            yield from frozen[0]
+            return
+
         for s in reversed(type(self).__mro__):
             inits = getattr(s, "pre_processors", None)
 
@@ -172,6 +307,11 @@ class Unit(HookHost):
                 yield from inits
 
     def _yield_post_processors(self):
+        frozen = self.__dict__.get("_frozen_processors", None)
+        if frozen is not None:  # set by SolvePlan
+            yield from frozen[1]
+            return
+
         for s in reversed(type(self).__mro__):
             inits = getattr(s, "post_processors", None)
 
@@ -185,73 +325,424 @@ class Unit(HookHost):
 
         return np.concatenate([in_profile_results, self_results, out_profile_results], axis=0)
 
-    def _solve_subunits(self):
-        if self._subunits:
-            last_profile = self.in_profile
-
-            for u in self._subunits:
-                try:
-                    last_profile = u.solve(last_profile)
-                except Exception as e:
-                    raise RuntimeError(f"Solution of sub units failed at unit {u}.") from e
-
-    def solve(self, in_profile: BaseProfile) -> BaseProfile:
+    def _root_hook_hosts(self) -> List[Tuple[str, HookHost]]:
         """
-        Solve the workpiece evolution within this unit based on the incoming state specified by in_profile.
-        Iterates several times calling :py:meth:`evaluate` until the return of :py:meth:`evaluate` does not change anymore.
+        Names and hosts whose root hook values are concatenated by :py:meth:`get_root_hook_results`,
+        in the same order.
+        """
+        return [("in_profile", self.in_profile), ("unit", self), ("out_profile", self.out_profile)]
 
-        :param in_profile: The incoming state profile
-        :return: The outgoing state profile.
+    @property
+    def root_hook_result_labels(self) -> List[Tuple[str, str]]:
         """
-        self.logger.info(f"Started solving of {self}.")
-        start = timer()
-        self.init_solve(in_profile)
+        Labels ``(host, hook)`` of the values in the last return value of :py:meth:`get_root_hook_results`,
+        where ``host`` is one of ``"in_profile"``, ``"unit"``, ``"out_profile"`` (and ``"roll"``, ``"engine"``
+        for roll passes). Array valued hooks occupy one entry per element.
+        """
+        return [
+            (name, hook.name)
+            for name, host in self._root_hook_hosts()
+            for hook, size in host.root_hook_result_layout
+            for _ in range(size)
+        ]
+
+    def _convergence_criteria(self, count: int) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Relative and absolute tolerances and the mask of checked values for a result vector of given length,
+        as given by the root hooks. ``None`` if all root hooks use the defaults or the layout is unknown.
+        """
+        layout = [(hook, size) for _, host in self._root_hook_hosts() for hook, size in host.root_hook_result_layout]
+        sizes = [size for _, size in layout]
+
+        if sum(sizes) != count:
+            return None
 
-        for i in range(1, self.max_iteration_count):
+        settings = [(h.relative_tolerance, h.absolute_tolerance, h.check_convergence) for h, _ in layout]
+
+        if all(r is None and not a and c for r, a, c in settings):
+            return None
+
+        precision = self.iteration_precision
+        relative = np.repeat([precision if r is None else r for r, _, _ in settings], sizes).astype(float)
+        absolute = np.repeat([a for _, a, _ in settings], sizes).astype(float)
+        checked = np.repeat([c for _, _, c in settings], sizes).astype(bool)
+        return relative, absolute, checked
+
+    @property
+    def residuals(self) -> Dict[Tuple[str, str], float]:
+        """
+        Relative changes of the root hook values in the last iteration by ``(host, hook)`` label,
+        the maximum over all elements for array valued hooks. Excluded hooks are included as well.
+        """
+        vector = self._residual_vector
+        labels = self.root_hook_result_labels
+
+        if vector is None or len(labels) != len(vector):
+            return {}
+
+        result = {}
+        for label, value in zip(labels, vector):
+            result[label] = max(result.get(label, -np.inf), value)
+        return result
+
+    def _iteration_acceleration_spec(self) -> Union[str, IterationAccelerator, None]:
+        # accelerators are callable, so explicitly set ones would be called as hook value functions
+        explicit = self.__dict__.get("iteration_acceleration", None)
+        if isinstance(explicit, IterationAccelerator):
+            return explicit
+        return self.iteration_acceleration
+
+    def _iterate(self):
+        """Run one iteration of the solution loop and return the root hook results, yields from the subunits."""
+        with profile_phase("reevaluate_cache"):
             self.in_profile.reevaluate_cache()
-            self._solve_subunits()
+        with profile_phase("subunits"):
+            yield from self._iter_solve_subunits()
+        with profile_phase("reevaluate_cache"):
             self.reevaluate_cache()
             self.out_profile.reevaluate_cache()
-            current_results = self.get_root_hook_results()
+        with profile_phase("root_hook_results"):
+            return self.get_root_hook_results()
+
+    def _iterated_hosts(self) -> List[str]:
+        return [name for name, _ in self._root_hook_hosts() if name not in INPUT_HOSTS]
 
-            residuum = np.max(np.abs(current_results - self._old_results) / (np.abs(self._old_results) + 1e-12))
+    def _acceleration_mask(self, count: int) -> Optional[np.ndarray]:
+        """
+        Mask of the root hook result elements subject to iteration acceleration.
+        Values of the incoming profile are inputs of this unit, not iterates, so they are excluded.
+        ``None`` if the layout does not match the given length.
+        """
+        mask = np.concatenate(
+            [np.full(host.root_hook_result_count, name not in INPUT_HOSTS) for name, host in self._root_hook_hosts()]
+        )
+        return mask if len(mask) == count else None
 
-            self.convergence_history.append({
-                "iteration": self.global_iterator,
-                "residuum": residuum,
-                "label": self.label
-            })
+    def _accelerate(self, accelerator: IterationAccelerator, current_results: np.ndarray) -> np.ndarray:
+        """
+        Get the values to start the next iteration with from the accelerator, applied to the iterated values only.
+        Returns ``current_results`` itself if nothing was changed.
+        """
+        if np.shape(self._old_results) != np.shape(current_results):
+            accelerator(self._old_results, current_results)  # let it reset
+            return current_results
 
-            self.global_iterator += 1
+        mask = self._acceleration_mask(len(current_results))
+        if mask is None:
+            return current_results
 
-            if np.all(
-                np.abs(current_results - self._old_results) <= np.abs(self._old_results) * self.iteration_precision
-            ):
-                self.logger.info(f"Finished solving of {self} after {i} iterations.")
-                break
+        accelerated = accelerator(self._old_results[mask], current_results[mask])
+        if np.array_equal(accelerated, current_results[mask]):
+            return current_results
 
-            self._old_results = current_results
+        result = current_results.copy()
+        result[mask] = accelerated
+        return result
 
-        else:
-            self.logger.warning(
-                f"Solution iteration of {self} exceeded the maximum iteration count of {self.max_iteration_count}."
-                f" Continuing anyway."
+    def set_root_hook_results(self, results: np.ndarray, hosts: Optional[Iterable[str]] = None):
+        """
+        Explicitly set the root hook values of all hosts from a vector laid out like the last return value of
+        :py:meth:`get_root_hook_results`.
+
+        :param hosts: names of the hosts to set the values of (see :py:attr:`root_hook_result_labels`), all if None
+        :raises ValueError: if the length of the vector does not match the layout
+        """
+        all_hosts = self._root_hook_hosts()
+        counts = [h.root_hook_result_count for _, h in all_hosts]
+
+        if sum(counts) != len(results):
+            raise ValueError(
+                f"Length of results ({len(results)}) does not match the root hook layout of {self} ({sum(counts)})."
             )
 
-        out_profile = BaseProfile(**{k: v for k, v in self.out_profile.__dict__.items() if not k.startswith("_")})
+        start = 0
+        for (name, host), count in zip(all_hosts, counts):
+            if hosts is None or name in hosts:
+                host.set_root_hook_values(results[start : start + count])
+            start += count
+
+    def aggregated_convergence_history(self, max_depth: Optional[int] = None) -> dict[str, np.ndarray]:
+        """
+        Columnar view of the kept convergence histories of this unit and its (nested) subunits in depth-first order.
+
+        :param max_depth: maximum nesting depth of subunits to include, ``None`` for all levels
+        :return: dictionary with the columns ``"label"``, ``"depth"``, ``"iteration"`` and ``"residuum"``
+        """
+        labels, depths, iterations, residua = [], [], [], []
+
+        def collect(unit, depth):
+            history = unit.convergence_history
+            labels.extend([unit.label] * len(history))
+            depths.extend([depth] * len(history))
+            iterations.append(history.iterations)
+            residua.append(history.residua)
+
+            if max_depth is None or depth < max_depth:
+                for u in unit.subunits or ():
+                    collect(u, depth + 1)
+
+        collect(self, 0)
+
+        return {
+            "label": np.array(labels, dtype=object),
+            "depth": np.array(depths, dtype=int),
+            "iteration": np.concatenate(iterations),
+            "residuum": np.concatenate(residua),
+        }
+
+    def _warm_start_hosts(self) -> List[HookHost]:
+        hosts = []
+        for _, h in self._root_hook_hosts()[1:]:
+            if not any(h is e for e in hosts):
+                hosts.append(h)
+        return hosts
+
+    def snapshot(self, recursive: bool = True) -> UnitSnapshot:
+        """
+        Take a snapshot of the current solution state of this unit to seed later solutions with.
+
+        :param recursive: whether to include snapshots of the subunits
+        """
+        return UnitSnapshot(self, recursive=recursive)
+
+    def warm_start_from(self, snapshot: UnitSnapshot):
+        """
+        Seed the next solution of this unit (and its subunits, if included) with the given snapshot.
+        The snapshot is used once, independent of the :py:attr:`warm_start` hook.
+
+        :raises ValueError: if the snapshot was taken from a unit of another type
+        """
+        if snapshot.unit_type is not type(self):
+            raise ValueError(f"Snapshot of a {snapshot.unit_type.__qualname__} can not be applied to {self}.")
+        self._pending_snapshot = snapshot
 
-        for post_processor_factory in self._yield_post_processors():
-            post_processor = post_processor_factory(self)
+    def _apply_warm_start(self):
+        snapshot = self._pending_snapshot
+        self._pending_snapshot = None
 
-            if post_processor is None:
-                continue
+        if snapshot is None and self.warm_start:
+            snapshot = self._last_solution
 
-            self.logger.debug(f"Running post-processor '{post_processor.label}'.")
-            out_profile = post_processor.solve(out_profile)
+        if snapshot is not None:
+            self.logger.debug(f"Warm starting solution of {self}.")
+            snapshot.apply(self)
 
-        end = timer()
-        self.logger.info(f"Solution took {end - start:.3f} s.")
+    def _solve_subunits(self):
+        for _ in self._iter_solve_subunits():
+            pass
 
+    def _iter_solve_subunits(self):
+        """Solve the subunits in order, yielding each unit (and nested subunit) as soon as its solution finished."""
+        if self._subunits:
+            yield from self._iter_solve_units(self._subunits, self.in_profile)
+
+    @staticmethod
+    def _iter_solve_units(units: Iterable["Unit"], last_profile: BaseProfile):
+        for u in units:
+            try:
+                last_profile = yield from u._iter_solve(last_profile)
+            except Exception as e:
+                raise RuntimeError(f"Solution of sub units failed at unit {u}.") from e
+
+    def _iter_solve(self, in_profile: BaseProfile):
+        """Like :py:meth:`solve`, but yielding the solved (sub)units, returns the outgoing profile."""
+        if type(self).solve is not Unit.solve:
+            out_profile = self.solve(in_profile)
+            yield self
+            return out_profile
+
+        return (yield from self._solve_steps(in_profile))
+
+    def solve(self, in_profile: BaseProfile) -> BaseProfile:
+        """
+        Solve the workpiece evolution within this unit based on the incoming state specified by in_profile.
+        Iterates several times calling :py:meth:`evaluate` until the return of :py:meth:`evaluate` does not change anymore.
+
+        :param in_profile: The incoming state profile
+        :return: The outgoing state profile.
+        """
+        for _ in self._solve_steps(in_profile):
+            pass
+        return self._solved_output
+
+    def solve_iter(
+        self, in_profile: BaseProfile, hooks: Iterable[str] = (), max_depth: Optional[int] = 1
+    ) -> Iterator[UnitRecord]:
+        """
+        Solve like :py:meth:`solve`, but yield a compact record for each subunit as soon as its solution finished,
+        and for this unit itself at last. Subunits solved again in further iterations of this unit yield again,
+        with an increased :py:attr:`UnitRecord.parent_iteration` and :py:attr:`UnitRecord.iteration`.
+        Units whose last solution is reused by partial solving of a pass sequence yield records as well,
+        marked by :py:attr:`UnitRecord.reused`.
+
+        The solution runs in a copy of the caller's context, so dependency tracking and other context dependent
+        state of the solution do not apply to the code consuming the records, and hook scopes entered by it do
+        not apply to the solution. The solutions of this unit and the parents of the yielded subunit are however
+        suspended while a record is consumed, so their durations (in :py:attr:`solve_duration` and solve profiles)
+        include the time spent by the consumer.
+
+        The unit tree must not be modified while iterating. The outgoing profile is available as
+        :py:attr:`solved_out_profile` after exhausting the generator.
+
+        :param in_profile: the incoming state profile
+        :param hooks: names of hooks to collect for each unit, dotted paths like ``"out_profile.width"`` are possible,
+            unavailable values are omitted from the records
+        :param max_depth: maximum nesting depth of units to yield records for (1 means direct subunits only),
+            ``None`` for all levels
+        """
+        hooks = list(hooks)
+        steps = self._solve_steps(in_profile)
+        context = contextvars.copy_context()
+
+        try:
+            while True:
+                try:
+                    unit = context.run(next, steps)
+                except StopIteration:
+                    return
+
+                depth = 0
+                u = unit
+                while u is not self and u is not None:
+                    depth += 1
+                    u = u.parent
+
+                if max_depth is None or depth <= max_depth:
+                    yield UnitRecord(unit, depth, hooks, self.iteration)
+        finally:
+            context.run(steps.close)
+
+    def _solve_steps(self, in_profile: BaseProfile):
+        self.logger.info(f"Started solving of {self}.")
+        start = timer()
+        solved_input = _public_values(in_profile)
+
+        with profile_solve(self):
+            with track_dependencies() if Config.HOOK_DEPENDENCY_TRACKING else nullcontext():
+                with profile_phase("init"):
+                    self.init_solve(in_profile)
+                    self._apply_warm_start()
+                accelerator = create_accelerator(self._iteration_acceleration_spec())
+                divergence_policy = self.divergence_policy
+                monitor = DivergenceMonitor() if divergence_policy != "ignore" else None
+                damping_factor = 1.0
+                plain_results = None  # results before acceleration, if accelerated values were set
+
+                for i in range(1, self.max_iteration_count):
+                    self.iteration = i
+                    try:
+                        current_results = yield from self._iterate()
+                    except Exception as e:
+                        if plain_results is None:
+                            raise
+                        self.logger.warning(
+                            f"Iteration of {self} failed with accelerated values, continuing without acceleration: {e}"
+                        )
+                        accelerator = None
+                        self.set_root_hook_results(plain_results, hosts=self._iterated_hosts())
+                        current_results = yield from self._iterate()
+                    plain_results = None
+
+                    if np.ndim(self._old_results) and np.shape(self._old_results) != np.shape(current_results):
+                        self._old_results = np.nan
+
+                    changes = np.abs(current_results - self._old_results)
+                    self._residual_vector = changes / (np.abs(self._old_results) + 1e-12)
+                    criteria = self._convergence_criteria(len(current_results))
+
+                    if criteria is None:
+                        residuum = np.max(self._residual_vector, initial=0)
+                        converged = np.all(changes <= np.abs(self._old_results) * self.iteration_precision)
+                    else:
+                        relative, absolute, checked = criteria
+                        residuum = np.max(self._residual_vector[checked], initial=0)
+                        converged = np.all((changes <= np.abs(self._old_results) * relative + absolute)[checked])
+
+                    self.convergence_history.append(self.global_iterator, residuum)
+
+                    self.global_iterator += 1
+
+                    if converged:
+                        self.logger.info(f"Finished solving of {self} after {i} iterations.")
+                        self._old_results = current_results
+                        self._last_solution = self.snapshot(recursive=False)
+                        self.solution_status = SolutionStatus(SolutionStatus.CONVERGED, i, residuum)
+                        break
+
+                    trend = monitor.update(residuum) if monitor is not None else None
+
+                    if trend is not None:
+                        status = SolutionStatus(trend, i, residuum)
+
+                        if divergence_policy == "abort":
+                            self.solution_status = status
+                            raise SolutionDivergedError(
+                                f"Solution iteration of {self} {trend} after {i} iterations.", status
+                            )
+
+                        if divergence_policy == "mark":
+                            self.logger.warning(f"Solution iteration of {self} {trend} after {i} iterations. Stopping.")
+                            self.solution_status = status
+                            break
+
+                        if divergence_policy == "damp" and damping_factor > MIN_DAMPING_FACTOR:
+                            damping_factor /= 2
+                            self.logger.warning(
+                                f"Solution iteration of {self} {trend} after {i} iterations. "
+                                f"Continuing with under-relaxation factor {damping_factor}."
+                            )
+                            accelerator = UnderRelaxation(damping_factor)
+                            monitor.reset()
+
+                    if accelerator is not None:
+                        next_results = self._accelerate(accelerator, current_results)
+
+                        if next_results is not current_results:
+                            try:
+                                self.set_root_hook_results(next_results, hosts=self._iterated_hosts())
+                                plain_results = current_results
+                            except ValueError as e:
+                                self.logger.warning(f"Disabling iteration acceleration of {self}: {e}")
+                                accelerator = None
+                                next_results = current_results
+
+                        current_results = next_results
+
+                    self._old_results = current_results
+
+                else:
+                    self.logger.warning(
+                        f"Solution iteration of {self} exceeded the maximum iteration count of "
+                        f"{self.max_iteration_count}. Continuing anyway."
+                    )
+                    self.solution_status = SolutionStatus(
+                        SolutionStatus.MAX_ITERATIONS, self.iteration, self.convergence_history.last_residuum
+                    )
+
+            out_profile = BaseProfile(**_public_values(self.out_profile))
+
+            with profile_phase("post_processors"):
+                for post_processor_factory in self._yield_post_processors():
+                    post_processor = post_processor_factory(self)
+
+                    if post_processor is None:
+                        continue
+
+                    self.logger.debug(f"Running post-processor '{post_processor.label}'.")
+                    out_profile = post_processor.solve(out_profile)
+
+            end = timer()
+            self.solve_duration = end - start
+            self.logger.info(f"Solution took {end - start:.3f} s.")
+
+            self._dirty = False
+            self._solved_input = solved_input
+            self._solved_output = out_profile
+            self._solution_reused = False
+            self._solved_state = self._solution_state()
+            self._solved_registry_state = _registry_state()
+
+        yield self
         return out_profile
 
     @property
@@ -314,36 +805,120 @@ class Unit(HookHost):
             return getattr(self.unit.in_profile, hook.name, None)
 
     class _SubUnitsList(list):
-        """Specialized list for holding the units of a pass sequence."""
+        """
+        Specialized list for holding the units of a pass sequence.
+        Maintains lazily built indexes of the units' positions and labels and caches typed neighbour lookups,
+        all discarded on modification of the list.
+        """
 
         def __init__(self, owner: "Unit", units: Sequence["Unit"]):
             super().__init__(units)
             self._owner = weakref.ref(owner)
+            self._clear_indexes()
             for u in self:
                 u.parent = owner
 
+        def _clear_indexes(self) -> None:
+            self._positions: Optional[Dict[int, int]] = None
+            self._labels: Optional[Dict[str, "Unit"]] = None
+            self._neighbours: Dict[Tuple[int, type, int], Optional["Unit"]] = {}
+
+        def position_of(self, unit: "Unit") -> int:
+            """
+            Get the position of a unit in this list, like ``index``, but in constant time.
+
+            :raises ValueError: if the unit is not in this list
+            """
+            if self._positions is None:
+                self._positions = {}
+                for i, u in enumerate(self):
+                    self._positions.setdefault(id(u), i)
+
+            try:
+                return self._positions[id(unit)]
+            except KeyError:
+                raise ValueError(f"{unit} is not in list.") from None
+
+        def by_label(self, label: str) -> "Unit":
+            """
+            Get the first unit with the given label in constant time.
+
+            :raises KeyError: if no unit with this label is in this list
+            """
+            if self._labels is None:
+                self._labels = {}
+                for u in self:
+                    self._labels.setdefault(u.label, u)
+
+            return self._labels[label]
+
+        def neighbour_of(self, unit: "Unit", unit_type: type, direction: int) -> Optional["Unit"]:
+            """
+            Get the nearest unit of the given type before (``direction=-1``) or after (``direction=1``) a unit.
+            Results are cached until the list is modified.
+
+            :returns: the found unit or None if there is none
+            :raises ValueError: if the unit is not in this list
+            """
+            key = (self.position_of(unit), unit_type, direction)
+
+            try:
+                return self._neighbours[key]
+            except KeyError:
+                pass
+
+            i = key[0] + direction
+            result = None
+            while 0 <= i < len(self):
+                if isinstance(self[i], unit_type):
+                    result = self[i]
+                    break
+                i += direction
+
+            self._neighbours[key] = result
+            return result
+
         def append(self, unit: "Unit") -> None:
             unit.parent = self._owner()
             super().append(unit)
+            self._clear_indexes()
 
         def extend(self, units: Iterable["Unit"]) -> None:
+            units = list(units)
             for u in units:
                 u.parent = self._owner()
             super().extend(units)
+            self._clear_indexes()
 
         def insert(self, i: Union[SupportsIndex, slice], unit: "Unit") -> None:
             unit.parent = self._owner()
             super().insert(i, unit)
+            self._clear_indexes()
 
-        def pop(self, i: Union[SupportsIndex, slice] = ...) -> "Unit":
+        def pop(self, i: Union[SupportsIndex, slice] = -1) -> "Unit":
             unit = super().pop(i)
             unit.parent = None
+            self._clear_indexes()
             return unit
 
+        def remove(self, unit: "Unit") -> None:
+            super().remove(unit)
+            unit.parent = None
+            self._clear_indexes()
+
         def clear(self) -> None:
             for u in self:
                 u.parent = None
             super().clear()
+            self._clear_indexes()
+
+        def reverse(self) -> None:
+            super().reverse()
+            self._clear_indexes()
+
+        def sort(self, *args, **kwargs) -> None:
+            super().sort(*args, **kwargs)
+            self._clear_indexes()
 
         def copy(self) -> "Unit._SubUnitsList":
             return self.__init__(self._owner(), self)
@@ -355,7 +930,26 @@ class Unit(HookHost):
                     u.parent = None
             else:
                 current.parent = None
-            return super().__setitem__(i, value)
+            if isinstance(i, slice):
+                value = list(value)
+                for u in value:
+                    u.parent = self._owner()
+            else:
+                value.parent = self._owner()
+            super().__setitem__(i, value)
+            self._clear_indexes()
+
+        def __iadd__(self, units: Iterable["Unit"]) -> "Unit._SubUnitsList":
+            self.extend(units)
+            return self
+
+        def __imul__(self, n: SupportsIndex) -> "Unit._SubUnitsList":
+            if n <= 0:
+                for u in self:
+                    u.parent = None
+            super().__imul__(n)
+            self._clear_indexes()
+            return self
 
         def __delitem__(self, i: Union[SupportsIndex, slice]):
             current = self[i]
@@ -364,7 +958,8 @@ class Unit(HookHost):
                     u.parent = None
             else:
                 current.parent = None
-            return super().__delitem__(i)
+            super().__delitem__(i)
+            self._clear_indexes()
 
         # noinspection PyProtectedMember
         def _repr_html_(self):
@@ -373,6 +968,7 @@ class Unit(HookHost):
         def __deepcopy__(self, memo):
             cls = self.__class__
             result = cls.__new__(cls)
+            result._clear_indexes()
 
             o = self._owner()
             if id(o) in memo:
@@ -384,3 +980,6 @@ class Unit(HookHost):
                 result.append(copy.deepcopy(e, memo))
 
             return result
+
+        def __reduce__(self):
+            return self.__class__, (self._owner(), list(self))
@@ -340,3 +340,440 @@ def test_hook_type():
 
     assert Host.hook1.type is float
     assert Host.hook2.type is str
+
+
+def test_dispatch_table_invalidation():
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+
+    class Host2(Host):
+        pass
+
+    @Host.hook1
+    def f1(self: Host):
+        return 21
+
+    table = Host2.hook1.dispatch_table
+    assert table == (f1,)
+    assert Host2.hook1.dispatch_table is table
+
+    @Host.hook1
+    def f2(self: Host):
+        return 42
+
+    assert Host2.hook1.dispatch_table == (f2, f1)
+    assert Host2().hook1 == 42
+
+    Host.hook1.remove_function(f2)
+
+    assert Host2.hook1.dispatch_table == (f1,)
+    assert Host2().hook1 == 21
+
+
+def test_dispatch_table_kept_on_unrelated_changes():
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+        hook2 = Hook[Any]()
+
+    class Host2(Host):
+        pass
+
+    class Host3(Host):
+        pass
+
+    @Host.hook1
+    def f1(self: Host):
+        return 21
+
+    table = Host2.hook1.dispatch_table
+
+    assert "hook1" not in Host3.__dict__
+    assert Host3.hook1.dispatch_table == (f1,)  # lazily creates the hook on Host3
+    assert Host2.hook1.dispatch_table is table
+
+    @Host.hook2
+    def f2(self: Host):
+        return 42
+
+    assert Host2.hook1.dispatch_table is table
+
+    Host.hook2.remove_function(f2)
+    Host2.hook1 = Hook[Any]()
+
+    assert Host2.hook1.dispatch_table == (f1,)
+    assert Host2.hook1.dispatch_table is not table
+
+
+def test_signature_analysis_cached(monkeypatch):
+    import inspect
+
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+        hook2 = Hook[Any]()
+
+    @Host.hook1
+    def f1(self: Host, cycle):
+        if not cycle:
+            return 21
+
+    assert f1.accepts_cycle
+
+    host = Host()
+    host.hook2 = lambda self: 42
+    assert host.hook2 == 42
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("inspect.signature must not be called on hook resolution")
+
+    monkeypatch.setattr(inspect, "signature", _fail)
+
+    assert host.hook1 == 21
+    assert host.hook2 == 42
+
+
+def test_dependency_tracking():
+    from pyroll.core.hooks import track_dependencies
+
+    class Host(HookHost):
+        root = Hook[Any]()
+        hook1 = Hook[Any]()
+        hook2 = Hook[Any]()
+
+    calls = []
+
+    @Host.hook1
+    def f1(self: Host):
+        calls.append("hook1")
+        return self.root * 2
+
+    @Host.hook2
+    def f2(self: Host):
+        calls.append("hook2")
+        return 42
+
+    with track_dependencies():
+        host = Host()
+        host.root = 1
+        assert host.hook1 == 2
+        assert host.hook2 == 42
+
+        host.reevaluate_cache()
+        calls.clear()
+
+        host.root = 1  # unchanged value
+        host.reevaluate_cache()
+        assert calls == []
+
+        host.root = 2
+        host.reevaluate_cache()
+        assert calls == ["hook1"]
+        assert host.hook1 == 4
+
+
+def test_profiler():
+    import json
+    from pyroll.core import HookProfiler
+
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+        hook2 = Hook[Any]()
+
+    @Host.hook1
+    def f1(self: Host):
+        return 21
+
+    @Host.hook2
+    def f2(self: Host):
+        return self.hook1 * 2
+
+    @Host.hook2
+    def f3(self: Host):
+        return None
+
+    host = Host()
+
+    with HookProfiler() as profiler:
+        assert host.hook2 == 42
+        assert host.hook2 == 42
+
+    assert profiler.function_stats[f1]["calls"] == 1
+    assert profiler.function_stats[f2]["calls"] == 1
+    assert profiler.function_stats[f3]["none_results"] == 1
+    assert profiler.function_stats[f2]["self_time"] <= profiler.function_stats[f2]["cumulative_time"]
+    assert profiler.hook_stats[Host.hook2] == dict(explicit=0, hits=1, misses=1)
+
+    data = json.loads(profiler.to_json())
+    assert len(data["functions"]) == 3
+    assert "f2" in profiler.to_table()
+
+    host.reevaluate_cache()
+    assert profiler.function_stats[f1]["calls"] == 1
+
+
+def test_cycle_per_instance():
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+
+        def __init__(self, other=None):
+            super().__init__()
+            self.other = other
+
+    @Host.hook1
+    def f1(self: Host, cycle):
+        if cycle:
+            return None
+        if self.other is not None:
+            return self.other.hook1 + 1
+        return 1
+
+    host = Host(Host())
+    assert host.hook1 == 2
+
+
+def test_cycle_per_thread():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+
+    barrier = threading.Barrier(2)
+
+    @Host.hook1
+    def f1(self: Host, cycle):
+        if cycle:
+            return None
+        barrier.wait(timeout=5)
+        return 42
+
+    with ThreadPoolExecutor(2) as executor:
+        results = list(executor.map(lambda h: h.hook1, [Host(), Host()]))
+
+    assert results == [42, 42]
+
+
+def test_scope():
+    from pyroll.core import HookScope
+
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+
+    class Host2(Host):
+        pass
+
+    @Host.hook1
+    def f1(self: Host):
+        return 21
+
+    scope = HookScope()
+
+    @scope(Host.hook1)
+    def f2(self: Host):
+        return 42
+
+    @scope(Host.hook1, wrapper=True)
+    def f2w(self: Host, cycle):
+        if cycle:
+            return None
+        return 2 * (yield)
+
+    assert Host.hook1.functions == [f1]
+    assert scope.functions(Host2.hook1) == [f2w, f2, f1]
+
+    assert Host2().hook1 == 21
+
+    with scope:
+        assert Host2().hook1 == 84
+
+    assert Host2().hook1 == 21
+
+    with f2w:
+        pass
+
+    with scope:
+        assert Host2().hook1 == 42
+
+
+def test_scope_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from pyroll.core import HookScope
+
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+
+    def _run(value):
+        scope = HookScope()
+        scope.add_function(Host.hook1, lambda self: value)
+
+        with scope:
+            return Host().hook1
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(_run, range(20)))
+
+    assert results == list(range(20))
+
+
+def test_negative_results_cached():
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+
+    calls = []
+
+    @Host.hook1
+    def f1(self: Host):
+        calls.append(1)
+        return None
+
+    host = Host()
+
+    assert not host.has_value("hook1")
+    assert not host.has_value("hook1")
+    assert host.try_get("hook1", 42) == 42
+    assert len(calls) == 1
+
+    host.reevaluate_cache()
+    assert host.try_get("hook1") is None
+    assert len(calls) == 2
+
+    @Host.hook1
+    def f2(self: Host):
+        return 21
+
+    assert host.try_get("hook1") == 21
+    assert host.has_value("hook1")
+
+
+def test_negative_results_invalidated_by_missing_values():
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+        hook2 = Hook[Any]()
+        hook3 = Hook[Any]()
+        hook4 = Hook[Any]()
+
+    calls = []
+
+    @Host.hook1
+    def f1(self: Host):
+        calls.append(1)
+        if self.has_value("hook2"):
+            return self.hook2 + 1
+
+    @Host.hook2
+    def f2(self: Host):
+        if self.has_set("hook3"):
+            return self.hook3 + 1
+
+    @Host.hook4
+    def f4(self: Host):
+        return 4
+
+    host = Host()
+    other = Host()
+
+    assert not host.has_value("hook1")
+    assert host.hook4 == 4
+    other.hook3 = 1
+    assert not host.has_value("hook1")
+    assert len(calls) == 1
+
+    host.hook3 = 1
+    assert host.hook1 == 3
+    assert len(calls) == 2
+
+
+def test_negative_results_invalidated_by_changed_values():
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+        hook2 = Hook[Any]()
+
+    @Host.hook2
+    def f2(self: Host):
+        if self.hook1 <= 5:
+            return self.hook1 * 2
+
+    host = Host()
+
+    host.hook1 = 10
+    assert not host.has_value("hook2")
+
+    host.hook1 = 3
+    assert host.hook2 == 6
+
+
+def test_classifier_preconditions():
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+        classifiers = Hook[Any]()
+
+    calls = []
+
+    @Host.hook1
+    def f1(self: Host):
+        return 21
+
+    @Host.hook1(classifiers={"a", "b"})
+    def f2(self: Host):
+        calls.append(1)
+        return 42
+
+    assert f2.classifiers == {"a", "b"}
+
+    assert Host().hook1 == 21
+
+    host = Host()
+    host.classifiers = {"a"}
+    assert host.hook1 == 21
+
+    host = Host()
+    host.classifiers = {"a", "b", "c"}
+    assert host.hook1 == 42
+
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError):
+        Host.classifiers.add_function(lambda self: {"a"}, classifiers={"a"})
+
+
+def test_tracer(caplog):
+    import logging
+    from pyroll.core import HookTracer
+
+    caplog.set_level(logging.DEBUG, logger="pyroll")
+
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+        hook2 = Hook[Any]()
+
+        def __init__(self, label):
+            super().__init__()
+            self.label = label
+
+    @Host.hook1
+    def f1(self: Host):
+        return 21
+
+    @Host.hook2
+    def f2(self: Host):
+        return self.hook1 * 2
+
+    assert Host("a").hook2 == 42
+    assert not caplog.records
+
+    messages = []
+    with HookTracer(hooks=["hook1"], units=["b"], sink=messages.append):
+        assert Host("a").hook2 == 42
+        assert Host("b").hook2 == 42
+
+    assert messages
+    assert all("hook1" in m for m in messages)
+    assert any("resolved from function" in m for m in messages)
+
+    messages.clear()
+    with HookTracer(sample_every=2, sink=messages.append) as tracer:
+        assert Host("c").hook2 == 42
+    assert len(messages) == (tracer._count + 1) // 2
+
+    with HookTracer():
+        assert Host("d").hook1 == 21
+    assert caplog.records
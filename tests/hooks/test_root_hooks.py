@@ -0,0 +1,98 @@
+from typing import Any
+
+import numpy as np
+
+from pyroll.core import Hook, HookHost, root_hooks
+
+
+def test_root_hooks_for_class():
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+        hook2 = Hook[Any]()
+
+    class Host2(Host):
+        pass
+
+    assert root_hooks.for_class(Host2) == ()
+
+    root_hooks.add(Host.hook1)
+    try:
+        hooks = root_hooks.for_class(Host2)
+        assert [h.name for h in hooks] == ["hook1"]
+        assert hooks[0] is Host2.hook1
+        assert root_hooks.for_class(Host2) is hooks
+
+        root_hooks.add(Host.hook2)
+        assert [h.name for h in root_hooks.for_class(Host2)] == ["hook1", "hook2"]
+        root_hooks.remove_last(Host.hook2)
+
+        assert [h.name for h in root_hooks.for_class(Host2)] == ["hook1"]
+    finally:
+        root_hooks.remove_last(Host.hook1)
+
+    assert root_hooks.for_class(Host2) == ()
+
+
+def test_evaluate_and_set_hooks():
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+        hook2 = Hook[Any]()
+        hook3 = Hook[Any]()
+
+    @Host.hook1
+    def f1(self):
+        return 21
+
+    @Host.hook2
+    def f2(self):
+        return np.array([1.0, 2.0])
+
+    @Host.hook3
+    def f3(self):
+        return {"a", "b"}
+
+    root_hooks.extend([Host.hook1, Host.hook2, Host.hook3])
+    try:
+        host = Host()
+        result = host.evaluate_and_set_hooks()
+
+        np.testing.assert_array_equal(result, [21, 1, 2])
+        assert host.has_set("hook1")
+        assert host.has_set("hook3")
+    finally:
+        root_hooks.remove_last(Host.hook1)
+        root_hooks.remove_last(Host.hook2)
+        root_hooks.remove_last(Host.hook3)
+
+
+def test_evaluate_and_set_hooks_complex():
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+        hook2 = Hook[Any]()
+
+    @Host.hook1
+    def f1(self):
+        return 2.0
+
+    @Host.hook2
+    def f2(self):
+        return np.array([1 + 1j, 2])
+
+    root_hooks.extend([Host.hook1, Host.hook2])
+    try:
+        host = Host()
+        first = host.evaluate_and_set_hooks()
+        np.testing.assert_array_equal(first, [2, 1 + 1j, 2])
+
+        host.reevaluate_cache()
+        second = host.evaluate_and_set_hooks()
+        assert first is not second
+        assert not np.shares_memory(first, second)
+
+        host.set_root_hook_values(second * 2)
+        assert host.hook1 == 4.0
+        assert not np.iscomplexobj(host.hook1)
+        np.testing.assert_array_equal(host.hook2, [2 + 2j, 4])
+    finally:
+        root_hooks.remove_last(Host.hook1)
+        root_hooks.remove_last(Host.hook2)
@@ -0,0 +1,76 @@
+from typing import Optional
+
+import pytest
+
+from pyroll.core import (
+    Profile,
+    Roll,
+    RollPass,
+    Transport,
+    RoundGroove,
+    CircularOvalGroove,
+    PassSequence,
+)
+
+
+@pytest.fixture
+def make_in_profile():
+    """Factory of the round incoming profile used by the pass sequence tests, keyword arguments override values."""
+
+    def factory(**kwargs):
+        return Profile.round(
+            **{
+                "diameter": 30e-3,
+                "temperature": 1200 + 273.15,
+                "strain": 0,
+                "material": ["C45", "steel"],
+                "flow_stress": 100e6,
+                "length": 1,
+                **kwargs,
+            }
+        )
+
+    return factory
+
+
+@pytest.fixture
+def make_sequence():
+    """
+    Factory of the sequence "Oval I", "I => II", "Round II" used by the pass sequence tests.
+
+    The rolls have rotational frequencies and the transport a duration, unless ``velocity_driven`` is true,
+    then the rolls have no rotational frequencies and the transport has a length.
+    ``oval`` are additional keyword arguments of the first roll pass, further keyword arguments are passed
+    to the sequence.
+    """
+
+    def factory(oval: Optional[dict] = None, velocity_driven: bool = False, **kwargs):
+        roll_kwargs = {} if velocity_driven else dict(rotational_frequency=1)
+
+        return PassSequence(
+            [
+                RollPass(
+                    label="Oval I",
+                    roll=Roll(
+                        groove=CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+                        nominal_radius=160e-3,
+                        **roll_kwargs,
+                    ),
+                    gap=2e-3,
+                    **(oval or {}),
+                ),
+                Transport(label="I => II", **(dict(length=1) if velocity_driven else dict(duration=1))),
+                RollPass(
+                    label="Round II",
+                    roll=Roll(
+                        groove=RoundGroove(r1=1e-3, r2=12.5e-3, depth=11.5e-3),
+                        nominal_radius=160e-3,
+                        **roll_kwargs,
+                    ),
+                    gap=2e-3,
+                ),
+            ],
+            **kwargs,
+        )
+
+    return factory
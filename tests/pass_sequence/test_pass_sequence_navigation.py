@@ -0,0 +1,117 @@
+import copy
+import pickle
+
+import pytest
+
+from pyroll.core import PassSequence, Transport, Rotator
+
+
+def _sequence():
+    return PassSequence(
+        [
+            Transport(label="T0", duration=1),
+            Rotator(label="R1", rotation=90),
+            Transport(label="T2", duration=1),
+            Transport(label="T3", duration=1),
+            Rotator(label="R4", rotation=90),
+        ]
+    )
+
+
+def test_prev_next():
+    sequence = _sequence()
+
+    assert sequence["T2"].prev is sequence[1]
+    assert sequence["T2"].next is sequence[3]
+    assert sequence["T3"].prev_of(Rotator) is sequence["R1"]
+    assert sequence["T2"].next_of(Rotator) is sequence["R4"]
+
+    with pytest.raises(IndexError):
+        sequence["T0"].prev
+    with pytest.raises(IndexError):
+        sequence["R4"].next
+    with pytest.raises(IndexError):
+        sequence["R1"].prev_of(Rotator)
+    with pytest.raises(ValueError):
+        Transport().prev_of(Rotator)
+
+
+def test_indexes_invalidated():
+    sequence = _sequence()
+    t3 = sequence["T3"]
+    assert t3.prev_of(Rotator) is sequence["R1"]
+
+    sequence.prepend(Rotator(label="R"))
+    sequence._subunits.insert(3, Rotator(label="R2"))
+    assert t3.prev is sequence["T2"]
+    assert t3.prev_of(Rotator) is sequence["R2"]
+
+    sequence.drop(3)
+    assert t3.prev_of(Rotator) is sequence["R1"]
+    assert sequence[0].label == "R"
+
+    sequence["T2"].label = "renamed"
+    assert sequence["renamed"] is t3.prev
+    with pytest.raises(KeyError):
+        sequence["T2"]
+
+
+def test_in_place_operators():
+    sequence = _sequence()
+    units = sequence._subunits
+    assert units.by_label("R4") is sequence[4]
+
+    added = Rotator(label="R5")
+    units += [added]
+    assert units is sequence._subunits
+    assert added.parent is sequence
+    assert sequence["R5"].prev is sequence["R4"]
+    assert sequence["R4"].next_of(Rotator) is added
+
+    units *= 1
+    assert sequence["R5"] is added
+
+    units *= 0
+    assert added.parent is None
+    with pytest.raises(KeyError):
+        sequence["R5"]
+
+
+def test_slice_assignment():
+    sequence = _sequence()
+    t2 = sequence["T2"]
+    assert sequence["T3"].prev_of(Rotator) is sequence["R1"]
+
+    replacements = [Rotator(label="S1"), Rotator(label="S2")]
+    sequence._subunits[1:3] = replacements
+
+    assert t2.parent is None
+    assert all(r.parent is sequence for r in replacements)
+    assert sequence["T3"].prev_of(Rotator) is replacements[1]
+    assert sequence["S1"].prev is sequence["T0"]
+
+    single = Transport(label="single")
+    sequence._subunits[0] = single
+    assert single.parent is sequence
+    assert sequence["S1"].prev is single
+
+
+def test_flatten():
+    inner = PassSequence([Transport(label="I0"), Rotator(label="I1")], label="inner")
+    sequence = PassSequence([Transport(label="T0"), inner, Transport(label="T2")])
+    with pytest.raises(IndexError):
+        sequence["T2"].prev_of(Rotator)
+
+    sequence.flatten()
+    assert sequence["T2"].prev_of(Rotator) is sequence["I1"]
+    assert sequence["I0"].prev is sequence["T0"]
+
+
+@pytest.mark.parametrize("duplicate", [copy.deepcopy, lambda s: pickle.loads(pickle.dumps(s))])
+def test_copies(duplicate):
+    sequence = _sequence()
+    sequence["T3"].prev_of(Rotator)
+
+    copied = duplicate(sequence)
+    assert copied["T3"].prev_of(Rotator) is copied["R1"]
+    assert copied["R4"].prev is copied["T3"]
@@ -0,0 +1,154 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyroll.core import (
+    HookScope,
+    SolveProfiler,
+    BaseRollPass,
+    Roll,
+    RollPass,
+    Transport,
+    RoundGroove,
+    CircularOvalGroove,
+    PassSequence,
+    ParallelSequence,
+)
+
+
+def _round_pass(label, velocity):
+    return RollPass(
+        label=label,
+        roll=Roll(
+            groove=RoundGroove(r1=1e-3, r2=12.5e-3, depth=11.5e-3),
+            nominal_radius=160e-3,
+        ),
+        gap=2e-3,
+        velocity=velocity,
+    )
+
+
+# noinspection DuplicatedCode
+def _sequence():
+    return PassSequence(
+        [
+            RollPass(
+                label="Oval I",
+                roll=Roll(
+                    groove=CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+                    nominal_radius=160e-3,
+                ),
+                gap=2e-3,
+                velocity=1,
+            ),
+            Transport(label="I => II", duration=1),
+            ParallelSequence(
+                [
+                    PassSequence([_round_pass("Round A", 1.5), Transport(label="A", duration=2)], label="Line A"),
+                    PassSequence([_round_pass("Round B", 1.2), Transport(label="B", duration=3)], label="Line B"),
+                ],
+                label="Split",
+            ),
+        ]
+    )
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_executors(executor, make_in_profile):
+    reference = _sequence()
+    reference["Split"].branch_executor = "serial"
+    reference.solve(make_in_profile())
+
+    sequence = _sequence()
+    sequence["Split"].branch_executor = executor
+    sequence.solve(make_in_profile())
+
+    split = sequence["Split"]
+    assert split["Line A"].parent is split
+    assert split["Line B"]["Round B"].roll_force == pytest.approx(reference["Split"]["Line B"]["Round B"].roll_force)
+    assert split.power == pytest.approx(split["Line A"].power + split["Line B"].power)
+
+
+def test_executor_instance(make_in_profile):
+    sequence = _sequence()
+
+    with ThreadPoolExecutor(2) as executor:
+        sequence["Split"].branch_executor = executor
+        sequence.solve(make_in_profile())
+
+    assert sequence["Split"]["Line B"]["Round B"].has_value("roll_force")
+
+
+def test_main_branch(make_in_profile):
+    sequence = _sequence()
+    split = sequence["Split"]
+    split.branch_executor = "serial"
+    split.main_branch = 1
+    sequence.solve(make_in_profile())
+
+    assert split.duration == split["Line B"].duration
+    assert split.out_profile.t == pytest.approx(split["Line B"].out_profile.t)
+    assert split.out_profile.cross_section.area == pytest.approx(split["Line B"].out_profile.cross_section.area)
+    assert sequence.out_profile.t == pytest.approx(split["Line B"].out_profile.t)
+
+
+def test_branch_error(make_in_profile):
+    sequence = _sequence()
+    sequence["Split"].branch_executor = "thread"
+    sequence["Split"]["Line B"]["Round B"].gap = -1
+
+    with pytest.raises(RuntimeError) as e:
+        sequence.solve(make_in_profile())
+
+    assert "Split" in str(e.value)
+
+
+def test_unknown_executor(make_in_profile):
+    sequence = _sequence()
+    sequence["Split"].branch_executor = "cluster"
+
+    with pytest.raises(RuntimeError) as e:
+        sequence.solve(make_in_profile())
+
+    assert isinstance(e.value.__cause__, ValueError)
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_scope_in_branches(executor, make_in_profile):
+    scope = HookScope()
+
+    @scope(BaseRollPass.roll_force, tryfirst=True)
+    def roll_force(self):
+        return 12345.0
+
+    sequence = _sequence()
+    sequence["Split"].branch_executor = executor
+
+    with scope:
+        sequence.solve(make_in_profile())
+
+    assert sequence["Split"]["Line A"]["Round A"].roll_force == 12345.0
+    assert sequence["Split"]["Line B"]["Round B"].roll_force == 12345.0
+
+
+def test_scope_not_carried_to_processes(make_in_profile):
+    scope = HookScope()
+    sequence = _sequence()
+    sequence["Split"].branch_executor = "process"
+
+    with scope, pytest.raises(RuntimeError) as e:
+        sequence.solve(make_in_profile())
+
+    assert "HookScope" in str(e.value.__cause__)
+
+
+def test_solve_profiler_in_threads(make_in_profile):
+    sequence = _sequence()
+    sequence["Split"].branch_executor = "thread"
+
+    with SolveProfiler() as profiler:
+        sequence.solve(make_in_profile())
+
+    split = next(n for _, n in profiler.roots[0].walk() if n.label == "Split")
+    assert {n.label for n in split.children} == {"Line A", "Line B"}
+    assert len(profiler.roots) == 1
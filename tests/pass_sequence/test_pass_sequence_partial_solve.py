@@ -0,0 +1,100 @@
+import numpy as np
+
+from pyroll.core import (
+    RollPass,
+    Transport,
+    PassSequence,
+)
+
+
+def _iteration_counts(sequence):
+    return [u.convergence_history.total_count for u in sequence]
+
+
+def test_dirty_tracking(make_sequence, make_in_profile):
+    sequence = make_sequence()
+    assert all(u.dirty for u in sequence)
+
+    sequence.solve(make_in_profile())
+    assert not any(u.dirty for u in sequence)
+
+    sequence["Round II"].gap = 2.1e-3
+    assert sequence["Round II"].dirty
+
+    sequence["Oval I"].roll.nominal_radius = 170e-3
+    assert sequence["Oval I"].dirty
+    assert not sequence["I => II"].dirty
+
+
+def test_partial_solve(make_sequence, make_in_profile):
+    sequence = make_sequence(partial_solve=True)
+    sequence.solve(make_in_profile())
+    before = _iteration_counts(sequence)
+
+    sequence["Round II"].gap = 2.1e-3
+    sequence.solve(make_in_profile())
+    solved = [a - b for a, b in zip(_iteration_counts(sequence), before)]
+
+    assert solved[:2] == [0, 0]
+    assert solved[2] > 0
+
+    reference = make_sequence(partial_solve=False)
+    reference["Round II"].gap = 2.1e-3
+    reference.solve(make_in_profile())
+
+    assert np.isclose(sequence["Round II"].roll_force, reference["Round II"].roll_force, rtol=1e-3)
+
+
+def test_partial_solve_changed_input(make_sequence, make_in_profile):
+    sequence = make_sequence(partial_solve=True)
+    sequence.solve(make_in_profile())
+    before = _iteration_counts(sequence)
+
+    in_profile = make_in_profile()
+    in_profile.temperature += 10
+    sequence.solve(in_profile)
+
+    assert all(a > b for a, b in zip(_iteration_counts(sequence), before))
+
+
+def test_partial_solve_changed_hook_functions(make_sequence, make_in_profile):
+    sequence = make_sequence(partial_solve=True)
+    sequence.solve(make_in_profile())
+    before = _iteration_counts(sequence)
+
+    def roll_force(self: RollPass):
+        return 42
+
+    with RollPass.roll_force(roll_force):
+        assert all(u.dirty for u in sequence)
+        sequence.solve(make_in_profile())
+
+    assert all(a > b for a, b in zip(_iteration_counts(sequence), before))
+    assert sequence["Oval I"].roll_force == 42
+
+
+def test_dirty_nested(make_sequence, make_in_profile):
+    sequence = PassSequence([make_sequence(label="inner"), Transport(label="T", duration=1)])
+    sequence.solve(make_in_profile())
+    assert not sequence["inner"].dirty
+
+    sequence["inner"]["I => II"].duration = 2
+    assert sequence["inner"].dirty
+    assert sequence.dirty
+
+    del sequence["inner"]["I => II"].duration
+    assert sequence["inner"]["I => II"].dirty
+
+
+def test_partial_solve_records(make_sequence, make_in_profile):
+    sequence = make_sequence(partial_solve=True)
+    sequence.solve(make_in_profile())
+
+    sequence["Round II"].gap = 2.1e-3
+    records = list(sequence.solve_iter(make_in_profile()))
+    first_iteration = [r for r in records if r.parent_iteration == 1]
+
+    assert [r.label for r in first_iteration] == ["Oval I", "I => II", "Round II"]
+    assert [r.reused for r in first_iteration] == [True, True, False]
+    assert sequence["Oval I"].solution_reused
+    assert not records[-1].reused
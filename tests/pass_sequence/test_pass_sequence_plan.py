@@ -0,0 +1,86 @@
+import pytest
+
+from pyroll.core import (
+    Transport,
+    Rotator,
+    SolvePlan,
+    root_hooks,
+)
+
+
+def test_compile(make_sequence):
+    sequence = make_sequence(oval=dict(disk_element_count=3))
+    plan = sequence.compile()
+
+    assert isinstance(plan, SolvePlan)
+    assert plan.sequence is not sequence
+    assert len(plan.sequence["Oval I"].disk_elements) == 3
+    assert not sequence["Oval I"].disk_elements
+    assert plan.units[0] is plan.sequence
+    assert all(u in plan.units for u in plan.sequence["Oval I"].disk_elements)
+
+
+@pytest.mark.parametrize("diameter", [29e-3, 30e-3, 31e-3])
+def test_solve_equals_fresh(diameter, make_sequence, make_in_profile):
+    plan = make_sequence(oval=dict(disk_element_count=3)).compile()
+    plan.solve(make_in_profile(diameter=32e-3))
+    out_profile = plan.solve(make_in_profile(diameter=diameter))
+
+    reference = make_sequence(oval=dict(disk_element_count=3))
+    reference_out_profile = reference.solve(make_in_profile(diameter=diameter))
+
+    assert plan.solve_count == 2
+    assert out_profile.cross_section.area == pytest.approx(reference_out_profile.cross_section.area)
+    assert plan.sequence["Oval I"].elongation == pytest.approx(reference["Oval I"].elongation)
+    assert plan.sequence["Round II"].roll_force == pytest.approx(reference["Round II"].roll_force)
+
+
+@pytest.fixture
+def rotating_pre_processor():
+    def factory(unit):
+        return Rotator(label="pre", rotation=0)
+
+    yield factory
+
+    if factory in Transport.pre_processors:
+        Transport.pre_processors.remove(factory)
+
+
+def test_processors_frozen(rotating_pre_processor, make_sequence):
+    plan = make_sequence(oval=dict(disk_element_count=3)).compile()
+    Transport.pre_processors.append(rotating_pre_processor)
+
+    transport = plan.sequence["I => II"]
+    assert rotating_pre_processor not in list(transport._yield_pre_processors())
+
+    plan.recompile()
+    assert rotating_pre_processor in list(transport._yield_pre_processors())
+
+
+def test_outdated_on_registry_change(make_sequence, make_in_profile):
+    plan = make_sequence(oval=dict(disk_element_count=3)).compile()
+    assert not plan.outdated
+
+    @Transport.environment_temperature
+    def environment_temperature(self):
+        return None
+
+    try:
+        assert plan.outdated
+        plan.solve(make_in_profile())
+        assert not plan.outdated
+    finally:
+        Transport.environment_temperature.remove_function(environment_temperature)
+
+
+def test_compiled_dispatch_reused(make_sequence, make_in_profile):
+    plan = make_sequence(oval=dict(disk_element_count=3)).compile()
+    classes = {type(u) for u in plan.units} | {u.OutProfile for u in plan.units}
+    tables = {(c, name): getattr(c, name)._compiled_dispatch_table() for c in classes for name in c.__hooks__}
+    root_hook_lists = {c: root_hooks.for_class(c) for c in classes}
+
+    plan.solve(make_in_profile())
+
+    assert not plan.outdated
+    assert all(getattr(c, name)._compiled_dispatch_table() is t for (c, name), t in tables.items())
+    assert all(root_hooks.for_class(c) is h for c, h in root_hook_lists.items())
@@ -0,0 +1,68 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from pyroll.core import (
+    HookScope,
+    BaseRollPass,
+)
+from pyroll.core.sequence.batch import _worker_template
+
+
+def test_solve_batch(make_sequence, make_in_profile):
+    in_profiles = [
+        make_in_profile(temperature=1100 + 273.15),
+        make_in_profile(temperature=1150 + 273.15),
+        make_in_profile(temperature=1200 + 273.15),
+    ]
+    in_profiles[1].cross_section = None
+
+    sequence = make_sequence()
+
+    with ProcessPoolExecutor(2) as executor:
+        results = sequence.solve_batch(in_profiles, executor=executor, chunk_size=1, return_sequences=True)
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].out_profile is None
+    assert isinstance(results[1].error, RuntimeError)
+    assert results[1].error_traceback
+
+    assert sequence.in_profile is None
+
+    reference = make_sequence()
+    reference_out_profile = reference.solve(in_profiles[2])
+
+    assert np.isclose(results[2].out_profile.cross_section.area, reference_out_profile.cross_section.area)
+    assert np.isclose(results[2].sequence["Round II"].roll_force, reference["Round II"].roll_force)
+
+
+def test_solve_batch_own_pool(make_sequence, make_in_profile):
+    results = make_sequence().solve_batch([make_in_profile(temperature=1200 + 273.15)] * 2, max_workers=2)
+    assert all(r.ok for r in results)
+
+
+def test_solve_batch_threads_in_scope(make_sequence, make_in_profile):
+    scope = HookScope()
+
+    @scope(BaseRollPass.roll_force, tryfirst=True)
+    def roll_force(self):
+        return 12345.0
+
+    with scope, ThreadPoolExecutor(2) as executor:
+        results = make_sequence().solve_batch(
+            [make_in_profile(temperature=1200 + 273.15)] * 2, executor=executor, chunk_size=1, return_sequences=True
+        )
+
+    assert all(r.ok for r in results)
+    assert all(r.sequence["Round II"].roll_force == 12345.0 for r in results)
+
+
+def test_worker_templates_per_thread():
+    assert _worker_template("a", pickle.dumps(1)) == 1
+
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(_worker_template, "b", pickle.dumps(2)).result() == 2
+
+    assert _worker_template("a", None) == 1
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from pyroll.core import (
+    SolutionStatus,
+    MillSolver,
+    MillUnknown,
+)
+
+
+@pytest.mark.parametrize("speed", [dict(final_speed=1.5), dict(initial_speed=1)])
+def test_velocities(speed, make_sequence, make_in_profile):
+    sequence = make_sequence(velocity_driven=True)
+    status = sequence.solve_mill(make_in_profile(elastic_modulus=53e6), tolerance=1e-6, **speed)
+
+    assert status.converged
+    assert status.reason == SolutionStatus.CONVERGED
+
+    first, second = sequence.roll_passes
+    assert np.isclose(
+        first.velocity * first.out_profile.cross_section.area,
+        second.velocity * second.out_profile.cross_section.area,
+        rtol=1e-5,
+    )
+
+    if "final_speed" in speed:
+        assert np.isclose(second.velocity, 1.5)
+    else:
+        in_profile = make_in_profile(elastic_modulus=53e6)
+        assert np.isclose(
+            first.velocity * first.out_profile.cross_section.area, in_profile.cross_section.area, rtol=1e-5
+        )
+
+
+def test_tensions(make_sequence, make_in_profile):
+    sequence = make_sequence(velocity_driven=True)
+    status = sequence.solve_mill(make_in_profile(elastic_modulus=53e6), final_speed=1.5, velocity_ratios=[1.25])
+
+    reference = make_sequence(velocity_driven=True)
+    reference.solve_interstand_tensions_with_given_velocity_ratios(
+        make_in_profile(elastic_modulus=53e6), np.array([1.25]), 1.5
+    )
+
+    assert status.converged
+    for rp, ref in zip(sequence.roll_passes, reference.roll_passes):
+        assert np.isclose(rp.velocity, ref.velocity)
+        assert np.isclose(rp.front_tension, ref.front_tension, atol=1)
+        assert np.isclose(rp.back_tension, ref.back_tension, atol=1)
+
+
+def test_not_converging(make_sequence, make_in_profile):
+    sequence = make_sequence(velocity_driven=True)
+    for rp in sequence.roll_passes:
+        rp.velocity = 1
+    roll_pass = sequence.roll_passes[0]
+
+    solver = MillSolver(
+        sequence,
+        make_in_profile(elastic_modulus=53e6),
+        [MillUnknown(roll_pass, "velocity")],
+        lambda: np.array([roll_pass.velocity**2 + 1]),
+        max_iterations=5,
+    )
+    status = solver.solve()
+
+    assert not status
+    assert status.reason in [SolutionStatus.MAX_ITERATIONS, SolutionStatus.STAGNATED]
+    assert solver.solve_count > 1
+    assert not sequence.has_set("partial_solve")
+
+
+def test_speed_arguments(make_sequence, make_in_profile):
+    with pytest.raises(ValueError):
+        make_sequence(velocity_driven=True).solve_mill(make_in_profile(elastic_modulus=53e6))
+
+    with pytest.raises(ValueError):
+        make_sequence(velocity_driven=True).solve_mill(
+            make_in_profile(elastic_modulus=53e6), final_speed=1, initial_speed=1
+        )
@@ -0,0 +1,50 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+
+def test_sweep_full_factorial(make_sequence, make_in_profile):
+    sequence = make_sequence()
+    sweep = sequence.sweep(make_in_profile(), collect=["Round II.roll_force", "Round II.out_profile.filling_ratio"])
+    sweep.add_axis("Round II.gap", [1.8e-3, 2.2e-3])
+    sweep.add_axis("Oval I.roll.nominal_radius", [155e-3, 160e-3, 165e-3])
+
+    with ProcessPoolExecutor(2) as executor:
+        result = sweep.run(executor=executor)
+
+    assert len(result) == 6
+    assert np.all(result.ok)
+    assert set(result.columns) == {
+        "Round II.gap",
+        "Oval I.roll.nominal_radius",
+        "Round II.roll_force",
+        "Round II.out_profile.filling_ratio",
+    }
+    assert result.values["Round II.roll_force"].dtype == float
+    assert sequence.in_profile is None
+
+    reference = make_sequence()
+    reference["Round II"].gap = result.parameters["Round II.gap"][4]
+    reference["Oval I"].roll.nominal_radius = result.parameters["Oval I.roll.nominal_radius"][4]
+    reference.solve(make_in_profile())
+
+    assert np.isclose(result.values["Round II.roll_force"][4], reference["Round II"].roll_force, rtol=1e-3)
+
+
+def test_sweep_latin_hypercube(make_sequence, make_in_profile):
+    sweep = make_sequence().sweep(make_in_profile(), collect=["power"])
+    sweep.add_axis("in_profile.temperature", bounds=(1100 + 273.15, 1200 + 273.15))
+    sweep.add_axis("Oval I.gap", bounds=(1.5e-3, 2.5e-3))
+
+    cases = sweep.latin_hypercube(4, seed=42)
+    assert cases.shape == (4, 2)
+    assert np.all((cases[:, 1] >= 1.5e-3) & (cases[:, 1] <= 2.5e-3))
+
+    with pytest.raises(ValueError):
+        sweep.full_factorial()
+
+    result = sweep.run(cases, max_workers=2)
+    assert np.all(result.ok)
+    assert np.all(result.parameters["Oval I.gap"] == cases[:, 1])
+    assert np.all(np.isfinite(result.values["power"]))
@@ -0,0 +1,22 @@
+import pytest
+
+from pyroll.core import (
+    Profile,
+)
+
+
+@pytest.mark.parametrize("method", ["forward", "backward"])
+def test_velocities_rolled_back_on_error(method, make_sequence):
+    sequence = make_sequence(oval=dict(velocity=1), velocity_driven=True)
+    in_profile = Profile.round(diameter=30e-3, temperature=1200 + 273.15)  # no material data
+
+    with pytest.raises(Exception):
+        if method == "forward":
+            sequence.solve_velocities_forward(in_profile, initial_speed=1)
+        else:
+            sequence.solve_velocities_backward(
+                in_profile, final_speed=1.5, final_cross_section_area=sequence[-1].usable_cross_section.area
+            )
+
+    assert sequence["Oval I"].velocity == 1
+    assert not sequence["Round II"].has_set("velocity")
@@ -1,7 +1,10 @@
 import copy
+from typing import Any
+
 import numpy as np
 
 from pyroll.core import RollPass, Roll, CircularOvalGroove, Profile, PassSequence, Transport, RoundGroove, HookHost
+from pyroll.core.hooks import Hook
 
 in_profile = Profile.round(
     diameter=30e-3,
@@ -63,6 +66,24 @@ def test_deepcopy():
                 assert id(sub_unit) != id(copied_subunit)
 
 
+def test_deepcopy_negative_results():
+    class Host(HookHost):
+        hook1 = Hook[Any]()
+        hook2 = Hook[Any]()
+
+    @Host.hook2
+    def f2(self: Host):
+        if self.has_set("hook1"):
+            return self.hook1 + 1
+
+    host = Host()
+    assert not host.has_value("hook2")
+
+    copied_host = copy.deepcopy(host)
+    copied_host.hook1 = 1
+    assert copied_host.hook2 == 2
+
+
 def test_solve_copied():
     local_in_profile = Profile.round(
         diameter=30e-3,
@@ -106,3 +127,22 @@ def test_solve_copied():
 
     assert local_sequence[0] is not copied_sequence[0]
     assert not np.isclose(local_sequence[0].roll.roll_torque, copied_sequence[0].roll.roll_torque)
+
+
+def test_pickle():
+    import pickle
+
+    solved_sequence = copy.deepcopy(sequence)
+    solved_sequence.solve(in_profile)
+    unpickled_sequence = pickle.loads(pickle.dumps(solved_sequence))
+
+    for unit, unpickled_unit in zip(solved_sequence, unpickled_sequence):
+        assert unpickled_unit.parent is unpickled_sequence
+        assert unpickled_unit.in_profile.unit is unpickled_unit
+        assert unpickled_unit.out_profile.unit is unpickled_unit
+
+    assert unpickled_sequence[0].roll.roll_pass is unpickled_sequence[0]
+    assert np.isclose(unpickled_sequence[0].roll_force, solved_sequence[0].roll_force)
+
+    unpickled_sequence.solve(in_profile)
+    assert np.isclose(unpickled_sequence[-1].roll_force, solved_sequence[-1].roll_force)
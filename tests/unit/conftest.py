@@ -0,0 +1,68 @@
+from typing import Optional
+
+import pytest
+
+import pyroll.core as pr
+
+
+@pytest.fixture
+def make_in_profile():
+    """Factory of the round incoming profile used by the unit tests, keyword arguments override values."""
+
+    def factory(**kwargs):
+        return pr.Profile.round(
+            **{
+                "diameter": 30e-3,
+                "temperature": 1200 + 273.15,
+                "strain": 0,
+                "material": ["C45", "steel"],
+                "flow_stress": 100e6,
+                "length": 1,
+                **kwargs,
+            }
+        )
+
+    return factory
+
+
+@pytest.fixture
+def make_sequence():
+    """
+    Factory of the sequence "Oval I", "I => II", "Round II" used by the unit tests.
+
+    ``units`` are additional keyword arguments of all units, ``oval`` those of the first roll pass only,
+    further keyword arguments are passed to the sequence.
+    """
+
+    def factory(oval: Optional[dict] = None, units: Optional[dict] = None, **kwargs):
+        units = units or {}
+
+        return pr.PassSequence(
+            [
+                pr.RollPass(
+                    label="Oval I",
+                    roll=pr.Roll(
+                        groove=pr.CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+                        nominal_radius=160e-3,
+                        rotational_frequency=1,
+                    ),
+                    gap=2e-3,
+                    **units,
+                    **(oval or {}),
+                ),
+                pr.Transport(label="I => II", duration=1, **units),
+                pr.RollPass(
+                    label="Round II",
+                    roll=pr.Roll(
+                        groove=pr.RoundGroove(r1=1e-3, r2=12.5e-3, depth=11.5e-3),
+                        nominal_radius=160e-3,
+                        rotational_frequency=1,
+                    ),
+                    gap=2e-3,
+                    **units,
+                ),
+            ],
+            **kwargs,
+        )
+
+    return factory
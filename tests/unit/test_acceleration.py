@@ -0,0 +1,175 @@
+import numpy as np
+import pytest
+
+import pyroll.core as pr
+from pyroll.core.unit.acceleration import create_accelerator
+
+
+def _iterate(accelerator, x, count):
+    def g(v):
+        return 0.9 * v + np.array([1.0, 2.0])
+
+    for i in range(count):
+        gx = g(x)
+        if np.allclose(gx, x, rtol=1e-8, atol=0):
+            return i
+        x = accelerator(x, gx) if accelerator is not None else gx
+    return count
+
+
+@pytest.mark.parametrize("accelerator", [pr.AitkenAcceleration(), pr.AndersonAcceleration()])
+def test_accelerators_converge_faster(accelerator):
+    plain = _iterate(None, np.array([1.0, 1.0]), 1000)
+    accelerated = _iterate(create_accelerator(accelerator), np.array([1.0, 1.0]), 1000)
+
+    assert accelerated < plain / 10
+
+
+def test_under_relaxation():
+    accelerator = pr.UnderRelaxation(0.25)
+    assert np.allclose(accelerator(np.array([0.0, 4.0]), np.array([4.0, 0.0])), [1.0, 3.0])
+
+    with pytest.raises(ValueError):
+        pr.UnderRelaxation(0)
+
+
+def test_create_accelerator():
+    assert create_accelerator("none") is None
+    assert isinstance(create_accelerator("Anderson"), pr.AndersonAcceleration)
+
+    template = pr.AndersonAcceleration(memory=2)
+    created = create_accelerator(template)
+    assert created is not template
+    assert created.memory == 2
+
+    with pytest.raises(ValueError):
+        create_accelerator("unknown")
+
+
+def _spreading_width(self: pr.RollPass.OutProfile, cycle):
+    if cycle:
+        return None
+
+    return self.roll_pass.in_profile.width * self.roll_pass.draught**-0.5
+
+
+@pytest.fixture
+def spreading():
+    """Simple spreading model like in ``test_solve_round_flat_spreading``, which needs some iterations to converge."""
+    with pr.RollPass.OutProfile.width(_spreading_width):
+        pr.root_hooks.add(pr.RollPass.OutProfile.width)
+        pr.root_hooks.add(pr.Rotator.OutProfile.width)
+        try:
+            yield
+        finally:
+            pr.root_hooks.remove_last(pr.RollPass.OutProfile.width)
+            pr.root_hooks.remove_last(pr.Rotator.OutProfile.width)
+
+
+def _in_profile():
+    return pr.Profile.round(
+        diameter=19.5e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C45", "steel"],
+        flow_stress=100e6,
+        density=7.5e3,
+        specific_heat_capcity=690,
+    )
+
+
+def _roll_pass(**kwargs):
+    return pr.RollPass(
+        label="Flat",
+        roll=pr.Roll(
+            groove=pr.FlatGroove(usable_width=40e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1,
+            neutral_point=-20e-3,
+        ),
+        gap=10e-3,
+        disk_element_count=15,
+        **kwargs,
+    )
+
+
+def _solve(acceleration):
+    rp = _roll_pass(iteration_acceleration=acceleration)
+    rp.solve(_in_profile())
+    return rp
+
+
+@pytest.mark.parametrize("acceleration", ["relaxation", "aitken", "anderson"])
+def test_solve_with_acceleration(spreading, acceleration):
+    reference = _solve("none")
+    accelerated = _solve(acceleration)
+
+    assert accelerated.solution_status.converged
+    assert accelerated.solution_status.iterations < reference.solution_status.iterations
+    assert np.isclose(accelerated.roll_force, reference.roll_force, rtol=1e-2)
+    assert np.isclose(accelerated.out_profile.width, reference.out_profile.width, rtol=1e-2)
+
+
+def test_extrapolation_bounded():
+    accelerator = pr.AitkenAcceleration(initial_factor=10)
+    result = accelerator(np.array([1.0, -1.0, 1.0]), np.array([0.5, -2.0, -1.0]))
+
+    assert np.allclose(result, [0.25, -4.0, -19.0])  # same signs kept and bounded, mixed signs not
+
+
+def test_in_profile_not_accelerated(spreading):
+    rp = _solve("anderson")
+    labels = rp.root_hook_result_labels
+    mask = rp._acceleration_mask(len(labels))
+
+    assert not any(m for (host, _), m in zip(labels, mask) if host == "in_profile")
+    assert all(m for (host, _), m in zip(labels, mask) if host in ("unit", "out_profile", "roll"))
+
+
+@pytest.mark.parametrize("acceleration", ["relaxation", "aitken", "anderson"])
+def test_sequence_with_acceleration(spreading, monkeypatch, acceleration):
+    with monkeypatch.context() as m:
+        m.setattr(pr.Config, "DEFAULT_ITERATION_ACCELERATION", "none")
+        reference = pr.PassSequence([_roll_pass()])
+        reference.solve(_in_profile())
+
+    # the sequence, the roll pass and its disk elements are all accelerated
+    monkeypatch.setattr(pr.Config, "DEFAULT_ITERATION_ACCELERATION", acceleration)
+    accelerated = pr.PassSequence([_roll_pass()])
+    accelerated.solve(_in_profile())
+
+    assert accelerated.solution_status.converged
+    assert accelerated.convergence_history.total_count <= reference.convergence_history.total_count
+    assert accelerated[0].solution_status.iterations < reference[0].solution_status.iterations
+    assert np.isclose(accelerated[0].roll_force, reference[0].roll_force, rtol=1e-2)
+    assert np.isclose(accelerated[0].out_profile.width, reference[0].out_profile.width, rtol=1e-2)
+
+
+class RootUnit(pr.Unit):
+    x = pr.Hook[float]()
+
+
+@RootUnit.x
+def root_x(self: RootUnit):
+    if not self.has_set("x"):
+        return 4.0
+    if self.x < 0:
+        raise ValueError("negative")
+    return np.sqrt(self.x)
+
+
+class SignFlipping(pr.IterationAccelerator):
+    def __call__(self, inputs, outputs):
+        return -outputs
+
+
+def test_fallback_on_failed_iteration():
+    pr.root_hooks.add(RootUnit.x)
+    try:
+        unit = RootUnit(iteration_acceleration=SignFlipping(), duration=0)
+        unit.solve(pr.Profile.round(radius=1))
+    finally:
+        pr.root_hooks.remove(RootUnit.x)
+
+    assert unit.solution_status.converged
+    assert np.isclose(unit.x, 1, rtol=1e-2)
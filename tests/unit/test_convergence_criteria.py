@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+import pyroll.core as pr
+
+
+class DecayingUnit(pr.Unit):
+    x = pr.Hook[float]()
+    """Approaches zero, so relative changes never get small."""
+
+    y = pr.Hook[float]()
+    """Oscillates forever."""
+
+
+@DecayingUnit.x
+def halved_x(self: DecayingUnit):
+    return self.x / 2 if self.has_set("x") else 1.0
+
+
+@DecayingUnit.y
+def negated_y(self: DecayingUnit):
+    return -self.y if self.has_set("y") else 1.0
+
+
+@pytest.fixture(autouse=True)
+def _root_hooks():
+    pr.root_hooks.add(DecayingUnit.x)
+    pr.root_hooks.add(DecayingUnit.y)
+    yield
+    pr.root_hooks.remove(DecayingUnit.x)
+    pr.root_hooks.remove(DecayingUnit.y)
+    for h in [DecayingUnit.x, DecayingUnit.y]:
+        del h.relative_tolerance
+        del h.absolute_tolerance
+        del h.check_convergence
+
+
+def _solve(max_iteration_count=60):
+    unit = DecayingUnit(
+        max_iteration_count=max_iteration_count, divergence_policy="ignore", duration=0, iteration_acceleration="none"
+    )
+    unit.solve(pr.Profile.round(radius=1))
+    return unit
+
+
+def test_defaults_do_not_converge():
+    unit = _solve()
+    assert unit.solution_status.reason == pr.SolutionStatus.MAX_ITERATIONS
+
+
+def test_opt_out_and_absolute_tolerance():
+    DecayingUnit.y.check_convergence = False
+    DecayingUnit.x.absolute_tolerance = 1e-6
+
+    unit = _solve()
+
+    assert unit.solution_status.converged
+    assert abs(unit.x) < 1e-5
+    assert unit.solution_status.residuum < 1  # relative change of y is excluded
+
+
+def test_relative_tolerance():
+    DecayingUnit.y.check_convergence = False
+    DecayingUnit.x.relative_tolerance = 0.6
+
+    unit = _solve()
+
+    assert unit.solution_status.converged
+    assert unit.iteration == 2
+
+
+def test_residual_labels():
+    unit = _solve(max_iteration_count=5)
+
+    labels = unit.root_hook_result_labels
+    assert len(labels) == len(unit.get_root_hook_results())
+    assert ("unit", "x") in labels
+    assert ("out_profile", "t") in labels
+
+    residuals = unit.residuals
+    assert set(residuals) == set(labels)
+    assert np.isclose(residuals["unit", "x"], 0.5)
+    assert np.isclose(residuals["unit", "y"], 2)
+
+
+@pytest.mark.parametrize("base_hook", [pr.Profile.t, pr.Unit.OutProfile.t])
+def test_settings_inherited_by_subclass_hooks(base_hook):
+    roll_pass = pr.RollPass(
+        label="Oval I",
+        roll=pr.Roll(
+            groove=pr.CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1,
+        ),
+        gap=2e-3,
+    )
+    in_profile = pr.Profile.round(
+        diameter=30e-3, temperature=1200 + 273.15, strain=0, material=["C45", "steel"], flow_stress=100e6, length=1
+    )
+
+    base_hook.check_convergence = False
+    try:
+        assert not pr.RollPass.OutProfile.t.check_convergence
+        assert not pr.Transport.OutProfile.t.check_convergence
+
+        roll_pass.solve(in_profile)
+        relative, absolute, checked = roll_pass._convergence_criteria(len(roll_pass.get_root_hook_results()))
+
+        labels = roll_pass.root_hook_result_labels
+        assert not checked[labels.index(("out_profile", "t"))]
+        assert checked[labels.index(("unit", "roll_force"))]
+    finally:
+        del base_hook.check_convergence
+
+    assert pr.RollPass.OutProfile.t.check_convergence
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+import pyroll.core as pr
+from pyroll.core import ConvergenceHistory
+
+
+def test_ring_buffer():
+    history = ConvergenceHistory("unit", size=3)
+
+    for i in range(5):
+        history.append(i, 10.0**-i)
+
+    assert len(history) == 3
+    assert history.total_count == 5
+    assert history.last_residuum == 1e-4
+    assert np.all(history.iterations == [2, 3, 4])
+    assert np.allclose(history.residua, [1e-2, 1e-3, 1e-4])
+    assert history[-1] == {"iteration": 4, "residuum": 1e-4, "label": "unit"}
+
+    history.size = 2
+    assert np.all(history.iterations == [3, 4])
+    history.append(5, 0)
+    assert np.all(history.iterations == [4, 5])
+
+    history.clear()
+    assert len(history) == 0
+    assert history.total_count == 0
+
+    with pytest.raises(ValueError):
+        history.size = -1
+
+
+def test_disabled_by_default():
+    history = ConvergenceHistory("unit")
+    history.append(1, 0.5)
+
+    assert len(history) == 0
+    assert history.total_count == 1
+    assert history.last_residuum == 0.5
+
+
+def test_aggregated_history(monkeypatch):
+    monkeypatch.setattr(pr.Config, "CONVERGENCE_HISTORY_SIZE", 10)
+
+    sequence = pr.PassSequence(
+        [
+            pr.RollPass(
+                label="Oval I",
+                roll=pr.Roll(
+                    groove=pr.CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1,
+                ),
+                gap=2e-3,
+            ),
+            pr.Transport(label="I => II", duration=1),
+        ]
+    )
+    sequence.solve(
+        pr.Profile.round(
+            diameter=30e-3,
+            temperature=1200 + 273.15,
+            strain=0,
+            material=["C45", "steel"],
+            flow_stress=100e6,
+            length=1,
+        )
+    )
+
+    aggregated = sequence.aggregated_convergence_history()
+    assert set(aggregated) == {"label", "depth", "iteration", "residuum"}
+    assert len(aggregated["residuum"]) == sum(len(u.convergence_history) for u in [sequence, *sequence])
+    assert set(aggregated["label"][aggregated["depth"] == 1]) == {"Oval I", "I => II"}
+
+    top_only = sequence.aggregated_convergence_history(max_depth=0)
+    assert len(top_only["residuum"]) == len(sequence.convergence_history)
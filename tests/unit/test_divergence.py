@@ -0,0 +1,76 @@
+import pytest
+
+import pyroll.core as pr
+
+
+class GrowingUnit(pr.Unit):
+    x = pr.Hook[float]()
+
+
+@GrowingUnit.x
+def squared_x(self: GrowingUnit):
+    return self.x**2 if self.has_set("x") else 2.0
+
+
+class OscillatingUnit(pr.Unit):
+    y = pr.Hook[float]()
+
+
+@OscillatingUnit.y
+def negated_y(self: OscillatingUnit):
+    return -self.y if self.has_set("y") else 1.0
+
+
+@pytest.fixture(autouse=True)
+def _root_hooks():
+    pr.root_hooks.add(GrowingUnit.x)
+    pr.root_hooks.add(OscillatingUnit.y)
+    yield
+    pr.root_hooks.remove(GrowingUnit.x)
+    pr.root_hooks.remove(OscillatingUnit.y)
+
+
+def _in_profile():
+    return pr.Profile.round(radius=1)
+
+
+def test_ignore_by_default():
+    unit = GrowingUnit(max_iteration_count=8, divergence_policy="ignore", duration=0, iteration_acceleration="none")
+    unit.solve(_in_profile())
+
+    assert not unit.solution_status
+    assert unit.solution_status.reason == pr.SolutionStatus.MAX_ITERATIONS
+    assert unit.iteration == 7
+
+
+def test_abort():
+    unit = GrowingUnit(divergence_policy="abort", duration=0, iteration_acceleration="none")
+
+    with pytest.raises(pr.SolutionDivergedError) as e:
+        unit.solve(_in_profile())
+
+    assert e.value.status.reason == pr.SolutionStatus.DIVERGED
+    assert unit.iteration < 10
+
+
+def test_mark_stagnation():
+    unit = OscillatingUnit(divergence_policy="mark", duration=0, iteration_acceleration="none")
+    unit.solve(_in_profile())
+
+    assert unit.solution_status.reason == pr.SolutionStatus.STAGNATED
+    assert unit.iteration < unit.max_iteration_count - 1
+
+
+def test_damp():
+    unit = OscillatingUnit(divergence_policy="damp", duration=0, iteration_acceleration="none")
+    unit.solve(_in_profile())
+
+    assert unit.solution_status.converged
+
+
+def test_converged():
+    unit = pr.Unit(duration=0)
+    unit.solve(_in_profile())
+
+    assert unit.solution_status.converged
+    assert unit.solution_status.iterations == unit.iteration
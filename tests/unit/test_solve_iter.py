@@ -0,0 +1,59 @@
+import numpy as np
+
+import pyroll.core as pr
+
+
+def test_solve_iter(make_sequence, make_in_profile):
+    sequence = make_sequence(oval=dict(disk_element_count=2))
+    records = list(sequence.solve_iter(make_in_profile(), hooks=["roll_force", "out_profile.width"]))
+
+    assert [r.label for r in records[:3]] == ["Oval I", "I => II", "Round II"]
+    assert all(r.depth == 1 for r in records[:-1])
+    assert records[0].parent_iteration == 1
+
+    top = records[-1]
+    assert top.depth == 0
+    assert top.parent_iteration is None
+    assert top.iterations == sequence.iteration
+
+    last_round = [r for r in records if r.label == "Round II"][-1]
+    assert np.isclose(last_round.values["roll_force"], sequence["Round II"].roll_force)
+    assert "roll_force" not in records[1].values
+    assert last_round.duration > 0
+    assert last_round.as_dict()["path"] == "Round II"
+
+    reference = make_sequence(oval=dict(disk_element_count=2))
+    reference.solve(make_in_profile())
+    assert np.isclose(sequence.solved_out_profile.cross_section.area, reference.out_profile.cross_section.area)
+
+
+def test_solve_iter_depth(make_sequence, make_in_profile):
+    records = list(make_sequence(oval=dict(disk_element_count=2)).solve_iter(make_in_profile(), max_depth=None))
+    disk_records = [r for r in records if r.depth == 2]
+
+    assert disk_records
+    assert all(r.path[0] == "Oval I" for r in disk_records)
+
+
+def test_solve_iter_iteration(make_sequence, make_in_profile):
+    sequence = make_sequence(oval=dict(disk_element_count=2))
+    records = list(sequence.solve_iter(make_in_profile()))
+
+    assert records[0].iteration == 1
+    assert records[-1].iteration == sequence.iteration
+    assert [r.iteration for r in records] == sorted(r.iteration for r in records)
+    assert records[-1].as_dict()["iteration"] == sequence.iteration
+
+
+def test_solve_iter_context(monkeypatch, make_sequence, make_in_profile):
+    from pyroll.core import hooks
+
+    monkeypatch.setattr(pr.Config, "HOOK_DEPENDENCY_TRACKING", True)
+    sequence = make_sequence(oval=dict(disk_element_count=2))
+
+    for record in sequence.solve_iter(make_in_profile()):
+        assert hooks._evaluation_stack.get() is None
+        if record.label == "Round II":
+            break
+
+    assert sequence["Round II"].has_value("roll_force")
@@ -0,0 +1,61 @@
+import json
+
+import pyroll.core as pr
+
+
+def test_inactive_by_default(make_sequence, make_in_profile):
+    sequence = make_sequence(oval=dict(disk_element_count=3))
+    profiler = pr.SolveProfiler()
+    sequence.solve(make_in_profile())
+
+    assert not profiler.roots
+
+
+def test_tree(make_sequence, make_in_profile):
+    sequence = make_sequence(oval=dict(disk_element_count=3))
+
+    with pr.SolveProfiler() as profiler:
+        sequence.solve(make_in_profile())
+
+    assert len(profiler.roots) == 1
+    root = profiler.roots[0]
+    assert root.type == "PassSequence"
+    assert root.iterations == sequence.iteration
+
+    labels = {n.label for _, n in root.walk()}
+    assert {"Oval I", "I => II"} <= labels
+
+    roll_pass = next(n for n in root.children if n.label == "Oval I")
+    disks = [c for c in roll_pass.children if c.type == "TwoRollPass.DiskElement"]
+    assert disks and {d.index for d in disks} == {0, 1, 2}
+    assert roll_pass.phase_times["subunits"] >= sum(d.total_time for d in disks)
+
+    for _, n in root.walk():
+        assert n.total_time >= n.phase_times["root_hook_results"] > 0
+        assert n.self_time >= 0
+
+
+def test_exports(make_sequence, make_in_profile):
+    with pr.SolveProfiler() as profiler:
+        make_sequence(oval=dict(disk_element_count=3)).solve(make_in_profile())
+
+    data = json.loads(profiler.to_json())
+    assert data["roots"][0]["label"] == "PassSequence"
+    assert set(data["roots"][0]["phases"]) == {
+        "init",
+        "pre_processors",
+        "subunits",
+        "reevaluate_cache",
+        "root_hook_results",
+        "post_processors",
+    }
+
+    lines = profiler.to_flamegraph().splitlines()
+    assert all(line.startswith("PassSequence;") for line in lines)
+    disk = next(n for _, n in profiler.roots[0].walk() if n.type == "TwoRollPass.DiskElement")
+    assert any(line.startswith(f"PassSequence;Oval I;{disk.label};") for line in lines)
+
+    total = sum(int(line.rsplit(" ", 1)[1]) for line in lines)
+    assert abs(total - profiler.roots[0].total_time * 1e6) <= len(lines)
+
+    assert "Oval I" in profiler.to_table()
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+
+def _iteration_count(sequence):
+    return sum(u.convergence_history.total_count for u in sequence)
+
+
+def test_warm_start_from_last_solution(make_sequence, make_in_profile):
+    cold = make_sequence(units=dict(warm_start=False), warm_start=False)
+    cold.solve(make_in_profile())
+    count = _iteration_count(cold)
+    cold.solve(make_in_profile(temperature=1205 + 273.15))
+    cold_count = _iteration_count(cold) - count
+
+    warm = make_sequence(units=dict(warm_start=True), warm_start=True)
+    warm.solve(make_in_profile())
+    count = _iteration_count(warm)
+    warm.solve(make_in_profile(temperature=1205 + 273.15))
+    warm_count = _iteration_count(warm) - count
+
+    assert warm_count < cold_count
+    assert np.isclose(warm["Round II"].roll_force, cold["Round II"].roll_force, rtol=1e-3)
+
+
+def test_warm_start_from_snapshot(make_sequence, make_in_profile):
+    reference = make_sequence()
+    reference.solve(make_in_profile())
+    snapshot = reference.snapshot()
+
+    assert len(snapshot.subunits) == 3
+
+    sequence = make_sequence(units=dict(warm_start=False), warm_start=False)
+    sequence.warm_start_from(snapshot)
+    sequence.solve(make_in_profile())
+
+    assert all(u.convergence_history.total_count == 1 for u in sequence)
+    assert np.isclose(sequence["Round II"].roll_force, reference["Round II"].roll_force, rtol=1e-3)
+
+    with pytest.raises(ValueError):
+        sequence["Oval I"].warm_start_from(snapshot)